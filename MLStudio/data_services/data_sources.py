@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : data_sources.py                                                   #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 2:12:40 pm                       #
+# Last Modified : Sunday, October 18th 2026, 2:12:40 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Data sources for out-of-core training.
+
+A DataSource presents a design matrix that need not fit in memory as a
+sequence of shards, each of which does. Shards are read lazily, one at a
+time, and the features are returned without a bias term, which the
+estimator adds to each batch as it is trained. The targets, which are
+small by comparison, are read in full.
+
+    Source          Shards
+    -------------   -----------------------------------------------------
+    ArraySource     Contiguous blocks of rows of an array or np.memmap.
+    NpySource       One or more .npy files, opened as memory maps.
+    CSVSource       One or more CSV files, each read in full when needed.
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator
+# --------------------------------------------------------------------------- #
+class DataSource(ABC, BaseEstimator):
+    """Base class for data that are read one shard at a time."""
+
+    @property
+    @abstractmethod
+    def n_shards(self):
+        """The number of shards."""
+        pass
+
+    @property
+    @abstractmethod
+    def n_features(self):
+        """The number of features, excluding the bias term."""
+        pass
+
+    @abstractmethod
+    def read(self, shard):
+        """Reads the features of a shard.
+
+        Parameters
+        ----------
+        shard : int
+            The index of the shard.
+
+        Returns
+        -------
+        X : array-like of shape (n_samples_shard, n_features)
+            The features of the shard, which may be a memory mapped view.
+        """
+        pass
+
+    @abstractmethod
+    def read_target(self, shard):
+        """Reads the target of a shard.
+
+        Parameters
+        ----------
+        shard : int
+            The index of the shard.
+
+        Returns
+        -------
+        y : array-like of shape (n_samples_shard,)
+        """
+        pass
+
+    @property
+    def shard_sizes(self):
+        """The number of rows in each shard."""
+        try:
+            return self._shard_sizes
+        except AttributeError:
+            self._shard_sizes = np.array([len(self.read_target(i)) \
+                for i in range(self.n_shards)], dtype=np.int64)
+            return self._shard_sizes
+
+    @property
+    def offsets(self):
+        """The row at which each shard starts, followed by n_samples."""
+        return np.concatenate(([0], np.cumsum(self.shard_sizes)))
+
+    @property
+    def n_samples(self):
+        return int(self.shard_sizes.sum())
+
+    @property
+    def shape(self):
+        return (self.n_samples, self.n_features)
+
+    @property
+    def itemsize(self):
+        """The size in bytes of an element of the features."""
+        return np.asarray(self.read(0)[:1]).itemsize
+
+    @property
+    def nbytes(self):
+        return self.n_samples * self.n_features * self.itemsize
+
+    def target(self):
+        """Returns the target of all shards in a single array."""
+        return np.concatenate([np.asarray(self.read_target(i)) \
+            for i in range(self.n_shards)])
+
+    def split(self, val_size, random_state=None):
+        """Splits the rows of each shard into training and validation sets.
+
+        Each shard is split separately, so that a shard of either set is
+        read from a single shard of this source.
+
+        Parameters
+        ----------
+        val_size : float in [0,1)
+            The proportion of the rows of each shard in the validation set.
+
+        random_state : int or None (default=None)
+            Seed for the split.
+
+        Returns
+        -------
+        train, val : DataSource
+            The training and validation sets.
+        """
+        rng = np.random.RandomState(random_state)
+        seeds = rng.randint(np.iinfo(np.int32).max, size=self.n_shards)
+        train = SplitSource(self, val_size, seeds, subset='train')
+        val = SplitSource(self, val_size, seeds, subset='val')
+        return train, val
+
+# --------------------------------------------------------------------------- #
+class ArraySource(DataSource):
+    """Reads contiguous blocks of rows of an array-like, such as an np.memmap.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        Any array supporting slicing of rows, including np.memmap arrays,
+        whose rows are not read until a shard is requested.
+
+    y : array-like of shape (n_samples,)
+        The target.
+
+    shard_size : int or None (default=None)
+        The number of rows per shard. If None, shards of about 64MB are
+        read.
+    """
+
+    def __init__(self, X, y, shard_size=None):
+        self.X = X
+        self.y = y
+        self.shard_size = shard_size
+
+    @property
+    def _rows_per_shard(self):
+        if self.shard_size:
+            return self.shard_size
+        row_bytes = max(1, self.X.shape[1] * np.dtype(self.X.dtype).itemsize)
+        return max(1, 2**26 // row_bytes)
+
+    @property
+    def n_shards(self):
+        return -(-self.X.shape[0] // self._rows_per_shard)
+
+    @property
+    def n_features(self):
+        return self.X.shape[1]
+
+    @property
+    def shard_sizes(self):
+        sizes = np.full(self.n_shards, self._rows_per_shard, dtype=np.int64)
+        sizes[-1] = self.X.shape[0] - self._rows_per_shard * (self.n_shards - 1)
+        return sizes
+
+    def read(self, shard):
+        start = shard * self._rows_per_shard
+        return self.X[start:start + self._rows_per_shard]
+
+    def read_target(self, shard):
+        start = shard * self._rows_per_shard
+        return self.y[start:start + self._rows_per_shard]
+
+# --------------------------------------------------------------------------- #
+class NpySource(DataSource):
+    """Reads shards stored in .npy files as memory maps.
+
+    Parameters
+    ----------
+    X_files : str or list of str
+        The .npy files containing the features, one per shard.
+
+    y_files : str or list of str
+        The .npy files containing the target, one per shard.
+
+    mmap_mode : str (default='r')
+        The mode in which the files are memory mapped. See np.load.
+    """
+
+    def __init__(self, X_files, y_files, mmap_mode='r'):
+        self.X_files = X_files
+        self.y_files = y_files
+        self.mmap_mode = mmap_mode
+
+    def _files(self, files):
+        return [files] if isinstance(files, str) else list(files)
+
+    @property
+    def n_shards(self):
+        return len(self._files(self.X_files))
+
+    @property
+    def n_features(self):
+        return self.read(0).shape[1]
+
+    def read(self, shard):
+        return np.load(self._files(self.X_files)[shard], mmap_mode=self.mmap_mode)
+
+    def read_target(self, shard):
+        return np.load(self._files(self.y_files)[shard], mmap_mode=self.mmap_mode)
+
+# --------------------------------------------------------------------------- #
+class CSVSource(DataSource):
+    """Reads shards stored in CSV files.
+
+    Each file is read in full when its shard is requested, so no file may
+    be larger than memory.
+
+    Parameters
+    ----------
+    files : str or list of str
+        The CSV files, one per shard, each with a header row.
+
+    target_column : str or int (default=-1)
+        The name or position of the target column.
+
+    read_csv_kwargs : dict or None (default=None)
+        Additional arguments passed to pandas.read_csv.
+    """
+
+    def __init__(self, files, target_column=-1, read_csv_kwargs=None):
+        self.files = files
+        self.target_column = target_column
+        self.read_csv_kwargs = read_csv_kwargs
+
+    def _files(self):
+        return [self.files] if isinstance(self.files, str) else list(self.files)
+
+    def _read_csv(self, shard, **kwargs):
+        kwargs.update(self.read_csv_kwargs or {})
+        return pd.read_csv(self._files()[shard], **kwargs)
+
+    def _columns(self):
+        """Returns the column names and the name of the target column."""
+        columns = self._read_csv(0, nrows=0).columns
+        target = columns[self.target_column] if \
+            isinstance(self.target_column, int) else self.target_column
+        return columns, target
+
+    @property
+    def n_shards(self):
+        return len(self._files())
+
+    @property
+    def n_features(self):
+        return len(self._columns()[0]) - 1
+
+    def read(self, shard):
+        _, target = self._columns()
+        return self._read_csv(shard).drop(columns=target).to_numpy()
+
+    def read_target(self, shard):
+        _, target = self._columns()
+        return self._read_csv(shard, usecols=[target])[target].to_numpy()
+
+# --------------------------------------------------------------------------- #
+class SplitSource(DataSource):
+    """The training or validation rows of each shard of another source.
+
+    Parameters
+    ----------
+    source : DataSource
+        The source being split.
+
+    val_size : float in [0,1)
+        The proportion of the rows of each shard in the validation set.
+
+    seeds : array-like of int
+        The seed for the split of each shard.
+
+    subset : str 'train' or 'val' (default='train')
+        The set of rows presented by this source.
+    """
+
+    def __init__(self, source, val_size, seeds, subset='train'):
+        self.source = source
+        self.val_size = val_size
+        self.seeds = seeds
+        self.subset = subset
+
+    @property
+    def n_shards(self):
+        return self.source.n_shards
+
+    @property
+    def n_features(self):
+        return self.source.n_features
+
+    @property
+    def itemsize(self):
+        return self.source.itemsize
+
+    def _rows(self, shard):
+        """Returns the sorted rows of the shard that belong to the subset."""
+        n = self.source.shard_sizes[shard]
+        n_val = int(n * self.val_size)
+        rows = np.random.RandomState(self.seeds[shard]).permutation(n)
+        rows = rows[:n_val] if self.subset == 'val' else rows[n_val:]
+        # Sorted rows are read from a memory map in a single forward sweep
+        return np.sort(rows)
+
+    @property
+    def shard_sizes(self):
+        sizes = self.source.shard_sizes
+        n_val = (sizes * self.val_size).astype(np.int64)
+        return n_val if self.subset == 'val' else sizes - n_val
+
+    def read(self, shard):
+        return self.source.read(shard)[self._rows(shard)]
+
+    def read_target(self, shard):
+        return np.asarray(self.source.read_target(shard))[self._rows(shard)]
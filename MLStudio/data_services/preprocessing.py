@@ -21,20 +21,38 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from copy import copy, deepcopy
 
+import numpy as np
 from sklearn.base import BaseEstimator
 from mlstudio.utils.data_analyzer import get_feature_info, get_target_info
 # --------------------------------------------------------------------------- #
 class AbstractDataProcessor(ABC, BaseEstimator):
-    """Defines interface for DataProcessor classes."""
+    """Defines interface for DataProcessor classes.
+    
+    The dtype parameter, if not None, is the floating point type to which
+    X and the training and validation targets are converted, once, 
+    so that the estimator computes in a single precision. 
+
+    The optional shuffle_transformer, a DataShuffler, shuffles the rows 
+    before the training data are split into training and validation sets.
+    Since adding the bias term has already copied X, a DataShuffler with 
+    copy=False shuffles that copy in place.
+
+    If the add_bias_transformer is an AddBiasTerm with implicit=True, no
+    bias column is added to X, and the estimator applies the bias 
+    parameter as an intercept.
+    """
 
     def __init__(self, add_bias_transformer=None, 
                  split_transformer=None, label_encoder=None, 
-                 one_hot_label_encoder=None):
+                 one_hot_label_encoder=None, dtype=None,
+                 shuffle_transformer=None):
         
         self.add_bias_transformer = add_bias_transformer  
         self.split_transformer = split_transformer
         self.label_encoder = label_encoder
         self.one_hot_label_encoder = one_hot_label_encoder
+        self.dtype = dtype
+        self.shuffle_transformer = shuffle_transformer
 
     def _compile(self):
         """Compiles the class for scikit-learn compatibility."""
@@ -42,11 +60,123 @@ class AbstractDataProcessor(ABC, BaseEstimator):
         self.split_transformer = deepcopy(self.split_transformer)
         self.label_encoder = deepcopy(self.label_encoder)
         self.one_hot_label_encoder = deepcopy(self.one_hot_label_encoder)
+        self.shuffle_transformer = deepcopy(self.shuffle_transformer)
 
     def _transform_X(self, X):
         """Adds bias term to X."""
+        self.add_bias_transformer.set_params(dtype=self.dtype)
         return self.add_bias_transformer.fit_transform(X)
 
+    def _shuffle(self, X, y, random_state=None, X_orig=None):
+        """Shuffles the processed X and a private copy of y.
+
+        X_orig is the caller's X. If the processed X is a view of it, 
+        X is copied, so that shuffling in place never modifies the 
+        caller's data.
+        """
+        if self.shuffle_transformer is None:
+            return X, y
+        if isinstance(X, np.ndarray) and isinstance(X_orig, np.ndarray) and \
+            np.may_share_memory(X, X_orig):
+            X = X.copy()
+        y = np.array(y) if y is not None else y
+        return self.shuffle_transformer.fit_transform(X, y, 
+                                                      random_state=random_state)
+
+    @property
+    def implicit_bias(self):
+        """True if the bias is applied as an intercept rather than added to X."""
+        return getattr(self.add_bias_transformer, 'implicit', False)
+
+    def transform_batch(self, X):
+        """Adds the bias term to a batch of rows read from a DataSource."""
+        return self._transform_X(X)
+
+    def _encode_y(self, y, fit=False):
+        """Encodes the target. By default, the target is left unchanged."""
+        return y
+
+    def process_batch(self, X, y=None):
+        """Processes a batch of training data for incremental training.
+
+        The bias term is added to X and y is encoded with the encoders
+        fitted to the training data, without splitting or metadata.
+        """
+        X = self._transform_X(X)
+        if y is not None:
+            y = self._transform_y(self._encode_y(y))
+        return X, y
+
+    def _get_source_info(self, source, n_features):
+        """Obtains feature information for a DataSource without reading X."""
+        d = OrderedDict()
+        d['n_observations'] = source.n_samples
+        d['n_features'] = n_features
+        d['size (Bytes)'] = source.n_samples * n_features * source.itemsize
+        return d
+
+    def process_source(self, source, val_size=None, random_state=None):
+        """Processes a DataSource for out-of-core training.
+
+        The features remain in the source and are returned as DataSource
+        objects, to which the bias term is added batch by batch via 
+        transform_batch. The targets are read and encoded in memory. If 
+        val_size is provided, the rows of each shard are split into 
+        training and validation sets.
+
+        Parameters
+        ----------
+        source : DataSource
+            The training data.
+
+        val_size : float in [0,1) or None (default=None)
+            The proportion of data to allocate to the validation set.
+
+        random_state : int or None (default=None)
+            Seed for the split.
+
+        Returns
+        -------
+        data : dict
+            Dictionary containing data and metadata
+        """
+        self._compile()
+        # The number of processed features is that of a single processed row
+        n_features = self.transform_batch(source.read(0)[:1]).shape[1]
+        y = source.target()
+
+        data = OrderedDict()
+        sets = [('X_train_', 'y_train_')]
+        if val_size:
+            train, val = source.split(val_size, random_state)
+            sources = [train, val]
+            sets.append(('X_val_', 'y_val_'))
+        else:
+            sources = [source]
+
+        for (X_name, y_name), subset in zip(sets, sources):
+            y_subset = subset.target()
+            data[X_name] = OrderedDict()
+            data[y_name] = OrderedDict()
+            data[X_name]['metadata'] = OrderedDict()
+            data[y_name]['metadata'] = OrderedDict()
+            data[X_name]['metadata']['orig'] = self._get_source_info(
+                source, source.n_features)
+            data[y_name]['metadata']['orig'] = get_target_info(y)
+            y_subset = self._encode_y(y_subset, fit=X_name == 'X_train_')
+            data[X_name]['data'] = subset
+            data[y_name]['data'] = self._transform_y(y_subset)
+            data[X_name]['metadata']['processed'] = self._get_source_info(
+                subset, n_features)
+            data[y_name]['metadata']['processed'] = get_target_info(y_subset)
+        return data
+
+    def _transform_y(self, y):
+        """Converts training and validation targets to the compute dtype."""
+        if self.dtype is None or y is None:
+            return y
+        return np.asarray(y, dtype=self.dtype)
+
     def _transform_X_ysplit(self, X, y, val_size=None, stratify=False, 
                                 random_state=None):
         """Splits the data."""        
@@ -82,7 +212,7 @@ class AbstractDataProcessor(ABC, BaseEstimator):
         return data
         
 
-    def process_train_data(self, X, y=None):
+    def process_train_data(self, X, y=None, random_state=None):
         """Default behavior for processing training metadata."""
         # Default behavior adds bias to X, does nothing to y
         # Copies mutable parameters to private variables for scikit-learn
@@ -96,9 +226,12 @@ class AbstractDataProcessor(ABC, BaseEstimator):
         data['X_train_']['metadata']['orig'] = get_feature_info(X)        
         data['y_train_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)        
+        X, y = self._shuffle(X, y, random_state, X_orig)
         
         data['X_train_']['data'] = X
+        data['y_train_']['data'] = self._transform_y(y)
         data['X_train_']['metadata']['processed'] = get_feature_info(X)
         data['y_train_']['metadata']['processed'] = get_target_info(y)
         return data
@@ -123,21 +256,23 @@ class AbstractDataProcessor(ABC, BaseEstimator):
         data['X_val_']['metadata']['orig'] = get_feature_info(X)
         data['y_val_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)
+        X, y = self._shuffle(X, y, random_state, X_orig)
 
         X_train_xform, X_val_xform, y_train_xform, y_val_xform = \
             self._transform_X_ysplit(X=X, y=y, val_size=val_size, 
                                       stratify=False, random_state=random_state)
 
         data['X_train_']['data'] = X_train_xform
-        data['y_train_']['data'] = y_train_xform
+        data['y_train_']['data'] = self._transform_y(y_train_xform)
         data['X_train_']['metadata']['processed'] = get_feature_info(X_train_xform)
         data['y_train_']['metadata']['processed'] = get_target_info(y_train_xform)            
 
         # Confirm split was successful
         if X_val_xform is not None:
             data['X_val_']['data'] = X_val_xform
-            data['y_val_']['data'] = y_val_xform
+            data['y_val_']['data'] = self._transform_y(y_val_xform)
             data['X_val_']['metadata']['processed'] = get_feature_info(X_val_xform)            
             data['y_val_']['metadata']['processed'] = get_target_info(y_val_xform)                                
         return data
@@ -146,8 +281,9 @@ class AbstractDataProcessor(ABC, BaseEstimator):
 class RegressionDataProcessor(AbstractDataProcessor):
     """Performs preprocessing of metadata for regression."""
 
-    def process_train_data(self, X, y=None):
-        return super(RegressionDataProcessor, self).process_train_data(X, y)
+    def process_train_data(self, X, y=None, random_state=None):
+        return super(RegressionDataProcessor, self).process_train_data(X, y, \
+            random_state)
 
     def process_train_val_data(self, X, y=None, val_size=None, random_state=None):
         return super(RegressionDataProcessor, self).process_train_val_data(X, y, \
@@ -163,7 +299,7 @@ class RegressionDataProcessor(AbstractDataProcessor):
 # --------------------------------------------------------------------------- #
 class BinaryClassDataProcessor(AbstractDataProcessor):
 
-    def process_train_data(self, X, y=None):
+    def process_train_data(self, X, y=None, random_state=None):
 
         data = OrderedDict()
         data['X_train_'] = OrderedDict()
@@ -174,11 +310,13 @@ class BinaryClassDataProcessor(AbstractDataProcessor):
         data['X_train_']['metadata']['orig'] = get_feature_info(X)
         data['y_train_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)        
+        X, y = self._shuffle(X, y, random_state, X_orig)
         y = self.label_encoder.fit_transform(y)
         
         data['X_train_']['data'] = X
-        data['y_train_']['data'] = y
+        data['y_train_']['data'] = self._transform_y(y)
 
         data['X_train_']['metadata']['processed'] = get_feature_info(X)
         data['y_train_']['metadata']['processed'] = get_target_info(y)
@@ -201,7 +339,9 @@ class BinaryClassDataProcessor(AbstractDataProcessor):
         data['X_val_']['metadata']['orig'] = get_feature_info(X)
         data['y_val_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)        
+        X, y = self._shuffle(X, y, random_state, X_orig)
 
         X_train_xform, X_val_xform, y_train_xform, y_val_xform = \
             self._transform_X_ysplit(X=X, y=y, val_size=val_size, 
@@ -210,7 +350,7 @@ class BinaryClassDataProcessor(AbstractDataProcessor):
         y_train_xform = self.label_encoder.fit_transform(y_train_xform)
         
         data['X_train_']['data'] = X_train_xform
-        data['y_train_']['data'] = y_train_xform
+        data['y_train_']['data'] = self._transform_y(y_train_xform)
         data['X_train_']['metadata']['processed'] = get_feature_info(X_train_xform)        
         data['y_train_']['metadata']['processed'] = get_target_info(y_train_xform)
 
@@ -218,11 +358,18 @@ class BinaryClassDataProcessor(AbstractDataProcessor):
         # Check if split was successful
         if X_val_xform is not None:
             data['X_val_']['data'] = X_val_xform
-            data['y_val_']['data'] = y_val_xform
+            data['y_val_']['data'] = self._transform_y(
+                self.label_encoder.transform(y_val_xform))
             data['X_val_']['metadata']['processed'] = get_feature_info(X_val_xform)        
             data['y_val_']['metadata']['processed'] = get_target_info(y_val_xform)        
         return data           
 
+    def _encode_y(self, y, fit=False):
+        """Encodes the target as 0 and 1."""
+        if fit:
+            return self.label_encoder.fit_transform(y)
+        return self.label_encoder.transform(y)
+
     def process_X_test_data(self, X, y=None):     
         return super(BinaryClassDataProcessor, self).process_X_test_data(X)
 
@@ -239,7 +386,7 @@ class BinaryClassDataProcessor(AbstractDataProcessor):
 # --------------------------------------------------------------------------- #
 class MultiClassDataProcessor(AbstractDataProcessor):
 
-    def process_train_data(self, X, y=None):
+    def process_train_data(self, X, y=None, random_state=None):
 
 
         data = OrderedDict()
@@ -251,12 +398,14 @@ class MultiClassDataProcessor(AbstractDataProcessor):
         data['X_train_']['metadata']['orig'] = get_feature_info(X)
         data['y_train_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)        
+        X, y = self._shuffle(X, y, random_state, X_orig)
         y = self.label_encoder.fit_transform(y)
         y = self.one_hot_label_encoder.fit_transform(y)
         
         data['X_train_']['data'] = X
-        data['y_train_']['data'] = y
+        data['y_train_']['data'] = self._transform_y(y)
 
         data['X_train_']['metadata']['processed'] = get_feature_info(X)
         data['y_train_']['metadata']['processed'] = get_target_info(y)
@@ -280,7 +429,9 @@ class MultiClassDataProcessor(AbstractDataProcessor):
         data['X_val_']['metadata']['orig'] = get_feature_info(X)
         data['y_val_']['metadata']['orig'] = get_target_info(y)
 
+        X_orig = X
         X = self._transform_X(X)        
+        X, y = self._shuffle(X, y, random_state, X_orig)
 
         X_train_xform, X_val_xform, y_train_xform, y_val_xform = \
             self._transform_X_ysplit(X=X, y=y, val_size=val_size, 
@@ -290,19 +441,29 @@ class MultiClassDataProcessor(AbstractDataProcessor):
         y_train_xform = self.one_hot_label_encoder.fit_transform(y_train_xform)
         
         data['X_train_']['data'] = X_train_xform
-        data['y_train_']['data'] = y_train_xform
+        data['y_train_']['data'] = self._transform_y(y_train_xform)
         data['X_train_']['metadata']['processed'] = get_feature_info(X_train_xform)        
         data['y_train_']['metadata']['processed'] = get_target_info(y_train_xform)
 
 
         # Check if split was successful
         if X_val_xform is not None:
-            data['X_val_']['data'] = self.label_encoder.transform(y_val_xform)
-            data['y_val_']['data'] = self.one_hot_label_encoder.transform(y_val_xform)
+            y_val_xform = self.label_encoder.transform(y_val_xform)
+            data['X_val_']['data'] = X_val_xform
+            data['y_val_']['data'] = self._transform_y(
+                self.one_hot_label_encoder.transform(y_val_xform))
             data['X_val_']['metadata']['processed'] = get_feature_info(X_val_xform)        
             data['y_val_']['metadata']['processed'] = get_target_info(y_val_xform)        
         return data        
 
+    def _encode_y(self, y, fit=False):
+        """Encodes the target as one-hot vectors."""
+        if fit:
+            y = self.label_encoder.fit_transform(y)
+            return self.one_hot_label_encoder.fit_transform(y)
+        y = self.label_encoder.transform(y)
+        return self.one_hot_label_encoder.transform(y)
+
     def process_X_test_data(self, X, y=None):     
         return super(MultiClassDataProcessor, self).process_X_test_data(X)
 
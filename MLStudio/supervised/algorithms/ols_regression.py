@@ -36,20 +36,152 @@ The core behaviors exposed for each class include:
 
 """
 import numpy as np
+from numpy.linalg import LinAlgError
+from scipy.linalg import cho_factor, cho_solve, qr, solve_triangular
 from sklearn.base import BaseEstimator, RegressorMixin
 from sklearn.utils.validation import check_array, check_is_fitted, check_X_y
 
 from mlstudio.supervised.metrics.regression import R2
 from mlstudio.utils.data_manager import StandardScaler
+from mlstudio.utils.validation import validate_int, validate_string
 
 # --------------------------------------------------------------------------- #
 #                        LINEAR REGRESSION (OLS)                              #
 # --------------------------------------------------------------------------- # 
 class OLSRegression(BaseEstimator, RegressorMixin):
-    """Ordinary least squares closed form linear regression."""
+    """Ordinary least squares closed form linear regression.
 
-    def __init__(self, metric=R2()):
+    Parameters
+    ----------
+    metric : Metric object (default=R2())
+        The metric used by the score method.
+
+    solver : str 'auto', 'normal', 'qr', or 'svd' (default='auto')
+        The method used to solve the least squares problem.
+
+        * 'normal' : Cholesky factorization of the centered normal 
+            equations. Fastest, and the only solver that supports 
+            'chunk_size', but squares the condition number of X.
+        * 'qr' : Thin QR factorization of the centered design matrix. 
+            Requires X to have full column rank.
+        * 'svd' : Thin SVD via np.linalg.lstsq. Slowest, but returns the 
+            minimum norm solution when X is rank deficient.
+        * 'auto' : 'normal' if the normal equations are well conditioned, 
+            otherwise 'svd'.
+
+    chunk_size : int or None (default=None)
+        If not None, the normal equations are accumulated over blocks of 
+        chunk_size rows, so that X may be a memory mapped array that 
+        does not fit in memory. Only supported by the 'normal' and 'auto'
+        solvers.
+
+    Attributes
+    ----------
+    intercept_ : float
+        The bias term
+
+    coef_ : array-like, shape (n_features,)
+        The feature weights
+
+    solver_ : str
+        The solver used to fit the model.
+    """
+
+    _solvers = ['auto', 'normal', 'qr', 'svd']
+
+    def __init__(self, metric=R2(), solver='auto', chunk_size=None):
         self.metric_ = metric
+        self.solver = solver
+        self.chunk_size = chunk_size
+
+    def _validate_params(self):
+        validate_string(param=self.solver, param_name='solver',
+                        valid_values=self._solvers)
+        if self.chunk_size is not None:
+            validate_int(param=self.chunk_size, param_name='chunk_size',
+                         minimum=1, left='closed', right='open')
+            if self.solver not in ['auto', 'normal']:
+                msg = "chunk_size is only supported by the 'normal' and 'auto' solvers."
+                raise ValueError(msg)
+
+    def _scatter(self, X, y):
+        """Accumulates the centered normal equations over row chunks.
+
+        Chunk moments are merged with the pairwise update of Chan et al.,
+        which avoids the cancellation incurred by forming X^TX on the 
+        raw, uncentered data.
+
+        Returns
+        -------
+        x_mean, y_mean : means of the features and the target
+        Sxx, Sxy : centered X^TX and X^Ty
+        """
+        n, p = X.shape
+        chunk_size = self.chunk_size or n
+        count = 0
+        x_mean, y_mean = np.zeros(p), 0.0
+        Sxx, Sxy = np.zeros((p, p)), np.zeros(p)
+        for start in range(0, n, chunk_size):
+            X_chunk = np.asarray(X[start:start + chunk_size], dtype=np.float64)
+            y_chunk = np.asarray(y[start:start + chunk_size], dtype=np.float64)
+            m = X_chunk.shape[0]
+            x_mean_chunk, y_mean_chunk = X_chunk.mean(axis=0), y_chunk.mean()
+            X_chunk = X_chunk - x_mean_chunk
+            y_chunk = y_chunk - y_mean_chunk
+            # Merge the chunk moments into the running moments
+            dx, dy = x_mean_chunk - x_mean, y_mean_chunk - y_mean
+            w = count * m / (count + m)
+            Sxx += X_chunk.T.dot(X_chunk) + w * np.outer(dx, dx)
+            Sxy += X_chunk.T.dot(y_chunk) + w * dx * dy
+            count += m
+            x_mean += dx * m / count
+            y_mean += dy * m / count
+        return x_mean, y_mean, Sxx, Sxy
+
+    def _solve_normal(self, X, y):
+        """Solves the normal equations by Cholesky factorization.
+
+        Returns None if the normal equations are not positive definite
+        or, when solver='auto', are too ill conditioned to be trusted.
+        """
+        x_mean, y_mean, Sxx, Sxy = self._scatter(X, y)
+        # Jacobi scaling so that the condition estimate ignores feature scale
+        d = np.sqrt(np.diag(Sxx))
+        d[d == 0] = 1.0
+        try:
+            c, lower = cho_factor(Sxx / np.outer(d, d))
+        except LinAlgError:
+            c = None
+        if c is not None:
+            r = np.abs(np.diag(c))
+            ill_conditioned = (r.min() / r.max())**2 < np.sqrt(np.finfo(float).eps)
+            if not (ill_conditioned and self.solver == 'auto'):
+                coef = cho_solve((c, lower), Sxy / d) / d
+                return y_mean - x_mean.dot(coef), coef
+        if self.solver == 'normal':
+            raise LinAlgError("The normal equations are singular. Use solver='svd'.")
+        if self.chunk_size is not None:
+            # Minimum norm solution of the normal equations, which 
+            # does not require X to be held in memory.
+            coef = np.linalg.lstsq(Sxx, Sxy, rcond=None)[0]
+            return y_mean - x_mean.dot(coef), coef
+        return None
+
+    def _solve_qr(self, X, y):
+        """Solves the centered least squares problem by thin QR."""
+        x_mean, y_mean = X.mean(axis=0), y.mean()
+        Q, R = qr(X - x_mean, mode='economic')
+        r = np.abs(np.diag(R))
+        if r.size and r.min() <= r.max() * max(X.shape) * np.finfo(float).eps:
+            raise LinAlgError("X is rank deficient. Use solver='svd'.")
+        coef = solve_triangular(R, Q.T.dot(y - y_mean))
+        return y_mean - x_mean.dot(coef), coef
+
+    def _solve_svd(self, X, y):
+        """Returns the minimum norm solution via the thin SVD."""
+        theta = np.linalg.lstsq(np.column_stack([np.ones(X.shape[0]), X]), y,
+                                rcond=None)[0]
+        return theta[0], theta[1:]
 
     def fit(self, X, y):
         """Fits the linear regression ordinary least squares solution.
@@ -66,32 +198,23 @@ class OLSRegression(BaseEstimator, RegressorMixin):
         -------
         self : returns instance of self._
         """
+        self._validate_params()
         # Validate input and target 
-        X, y = check_X_y(X, y)
-
-        # Add bias term of ones to feature matrix
-        X = np.insert(X, 0, 1.0, axis=1) 
-
-        # Obtain n samples nad comp0ute matrix rank
-        n = X.shape[1]
-        r = np.linalg.matrix_rank(X)        
-
-        # Find matrix equivalent using singular value decomposition
-        U, S, V = np.linalg.svd(X)
-
-        # Derive D^+ from sigma        
-        D_plus = np.zeros((X.shape[0], X.shape[1])).T
-        D_plus[:S.shape[0], :S.shape[0]] = np.linalg.inv(np.diag(S))
-        
-        # Compute Moore-Penrose pseudoinverse of X
-        X_plus = V.T.dot(D_plus).dot(U.T)
+        X, y = check_X_y(X, y, copy=False)
 
-        # Weights are the dot product of X_plus and y
-        theta = X_plus.dot(y)
+        solution = None
+        if self.solver in ['auto', 'normal']:
+            self.solver_ = 'normal'
+            solution = self._solve_normal(X, y)
+        elif self.solver == 'qr':
+            self.solver_ = 'qr'
+            solution = self._solve_qr(X, y)
+        if solution is None:
+            self.solver_ = 'svd'
+            solution = self._solve_svd(X, y)
 
         # Save solution in attributes        
-        self.intercept_ = theta[0]
-        self.coef_ = theta[1:]
+        self.intercept_, self.coef_ = solution
 
         return self
 
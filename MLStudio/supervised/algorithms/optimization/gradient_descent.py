@@ -27,17 +27,21 @@ import warnings
 from pathlib import Path
 import site
 import time
-import tracemalloc
 PROJECT_DIR = Path(__file__).resolve().parents[4]
 site.addsitedir(PROJECT_DIR)
 
 import numpy as np
+from scipy import sparse
 from sklearn.base import BaseEstimator, RegressorMixin, ClassifierMixin
 from tabulate import tabulate
 
-from mlstudio.utils.data_manager import unpack_parameters
-from mlstudio.utils.data_manager import batch_iterator
+from mlstudio.data_services.data_sources import DataSource
+from mlstudio.utils.data_manager import unpack_parameters, linear_output
+from mlstudio.utils.data_manager import BatchSampler
 from mlstudio.utils import validation
+from mlstudio.supervised.algorithms.optimization.observers.history import BlackBox
+from mlstudio.supervised.algorithms.optimization.services.optimizers import GradientDescentOptimizer
+from mlstudio.supervised.algorithms.optimization.services.regularizers import L1, L1_L2
 # =========================================================================== #
 #                              GRADIENT DESCENT                               #
 # =========================================================================== #        
@@ -75,7 +79,9 @@ class GradientDescent(ABC, BaseEstimator):
 
     optimizer : An Optimizer object or None
         The optimization algorithm to use. If None, the generic 
-        GradientDescentOptimizer will be used.
+        GradientDescentOptimizer will be used. The proximal optimizers, 
+        ISTA and FISTA, apply the L1 penalty of an L1 or L1_L2 regularizer
+        by soft-thresholding, which sets parameters exactly to zero.
 
     metric : a Metric object (default=None)
         Supported Metric object for estimating performance.        
@@ -107,15 +113,62 @@ class GradientDescent(ABC, BaseEstimator):
     random_state : int or None
         If an int, this will be the random state used anywhere pseudo-randomization
         occurs.
+
+    snapshot_mode : str 'full' or 'fast' (default='full')
+        Determines how the per-epoch performance snapshot is computed. 
+        'full' scores the training and validation sets through the public
+        score method. 'fast' computes a single forward pass per data set, 
+        derives both cost and score from its output without re-validating
+        the data, and reuses that output during batch gradient descent.
+
+    snapshot_freq : int (default=1)
+        The number of epochs between performance snapshots. Costs and
+        scores from the most recent snapshot are carried forward on the 
+        epochs in between.
+
+    snapshot_interval : float or None (default=None)
+        If provided, the minimum number of seconds of wall-clock time between
+        performance snapshots. Takes precedence over snapshot_freq.
+
+    profiler : a Profiler object or None (default=None)
+        Measures memory consumption during training. If None, only the
+        elapsed time of each epoch is recorded.
+
+    dtype : str 'float32' or 'float64' (default='float64')
+        The floating point precision of the computation. The data, 
+        parameters, gradients and optimizer state are all held in this 
+        precision, so that no conversions take place during training.
+        'float32' halves memory and memory bandwidth.
+
+    batch_sampler : a BatchSampler object or None (default=None)
+        Determines the order in which rows are assigned to minibatches.
+        A BatchSampler reshuffles the row indices each epoch, and may 
+        stratify batches or drop the last incomplete batch. If None, 
+        batches are contiguous slices in the original row order. A 
+        BatchSampler without a random_state uses the estimator's.
+
+    warm_start : bool (default=False)
+        If True, a fit following a previous fit or partial_fit continues 
+        from the current theta and optimizer state, for epochs further 
+        epochs. The estimator is not recompiled, so its components, 
+        observers and their histories carry on, and the data are processed
+        again only if X or y is not the object passed previously.
     
     """
 
+    # The largest proportion of features with non-zero parameters for which
+    # prediction uses only their columns
+    SPARSE_SUPPORT = 0.1
+
     def __init__(self, eta0=0.01, epochs=1000,  batch_size=None,  val_size=0.3, 
                  loss=None, data_processor=None, activation=None,
                  theta_init=None, optimizer=None, scorer=None, early_stop=None, 
                  learning_rate=None,  observer_list=None, progress=None,                  
                  blackbox=None, summary=None, verbose=False, random_state=None,
-                 check_gradient=False, gradient_checker=None):
+                 check_gradient=False, gradient_checker=None, 
+                 snapshot_mode='full', snapshot_freq=1, snapshot_interval=None,
+                 profiler=None, dtype='float64', batch_sampler=None,
+                 warm_start=False):
 
         self.eta0 = eta0
         self.epochs = epochs
@@ -137,6 +190,13 @@ class GradientDescent(ABC, BaseEstimator):
         self.random_state = random_state    
         self.check_gradient = check_gradient
         self.gradient_checker = gradient_checker
+        self.snapshot_mode = snapshot_mode
+        self.snapshot_freq = snapshot_freq
+        self.snapshot_interval = snapshot_interval
+        self.profiler = profiler
+        self.dtype = dtype
+        self.batch_sampler = batch_sampler
+        self.warm_start = warm_start
 
     # ----------------------------------------------------------------------- #                
     @property
@@ -211,9 +271,11 @@ class GradientDescent(ABC, BaseEstimator):
         """Makes copies of mutable parameters and makes them private members."""
 
         self._eta = self.learning_rate.eta0 if self.learning_rate else self.eta0 
+        self._dtype = np.dtype(self.dtype)
         self._loss = copy.deepcopy(self.loss) 
         self._activation = copy.deepcopy(self.activation)
         self._data_processor = copy.deepcopy(self.data_processor)
+        self._data_processor.set_params(dtype=self._dtype)
         self._observer_list = copy.deepcopy(self.observer_list)           
         self._optimizer = copy.deepcopy(self.optimizer)
         self._scorer = copy.deepcopy(self.scorer)
@@ -221,7 +283,12 @@ class GradientDescent(ABC, BaseEstimator):
         self._summary = copy.deepcopy(self.summary) 
         self._gradient_checker = copy.deepcopy(self.gradient_checker)
         self._blackbox = copy.deepcopy(self.blackbox)
-        self._tracemalloc = tracemalloc
+        self._profiler = copy.deepcopy(self.profiler)
+        self._batch_sampler = copy.deepcopy(self.batch_sampler) if \
+            self.batch_sampler is not None else BatchSampler(shuffle=False)
+        if self._batch_sampler.random_state is None:
+            self._batch_sampler.set_params(random_state=self.random_state)
+        self._batch_sampler.reset()
 
         # Observers
         self._learning_rate = copy.deepcopy(self.learning_rate) if \
@@ -230,10 +297,20 @@ class GradientDescent(ABC, BaseEstimator):
         self._early_stop = copy.deepcopy(self.early_stop) if self.early_stop\
             else self.early_stop        
 
+        # A proximal optimizer applies the L1 penalty of the regularizer. The
+        # mode is set on every compile, as the loss may be shared with a 
+        # previous fit under another optimizer.
+        if self._loss.regularizer:
+            proximal = bool(getattr(self._optimizer, 'proximal', False))
+            self._loss.regularizer.set_proximal(proximal)
+            if proximal:
+                self._optimizer.set_proximal(self._loss.regularizer)
+
     # ----------------------------------------------------------------------- #
     def _initialize_state(self, log=None):
         """Initializes variables that represent teh state of the estimator."""
         self._epoch = 0      
+        self._final_epoch = self.epochs
         self._batch = 0 
         self._train_data_package = None
         self._theta = None
@@ -246,11 +323,17 @@ class GradientDescent(ABC, BaseEstimator):
         self._epoch_log = None
         self._start_time = None
         self._end_time = None
+        self._snapshot_time = None
+        self._snapshot_batch = None
+        self._snapshot_y_out = None
+        self._snapshot_cost = None
+        self._support = None
         # Attributes
         self.n_features_in_ = None
         self.n_features_out_ = None
         self.classes_ = None
         self.n_classes_ = None
+        self.alpha_ = None
     # ----------------------------------------------------------------------- #  
     def _unpack_data(self, data):
         """Unpacks the data into attributes"""
@@ -266,6 +349,9 @@ class GradientDescent(ABC, BaseEstimator):
         if data.get('X_train_'):
             self.n_features_in_ = data['X_train_']['metadata']['orig']['n_features']
             self.n_features_out_ = data['X_train_']['metadata']['processed']['n_features']
+            # An implicit bias parameter has no column in X
+            if self._data_processor.implicit_bias:
+                self.n_features_out_ += 1
 
         self.train_data_package_ = data
 
@@ -318,14 +404,42 @@ class GradientDescent(ABC, BaseEstimator):
                                                             random_state)
         self._unpack_data(data) 
     # ----------------------------------------------------------------------- #    
-    def _prepare_data(self, X, y=None):
-        """Prepares data for training and creates data and metadata attributes."""     
+    def _prepare_data(self, X, y=None, data=None):
+        """Prepares data for training and creates data and metadata attributes.
+
+        data, if given, is the data processor and data package returned by
+        _process_data, which are used rather than processing X and y again.
+        """     
         self._data_prepared = True   
-        if self.val_size:
+        self._fit_data = (X, y)
+        if data is not None:
+            processor, data = data
+            self._data_processor = copy.deepcopy(processor)
+            self._unpack_data(data)
+        elif isinstance(X, DataSource):
+            # The features remain in the source and are read during training
+            data = self._data_processor.process_source(X, self.val_size, 
+                                                       self.random_state)
+            self._unpack_data(data)
+        elif self.val_size:
             self._prepare_train_val_data(X, y, self.val_size, self.random_state)
         else:
             self._prepare_train_data(X, y, self.random_state)
 
+    # ----------------------------------------------------------------------- #
+    def _process_data(self, X, y=None):
+        """Processes and splits the data once for estimators that share them.
+
+        Returns the fitted data processor and the data package, which may be
+        passed as log['data'] to _on_train_begin of estimators having the 
+        same data_processor, val_size, random_state and dtype. The arrays of
+        the package are shared, not copied, by those estimators.
+        """
+        self._compile()
+        self._initialize_state()
+        self._prepare_data(X, y)
+        return self._data_processor, self.train_data_package_
+
     # ----------------------------------------------------------------------- #
     def _initialize_observers(self, log=None):
         """Initialize remaining observers. Create and initialize observer list."""        
@@ -358,23 +472,70 @@ class GradientDescent(ABC, BaseEstimator):
         validation.validate_estimator(self)
         self._compile(log)    
         self._initialize_state(log)
-        self._prepare_data(log.get('X'), log.get('y'))
+        self._prepare_data(log.get('X'), log.get('y'), log.get('data'))
         self._initialize_observers(log)
         self._theta = self._init_weights(self.theta_init)
     # ----------------------------------------------------------------------- #
-    def _on_train_end(self, log=None):
-        """Finalizes training and posts model parameter attributes."""
+    def _is_started(self):
+        """Returns True if training has begun, by fit or partial_fit."""
+        return getattr(self, '_theta', None) is not None
+    # ----------------------------------------------------------------------- #
+    def _on_warm_start(self, log=None):
+        """Resumes training from the current theta and optimizer state.
+
+        Nothing is recompiled or reinitialized. The data are prepared again
+        only if they are not the data of the previous fit.
+        """
         log = log or {}
+        validation.validate_estimator(self)
+        X, y = log.get('X'), log.get('y')
+        fit_X, fit_y = self._fit_data
+        if X is not fit_X or y is not fit_y:
+            n_features = X.shape[1] if isinstance(X, DataSource) else \
+                np.shape(X)[1]
+            if n_features != self.n_features_in_:
+                msg = "X has {n} features, but the estimator was fitted with {m}.".\
+                    format(n=n_features, m=self.n_features_in_)
+                raise ValueError(msg)
+            self._prepare_data(X, y)
+            # Costs and scores are no longer those of the previous data
+            self._snapshot_time = None
+            self._snapshot_batch = None
+        self._converged = False
+        self._final_epoch = self._epoch + self.epochs
+    # ----------------------------------------------------------------------- #
+    def _post_parameters(self):
+        """Posts the number of epochs and model parameter attributes.
+
+        If no more than SPARSE_SUPPORT of the features have non-zero
+        parameters, as with L1 penalties and a proximal optimizer, they 
+        are retained for prediction by _predict_output.
+        """
         self.n_iter_ = self._epoch         
         self.intercept_, self.coef_ = unpack_parameters(self._theta)
+        weights = self._theta[1:].reshape(len(self._theta) - 1, -1)
+        support = np.flatnonzero(np.any(weights != 0, axis=1))
+        self._support = None
+        if len(support) <= self.SPARSE_SUPPORT * len(weights):
+            self._support = support
+            self._support_theta = np.concatenate((self._theta[:1], 
+                                                  self._theta[1:][support]))
+    # ----------------------------------------------------------------------- #
+    def _on_train_end(self, log=None):
+        """Finalizes training and posts model parameter attributes."""
+        log = log or {}
+        self._post_parameters()
         self._observer_list.on_train_end()                
     # ----------------------------------------------------------------------- #
     def _on_epoch_begin(self, log=None):
         """Initializes the epoch and notifies observers."""
         log = log or {}      
+        # Theta is about to change
+        self._support = None
         self._epoch_log = self._performance_snapshot(log)
         self._start_time = self._timer.perf_counter()          
-        self._tracemalloc.start()
+        if self._profiler:
+            self._profiler.start(self._epoch)
         self._observer_list.on_epoch_begin(epoch=self._epoch, log=log)
     # ----------------------------------------------------------------------- #
     def _on_epoch_end(self, log=None):
@@ -384,12 +545,11 @@ class GradientDescent(ABC, BaseEstimator):
         self._end_time = self._timer.perf_counter()
         elapsed_time = self._end_time - self._start_time
         
-        current, peak = self._tracemalloc.get_traced_memory()
-        self._tracemalloc.stop()                
-        
         self._epoch_log['cpu_time'] = elapsed_time
-        self._epoch_log['current_memory'] = current
-        self._epoch_log['peak_memory'] = peak
+        self._epoch_log['current_memory'] = None
+        self._epoch_log['peak_memory'] = None
+        if self._profiler:
+            self._epoch_log.update(self._profiler.stop(self._epoch))
         
         self._observer_list.on_epoch_end(epoch=self._epoch, log=self._epoch_log)
         self._epoch += 1
@@ -429,11 +589,12 @@ class GradientDescent(ABC, BaseEstimator):
             if theta_init.shape != (self.n_features_out_,):
                 msg = "Initial parameters theta must have shape (n_features,)."
                 raise ValueError(msg)
-            theta = theta_init
+            # Copy, since the optimizer updates theta in place
+            theta = np.array(theta_init, dtype=self._dtype)
         else:
             # Random initialization of weights
             rng = np.random.RandomState(self.random_state)                
-            theta = rng.randn(self.n_features_out_) 
+            theta = rng.randn(self.n_features_out_).astype(self._dtype) 
             # Set the bias initialization to zero
             theta[0] = 0
         return theta        
@@ -451,15 +612,47 @@ class GradientDescent(ABC, BaseEstimator):
         theta : array-like (n_features,) or (n_features, n_classes)
             The model parameters at the current iteration
 
-        X : array-like (n_samples, n_features)
-            The features including a constant bias term.
+        X : array-like, csr matrix or DataSource (n_samples, n_features)
+            The features including a constant bias term, unless the bias
+            is implicit, or a DataSource, which is read without one.
         
         Returns
         -------
         y_out : float
         """
+        return self._activate(self._linear_output(theta, X))
+
+    # ----------------------------------------------------------------------- #            
+    def _activate(self, z):
+        """Applies the activation function, if any, to the linear output."""
+        return z
+
+    # ----------------------------------------------------------------------- #            
+    def _linear_output(self, theta, X):
+        """Computes the linear combination of the inputs and parameters.
 
-        return np.array(X.dot(theta), dtype=np.float32)
+        Parameters
+        ----------
+        theta : array-like (n_features,) or (n_features, n_columns)
+            The model parameters, or any matrix with a row per parameter.
+
+        X : array-like, csr matrix or DataSource (n_samples, n_features)
+            The features including a constant bias term, unless the bias
+            is implicit, or a DataSource, which is read without one.
+        
+        Returns
+        -------
+        z : array-like of shape (n_samples,) or (n_samples, n_columns)
+        """
+        if isinstance(X, DataSource):
+            # Shards are read one at a time and the bias term is added to each
+            return np.concatenate([linear_output(
+                self._data_processor.transform_batch(X.read(i)), theta) \
+                    for i in range(X.n_shards) if X.shard_sizes[i] > 0])
+        # For csr matrices, X.dot(theta) is a sparse matrix-vector product
+        # that returns a dense array without densifying X. If the bias is
+        # implicit, theta[0] is added as an intercept.
+        return linear_output(X, theta)
 
     # ----------------------------------------------------------------------- #            
     def _compute_loss(self, theta, y, y_out):
@@ -487,13 +680,60 @@ class GradientDescent(ABC, BaseEstimator):
 
         return self._loss.gradient(theta, X, y, y_out)        
     # ----------------------------------------------------------------------- #            
-    def _performance_snapshot(self, log=None):
-        """Computes loss and scores for the current set of parameters."""
-        log = log or {}
-        log['epoch'] = self._epoch
-        log['eta'] = self._eta
-        log['theta'] = self._theta
+    def _source_gradient(self, theta, X, y, y_out=None):
+        """Computes the gradient over every shard of a DataSource.
 
+        The gradient of the loss is an average over the rows of a batch, 
+        so the gradient of the full batch is the average of the gradients 
+        of the shards, weighted by their number of rows. The cost is 
+        computed in the same pass and retained for the batch log.
+        """
+        offsets = X.offsets
+        grad = np.zeros_like(theta)
+        cost = 0
+        for i in range(X.n_shards):
+            if offsets[i] == offsets[i+1]:
+                continue
+            X_shard = self._data_processor.transform_batch(X.read(i))
+            y_shard = y[offsets[i]:offsets[i+1]]
+            y_out_shard = self._compute_output(theta, X_shard)
+            weight = (offsets[i+1] - offsets[i]) / offsets[-1]
+            cost += weight * self._compute_loss(theta, y_shard, y_out_shard)
+            grad += weight * self._loss.gradient(theta, X_shard, y_shard, 
+                                                 y_out_shard)
+        self._source_cost = cost
+        return grad
+    # ----------------------------------------------------------------------- #            
+    def _lookahead_gradient(self, theta, X, y, y_out=None):
+        """Computes the gradient with the output of the model at theta."""
+        y_out = self._compute_output(theta, X)
+        return self._loss.gradient(theta, X, y, y_out)
+
+    # ----------------------------------------------------------------------- #            
+    def _snapshot_due(self):
+        """Returns True if a performance snapshot is due this epoch."""
+        # The first and last epochs are always evaluated.
+        if self._snapshot_time is None or self._epoch == self._final_epoch - 1:
+            return True
+        if self.snapshot_interval:
+            elapsed = self._timer.perf_counter() - self._snapshot_time
+            return elapsed >= self.snapshot_interval
+        return self._epoch % self.snapshot_freq == 0
+
+    # ----------------------------------------------------------------------- #            
+    def _output_to_prediction(self, y_out):
+        """Converts model output to the prediction expected by the scorer."""
+        return y_out
+
+    # ----------------------------------------------------------------------- #            
+    def _score_output(self, y, y_out):
+        """Scores model output without re-validating or re-processing X."""
+        y_pred = self._output_to_prediction(y_out)
+        return self._scorer(y, y_pred, n_features=self.n_features_in_)
+
+    # ----------------------------------------------------------------------- #            
+    def _full_snapshot(self, log):
+        """Computes costs and scores via forward passes and the score method."""
         y_out = self._compute_output(self._theta, self.X_train_)
         log['train_cost'] = self._compute_loss(self._theta, self.y_train_,
                                                     y_out)
@@ -506,6 +746,59 @@ class GradientDescent(ABC, BaseEstimator):
                     y_out_val = self._compute_output(self._theta, self.X_val_)
                     log['val_cost'] = self._compute_loss(self._theta, self.y_val_, y_out_val)                                
                     log['val_score'] = self.score(self.X_val_, self.y_val_)
+        return log
+
+    # ----------------------------------------------------------------------- #            
+    def _fast_snapshot(self, log):
+        """Computes costs and scores from one forward pass per data set."""
+        y_out = self._compute_output(self._theta, self.X_train_)
+        log['train_cost'] = self._compute_loss(self._theta, self.y_train_,
+                                                    y_out)
+        log['train_score'] = self._score_output(self.y_train_, y_out)
+
+        # Batch gradient descent computes the same output for the first 
+        # batch of the epoch, so retain it for reuse in train_epoch.
+        self._snapshot_batch = self._batch
+        self._snapshot_y_out = y_out
+        self._snapshot_cost = log['train_cost']
+
+        if self.val_size:
+            if hasattr(self, 'X_val_'):
+                if self.X_val_.shape[0] > 0:                
+                    y_out_val = self._compute_output(self._theta, self.X_val_)
+                    log['val_cost'] = self._compute_loss(self._theta, self.y_val_, y_out_val)                                
+                    log['val_score'] = self._score_output(self.y_val_, y_out_val)
+        return log
+
+    # ----------------------------------------------------------------------- #            
+    def _performance_snapshot(self, log=None):
+        """Computes loss and scores for the current set of parameters.
+        
+        Snapshots are taken in accordance with the snapshot_freq and 
+        snapshot_interval parameters. On the epochs in between, the most
+        recent costs and scores are carried forward and the 'evaluated'
+        entry of the log is set to False so that performance observers
+        can disregard them.
+        """
+        log = log or {}
+        log['epoch'] = self._epoch
+        log['eta'] = self._eta
+        log['theta'] = self._theta.copy()
+
+        if self._snapshot_due():
+            if self.snapshot_mode == 'fast':
+                log = self._fast_snapshot(log)
+            else:
+                log = self._full_snapshot(log)
+            self._snapshot_time = self._timer.perf_counter()
+            self._performance_log = OrderedDict((k, log[k]) for k in \
+                ('train_cost', 'train_score', 'val_cost', 'val_score') \
+                    if k in log)
+            log['evaluated'] = True
+        else:
+            log.update(self._performance_log)
+            log['evaluated'] = False
+
         # Store the gradient and its magnitude
         log['gradient'] = self._gradient
         log['gradient_norm'] = None
@@ -514,6 +807,31 @@ class GradientDescent(ABC, BaseEstimator):
 
         return log           
 
+    # ----------------------------------------------------------------------- #            
+    def _batches(self):
+        """Generates training batches.
+
+        A DataSource is read one shard at a time, in the order given by the
+        batch sampler, and the bias term is added to each batch. Without a
+        batch size, the source itself is the single batch.
+        """
+        if not isinstance(self.X_train_, DataSource):
+            yield from self._batch_sampler.batches(self.X_train_, 
+                                self.y_train_, batch_size=self.batch_size)
+            return
+        if self.batch_size is None:
+            yield self.X_train_, self.y_train_
+            return
+        offsets = self.X_train_.offsets
+        for i in self._batch_sampler.shard_order(self.X_train_.n_shards):
+            if offsets[i] == offsets[i+1]:
+                continue
+            X_shard = self.X_train_.read(i)
+            y_shard = self.y_train_[offsets[i]:offsets[i+1]]
+            for X_batch, y_batch in self._batch_sampler.batches(X_shard, 
+                                        y_shard, batch_size=self.batch_size):
+                yield self._data_processor.transform_batch(X_batch), y_batch
+
     # ----------------------------------------------------------------------- #            
     def train_epoch(self):
         """Trains a single epoch."""
@@ -522,18 +840,36 @@ class GradientDescent(ABC, BaseEstimator):
         log = {}
         log['epoch'] = self._epoch
 
-        for X_batch, y_batch in batch_iterator(self.X_train_, self.y_train_, batch_size=self.batch_size):
+        for X_batch, y_batch in self._batches():
             self._on_batch_begin()
 
-            y_out = self._compute_output(self._theta, X_batch)     
-            cost = self._compute_loss(self._theta, y_batch, y_out)
-            # Grab theta for the batch log before it is updated
-            log = {'batch': self._batch,'theta': self._theta, 
+            gradient = self._loss.gradient
+            if isinstance(X_batch, DataSource):
+                # The cost is computed along with the gradient, shard by shard
+                y_out = None
+                cost = None
+                gradient = self._source_gradient
+            # Reuse the output computed by a fast snapshot when the batch 
+            # is the full training set and theta has not since been updated.
+            elif self.batch_size is None and self._snapshot_batch == self._batch:
+                y_out = self._snapshot_y_out
+                cost = self._snapshot_cost
+            else:
+                y_out = self._compute_output(self._theta, X_batch)     
+                cost = self._compute_loss(self._theta, y_batch, y_out)
+                # A look-ahead optimizer evaluates the gradient at another
+                # point, at which y_out must be computed again.
+                if getattr(self._optimizer, 'lookahead', False):
+                    gradient = self._lookahead_gradient
+            # Grab theta for the batch log before it is updated in place
+            log = {'batch': self._batch,'theta': self._theta.copy(), 
                     'train_cost': cost}
             # Update the model parameters and return gradient for monitoring purposes.
-            self._theta, self._gradient = self._optimizer(gradient=self._loss.gradient, \
-                learning_rate=self._eta, theta=copy.copy(self._theta),  X=X_batch, y=y_batch,\
+            self._gradient = self._optimizer.update(gradient=gradient, \
+                learning_rate=self._eta, theta=self._theta,  X=X_batch, y=y_batch,\
                     y_out=y_out)                       
+            if cost is None:
+                log['train_cost'] = self._source_cost
             
             log['gradient_norm'] = np.linalg.norm(self._gradient) 
             self._on_batch_end(log=log)           
@@ -542,31 +878,254 @@ class GradientDescent(ABC, BaseEstimator):
 
 
     # ----------------------------------------------------------------------- #    
-    def fit(self, X, y):
+    def fit(self, X, y=None):
         """Trains model until stop condition is met.
         
         Parameters
         ----------
-        X : array-like, shape (n_samples, n_features)
-            Training data
-        y : numpy array, shape (n_samples,)
-            Target values 
+        X : array-like, shape (n_samples, n_features) or DataSource
+            Training data. A DataSource, which also provides the target,
+            is read one shard at a time, so that X need not fit in memory.
+        y : numpy array, shape (n_samples,) or None
+            Target values. Not used if X is a DataSource.
         Returns
         -------
         self : returns instance of self
         """        
         log = {'X': X, 'y': y}
-        self._on_train_begin(log)        
+        if self.warm_start and self._is_started():
+            self._on_warm_start(log)
+        else:
+            self._on_train_begin(log)        
 
-        while (self._epoch < self.epochs and not self._converged):            
+        while (self._epoch < self._final_epoch and not self._converged):            
             self.train_epoch()
 
         self._on_train_end()
         return self 
+
+    # ----------------------------------------------------------------------- #    
+    def partial_fit(self, X, y=None):
+        """Trains a single epoch on a batch of data.
+
+        The first call initializes the estimator as fit does, but trains 
+        on all of the batch, holding out no validation set. Subsequent 
+        calls process only the batch, with the label encoders fitted by the
+        first, and continue from the current theta and optimizer state. The
+        first batch given to a classifier must therefore contain every class.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_samples, n_features)
+            A batch of training data.
+        y : numpy array, shape (n_samples,)
+            Target values of the batch.
+        Returns
+        -------
+        self : returns instance of self
+        """
+        if not self._is_started():
+            validation.validate_estimator(self)
+            self._compile()
+            self._initialize_state()
+            self._prepare_train_data(X, y, self.random_state)
+            self._data_prepared = True
+            self._fit_data = (X, y)
+            self._initialize_observers({'X': X, 'y': y})
+            self._theta = self._init_weights(self.theta_init)
+        else:
+            # A warm fit on other data must prepare them again
+            self._fit_data = (X, y)
+            X = validation.check_X(X)
+            if X.shape[1] != self.n_features_in_:
+                msg = "X has {n} features, but the estimator was fitted with {m}.".\
+                    format(n=X.shape[1], m=self.n_features_in_)
+                raise ValueError(msg)
+            self.X_train_, self.y_train_ = self._data_processor.process_batch(X, y)
+            self._snapshot_batch = None
+        # The batch is always evaluated, as the last epoch of a fit is
+        self._final_epoch = self._epoch + 1
+        self._converged = False
+        self.train_epoch()
+        self._post_parameters()
+        return self
+
+    # ----------------------------------------------------------------------- #    
+    def _alpha_grid(self, n_alphas, eps):
+        """Returns alphas from alpha_max down to eps * alpha_max on a log scale.
+
+        alpha_max is the smallest alpha for which theta = 0 satisfies the
+        optimality conditions of the L1 penalty. At theta = 0, the gradient
+        of every regularizer is zero, so the gradient of the loss is that of
+        the data alone.
+        """
+        regularizer = self._loss.regularizer
+        ratio = 1 if isinstance(regularizer, L1) else getattr(regularizer, 'ratio', 0)
+        if not ratio:
+            raise ValueError("The alphas of a path without an L1 penalty must "
+                             "be given.")
+        theta = np.zeros_like(self._theta)
+        if isinstance(self.X_train_, DataSource):
+            gradient = self._source_gradient(theta, self.X_train_, self.y_train_)
+        else:
+            y_out = self._compute_output(theta, self.X_train_)
+            gradient = self._loss.gradient(theta, self.X_train_, self.y_train_,
+                                           y_out)
+        alpha_max = np.max(np.abs(gradient)) / ratio
+        return np.geomspace(alpha_max, alpha_max * eps, n_alphas)
+
+    # ----------------------------------------------------------------------- #    
+    def _gradient_descent_path(self, alphas, tol):
+        """Trains at each alpha in turn, from the theta of the previous."""
+        thetas = np.empty((len(alphas),) + self._theta.shape, dtype=self._theta.dtype)
+        n_iter = np.zeros(len(alphas), dtype=int)
+        for i, alpha in enumerate(alphas):
+            self._loss.regularizer.alpha = float(alpha)
+            start = self._epoch
+            self._final_epoch = start + self.epochs
+            self._converged = False
+            # Costs carried forward are those of the previous alpha
+            self._snapshot_time = None
+            self._snapshot_batch = None
+            previous = None
+            while self._epoch < self._final_epoch and not self._converged:
+                self.train_epoch()
+                if not self._epoch_log['evaluated']:
+                    continue
+                cost = self._epoch_log['train_cost']
+                if previous is not None and \
+                    abs(previous - cost) <= tol * abs(previous):
+                    break
+                previous = cost
+            thetas[i] = self._theta
+            n_iter[i] = self._epoch - start
+        return thetas, n_iter
+
+    # ----------------------------------------------------------------------- #    
+    def _coordinate_descent_path(self, alphas, tol):
+        """Solves each alpha by coordinate descent. Not supported by default."""
+        msg = "The coordinate descent solver is not supported by {c}.".format(
+            c=self.__class__.__name__)
+        raise ValueError(msg)
+
+    # ----------------------------------------------------------------------- #    
+    def _path_solver(self):
+        """Returns the solver selected by solver='auto' for the prepared data."""
+        return 'gd'
+
+    # ----------------------------------------------------------------------- #    
+    def regularization_path(self, X, y=None, alphas=None, n_alphas=100, 
+                            eps=1e-3, tol=1e-4, solver='auto'):
+        """Fits the estimator along a decreasing sequence of alphas.
+
+        The estimator is compiled and the data are prepared once for the 
+        whole path. Starting from theta = 0, unless theta_init is given, 
+        each alpha is fitted with a warm start from the solution for the
+        previous, so that most need only a few epochs. Training at an alpha
+        stops after epochs epochs, or once the training cost changes by 
+        less than tol, relative to the cost, over an epoch. The estimator 
+        is left fitted at the last alpha, which is recorded in alpha_. The
+        alpha of the loss' regularizer is left unchanged.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data.
+
+        y : array-like of shape (n_samples,)
+            Target values.
+
+        alphas : array-like or None (default=None)
+            The regularization strengths of the loss' regularizer, which 
+            are fitted in decreasing order. If None, n_alphas values spaced
+            evenly on a log scale from alpha_max, at which the L1 penalty 
+            sets every parameter to zero, down to eps * alpha_max. The 
+            alphas must be given for an L2 regularizer.
+
+        n_alphas : int (default=100)
+            The number of alphas if alphas is None.
+
+        eps : float (default=1e-3)
+            The ratio of the smallest to the largest alpha if alphas is None.
+
+        tol : float (default=1e-4)
+            The tolerance for the optimization at each alpha.
+
+        solver : str 'auto', 'gd' or 'cd' (default='auto')
+            'gd' trains with the estimator's optimizer. 'cd' solves each
+            alpha by cyclic coordinate descent on the Gram matrix of the 
+            training data, which is computed once for the whole path. 'cd'
+            is supported by GDRegressor with L1 and L1_L2 regularizers and
+            data in memory, for which 'auto' selects it, and is much 
+            faster than 'gd' on such paths. Otherwise, 'auto' selects 'gd'.
+
+        Returns
+        -------
+        alphas : ndarray of shape (n_alphas,)
+            The alphas, in decreasing order.
+
+        thetas : ndarray of shape (n_alphas, n_features) or (n_alphas, n_features, n_classes)
+            The parameters fitted at each alpha, including the bias.
+
+        n_iter : ndarray of shape (n_alphas,)
+            The epochs, or coordinate descent sweeps, at each alpha.
+        """
+        validation.validate_string(solver, 'solver', ['auto', 'gd', 'cd'])
+        validation.validate_range(tol, 'tol', minimum=0, left='open')
+        if self.loss.regularizer is None:
+            raise ValueError("A regularization path requires a loss with a "
+                             "regularizer.")
+        self._on_train_begin({'X': X, 'y': y})
+        if self.theta_init is None:
+            self._theta.fill(0)
+        if alphas is None:
+            validation.validate_int(n_alphas, 'n_alphas', minimum=1, left='closed')
+            validation.validate_range(eps, 'eps', minimum=0, maximum=1)
+            alphas = self._alpha_grid(n_alphas, eps)
+        else:
+            alphas = np.sort(np.asarray(alphas, dtype=float).ravel())[::-1]
+        if solver == 'auto':
+            solver = self._path_solver()
+        elif solver == 'gd' and self._path_solver() == 'cd':
+            msg = "Gradient descent may take many times the epochs of a "\
+                "single fit along an L1 path. Coordinate descent, "\
+                "solver='cd', is much faster."
+            warnings.warn(msg, UserWarning)
+        # The path sets the alpha of the regularizer, which is restored
+        alpha = self._loss.regularizer.alpha
+        try:
+            if solver == 'cd':
+                thetas, n_iter = self._coordinate_descent_path(alphas, tol)
+            else:
+                thetas, n_iter = self._gradient_descent_path(alphas, tol)
+            self._loss.regularizer.alpha = float(alphas[-1])
+            self._on_train_end()
+        finally:
+            self._loss.regularizer.alpha = alpha
+        self.alpha_ = float(alphas[-1])
+        return alphas, thetas, n_iter
     
+    # ----------------------------------------------------------------------- #    
+    def _predict_output(self, X):
+        """Computes the output of the fitted model for new data.
+
+        If the parameters are sparse, the columns of the features with 
+        non-zero parameters are taken from the unprocessed X, and the 
+        bias applied as an intercept, rather than adding a bias column to
+        all of X and multiplying by the zeros.
+        """
+        if self._support is not None and isinstance(X, np.ndarray) and \
+            X.ndim == 2 and X.shape[1] == self.n_features_in_:
+            X = validation.check_X(X)
+            return self._compute_output(self._support_theta, X[:, self._support])
+        X = self._check_X(X, self._theta)
+        return self._compute_output(self._theta, X)
+
     # ----------------------------------------------------------------------- #    
     def _check_X(self, X, theta):
         """Checks X to ensure that it has been processed for training/prediction."""
+        if isinstance(X, DataSource):
+            return X
         X = validation.check_X(X)        
         if X.shape[1] != theta.shape[0]:                
             data = self._data_processor.process_X_test_data(X)                    
@@ -658,6 +1217,79 @@ class GDRegressor(GradientDescent, RegressorMixin):
         tags['X_types'] = ['2darray']
         tags['poor_score'] = True
         return tags    
+
+    # --------------------------------------------------------------------------- #
+    def _gram(self):
+        """Returns X'X / m and X'y / m of the training data, bias included."""
+        X, y = self.X_train_, self.y_train_
+        if isinstance(X, DataSource):
+            raise ValueError("The coordinate descent solver requires the "
+                             "training data in memory.")
+        m = X.shape[0]
+        G = X.T.dot(X) / m
+        G = G.toarray() if sparse.issparse(G) else np.asarray(G)
+        c = np.asarray(X.T.dot(y)).ravel() / m
+        if self._data_processor.implicit_bias:
+            # Border the Gram matrix with the products of the bias column
+            means = np.asarray(X.mean(axis=0)).ravel()
+            G = np.block([[np.ones((1, 1)), means[np.newaxis, :]], 
+                          [means[:, np.newaxis], G]])
+            c = np.concatenate(([np.mean(y)], c))
+        return G.astype(self._dtype), c.astype(self._dtype)
+
+    # --------------------------------------------------------------------------- #
+    def _path_solver(self):
+        """Selects coordinate descent for L1 penalties on data in memory."""
+        if isinstance(self._loss.regularizer, (L1, L1_L2)) and \
+            not isinstance(self.X_train_, DataSource):
+            return 'cd'
+        return 'gd'
+
+    # --------------------------------------------------------------------------- #
+    def _coordinate_descent_path(self, alphas, tol):
+        """Solves each alpha by cyclic coordinate descent.
+
+        Minimizes the quadratic loss plus alpha * (ratio * |theta|_1 + 
+        (1 - ratio) / 2 * |theta|_2^2), whose gradient is that computed by 
+        the L1 and L1_L2 regularizers. The Gram matrix is computed once, 
+        so that a sweep over the coordinates costs O(n_features^2) whatever
+        the number of observations. A sweep counts as an epoch.
+        """
+        regularizer = self._loss.regularizer
+        if isinstance(regularizer, L1_L2):
+            ratio = regularizer.ratio
+        elif isinstance(regularizer, L1):
+            ratio = 1.0
+        else:
+            raise ValueError("The coordinate descent solver supports the L1 "
+                             "and L1_L2 regularizers.")
+        G, c = self._gram()
+        diag = np.diag(G)
+        theta = self._theta
+        # Maintains q = G theta through rank one updates
+        q = G.dot(theta)
+        thetas = np.empty((len(alphas),) + theta.shape, dtype=theta.dtype)
+        n_iter = np.zeros(len(alphas), dtype=int)
+        for i, alpha in enumerate(alphas):
+            l1, l2 = alpha * ratio, alpha * (1 - ratio)
+            for sweep in range(self.epochs):
+                max_delta = 0.0
+                for j in range(len(theta)):
+                    if diag[j] == 0:
+                        continue
+                    rho = c[j] - q[j] + diag[j] * theta[j]
+                    new = np.sign(rho) * max(abs(rho) - l1, 0.0) / (diag[j] + l2)
+                    delta = new - theta[j]
+                    if delta != 0:
+                        theta[j] = new
+                        q += delta * G[:, j]
+                        max_delta = max(max_delta, abs(delta))
+                if max_delta <= tol * np.max(np.abs(theta)):
+                    break
+            thetas[i] = theta
+            n_iter[i] = sweep + 1
+            self._epoch += sweep + 1
+        return thetas, n_iter
     
     # --------------------------------------------------------------------------- #
     def predict(self, X):
@@ -676,8 +1308,7 @@ class GDRegressor(GradientDescent, RegressorMixin):
         y_pred : array-like of shape (n_samples, )
         
         """                        
-        X = self._check_X(X, self._theta)
-        y_pred = self._compute_output(self._theta, X)
+        y_pred = self._predict_output(X)
         y_pred = self._check_y_pred(y_pred)
         return y_pred
     
@@ -732,12 +1363,12 @@ class GDBinaryclass(GradientDescent, ClassifierMixin):
         
     def _unpack_data(self, data):
         """Unpacks the data into attributes."""
-        super(GDMulticlass, self)._unpack_data(data)
+        super(GDBinaryclass, self)._unpack_data(data)
         self.classes_ = data['y_train_']['metadata']['orig']['classes']
         self.n_classes_ = data['y_train_']['metadata']['orig']['n_classes']                
 
     # --------------------------------------------------------------------------- #        
-    def compute_output(self, theta, X):
+    def _activate(self, z):
         """Computes output as a probability of the positive class.
 
         The logit or linear combination of inputs and parameters is passed
@@ -746,19 +1377,22 @@ class GDBinaryclass(GradientDescent, ClassifierMixin):
 
         Parameters
         ----------
-        theta : array_like of shape (n_features,) or (n_features, n_classes)
-            The current learned parameters of the model.
-
-        X : array-like of shape (n_samples, n_features)
-            The input data
+        z : array_like of shape (n_samples,)
+            The linear combination of the inputs and parameters.
         
         Returns
         -------
         y_out
         """
-        z = super(GDBinaryclass, self)._compute_output(theta, X)        
         return self._activation(z)
 
+    # --------------------------------------------------------------------------- #        
+    def _output_to_prediction(self, y_out):
+        """Converts probabilities to classes unless the scorer takes probabilities."""
+        if self._scorer.is_probability_metric:
+            return y_out
+        return np.where(y_out >= 0.5, 1, 0)
+
     # --------------------------------------------------------------------------- #      
     def _check_y(self, y):
         """Confirms y has been encoded."""
@@ -783,9 +1417,9 @@ class GDBinaryclass(GradientDescent, ClassifierMixin):
         y_pred : array-like of shape (n_samples, )
         
         """                
-        return self.predict(X, self._theta)
+        return np.where(self.predict_proba(X) >= 0.5, 1, 0)
 
-    def predict_proba(self, X, theta):
+    def predict_proba(self, X):
         """Predicts the probability of the positive class
 
         Parameters
@@ -793,15 +1427,11 @@ class GDBinaryclass(GradientDescent, ClassifierMixin):
         X : array-like of shape (n_samples, n_features)
             The input data
 
-        theta : array_like of shape (n_features,) or (n_features, n_classes)
-            The current learned parameters of the model.
-
         Returns
         -------
         y_pred : Predicted class probability
         """
-        X = self._check_X(X, theta)
-        y_pred = self._compute_output(theta, X)     
+        y_pred = self._predict_output(X)
         y_pred = self._check_y_pred(y_pred)
         return y_pred       
 
@@ -873,7 +1503,7 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
         return {'binary_only': True}    
     
     # --------------------------------------------------------------------------- #
-    def init_weights(self, theta_init=None):
+    def _init_weights(self, theta_init=None):
         """Initializes parameters to theta_init or to random values.
         
         Parameters
@@ -895,11 +1525,12 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
         if theta_init is not None:
             assert theta_init.shape == (self.n_features_out_, self.n_classes_),\
                 "Initial parameters theta must have shape (n_features,n_classes)."
-            theta = theta_init
+            # Copy, since the optimizer updates theta in place
+            theta = np.array(theta_init, dtype=self._dtype)
         else:
             # Random initialization of weights
             rng = np.random.RandomState(self.random_state)                
-            theta = rng.randn(self.n_features_out_, self.n_classes_) 
+            theta = rng.randn(self.n_features_out_, self.n_classes_).astype(self._dtype) 
             # Set the bias initialization to zero
             theta[0] = 0
         return theta 
@@ -911,7 +1542,7 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
         self.n_classes_ = data['y_train_']['metadata']['orig']['n_classes']                
     
     # --------------------------------------------------------------------------- #
-    def _compute_output(self, theta, X):
+    def _activate(self, z):
         """Computes output as a vector of class probabilities.
 
         The unnormalized linear combination of inputs and parameters is passed
@@ -919,18 +1550,21 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
 
         Parameters
         ----------
-        theta : array_like of shape (n_features,) or (n_features, n_classes)
-            The current learned parameters of the model.
-
-        X : array-like of shape (n_samples, n_features)
-            The input data
+        z : array_like of shape (n_samples, n_classes)
+            The linear combination of the inputs and parameters.
         
         Returns
         -------
         y_out
         """      
-        z = super(GDMulticlass, self)._compute_output(theta, X)
         return self._activation(z)     
+
+    # --------------------------------------------------------------------------- #
+    def _output_to_prediction(self, y_out):
+        """Converts probabilities to classes unless the scorer takes probabilities."""
+        if self._scorer.is_probability_metric:
+            return y_out
+        return y_out.argmax(axis=1)
     # --------------------------------------------------------------------------- #
     def _check_y(self, y):
         """Confirms y has been one-hot encoded."""
@@ -956,7 +1590,7 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
         y_pred : Predicted class
         """
                    
-        o = self.predict_proba(X, self._theta)
+        o = self.predict_proba(X)
         return o.argmax(axis=1)
 
     # --------------------------------------------------------------------------- #
@@ -976,8 +1610,7 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
         y_pred : array-like of shape (n_samples, )
         
         """        
-        X = self._check_X(X, theta)
-        return self._compute_output(theta, X)  
+        return self._predict_output(X)
 
     def score(self, X, y):
         """Computes scores for test data after training.
@@ -1008,11 +1641,61 @@ class GDMulticlass(GradientDescent, ClassifierMixin):
 #                    GRADIENT DESCENT PURE OPTIMIZER                          #
 # =========================================================================== #
 class GD(BaseEstimator):
-    """Performs pure optimization of an objective function."""
+    """Performs pure optimization of an objective function.
+
+    Parameters
+    ----------
+    eta0 : float (default=0.01)
+        The initial learning rate.
+
+    epochs : int (default=1000)
+        The number of epochs to execute.
+
+    theta_init : array-like of shape (n_dims,), (K, n_dims) or None (default=None)
+        The starting point, or K starting points advanced together. If None,
+        a random point is drawn, or n_starts points if n_starts is set.
+
+    objective : a Benchmark object
+        The objective function to be minimized.
+
+    optimizer : an Optimizer object or None (default=None)
+        The optimization algorithm. If None, the generic 
+        GradientDescentOptimizer is used.
+
+    learning_rate : LearningRateSchedule object or None (default=None)
+        An optional learning rate schedule.
+
+    blackbox : BlackBox object or None (default=None)
+        Records the epoch log. If None, a BlackBox is created.
+
+    verbose : bool (default=False)
+        Not used.
+
+    random_state : int or None (default=None)
+        Seed for the random starting point.
+
+    n_starts : int or None (default=None)
+        If set and theta_init is None, the number of starting points drawn
+        uniformly from the range of the objective and optimized together
+        as a (K, n_dims) array.
+
+    tol : float or None (default=None)
+        A start whose gradient norm falls below tol has converged and is
+        no longer updated. Training ends when all starts have converged.
+
+    Notes
+    -----
+    In multi-start mode, theta_ has shape (K, n_dims) and the boolean
+    mask converged_ marks the starts that have converged. The epoch log
+    records the costs of all starts in 'costs', the lowest of them in
+    'train_cost', the largest gradient norm of the starts still being
+    updated in 'gradient_norm', and their number in 'n_active'.
+    """
 
     def __init__(self, eta0=0.01, epochs=1000, theta_init=None,
                  objective=None,  optimizer=None,  learning_rate=None,
-                 blackbox=None, verbose=False, random_state=None):
+                 blackbox=None, verbose=False, random_state=None,
+                 n_starts=None, tol=None):
 
         self.eta0 = eta0
         self.learning_rate=learning_rate
@@ -1020,20 +1703,128 @@ class GD(BaseEstimator):
         self.objective = objective
         self.theta_init = theta_init
         self.optimizer = optimizer
+        self.blackbox = blackbox
         self.verbose = verbose
         self.random_state = random_state               
+        self.n_starts = n_starts
+        self.tol = tol
+
+    # ----------------------------------------------------------------------- #
+    @property
+    def eta(self):
+        return self._eta
+
+    @eta.setter  
+    def eta(self, x):
+        self._eta = x
+
+    @property
+    def converged(self):
+        return self._converged
+
+    @converged.setter
+    def converged(self, x):
+        self._converged = x
+
+    @property
+    def theta(self):
+        return self._theta
+
+    def get_blackbox(self):
+        return self._blackbox
+
+    # ----------------------------------------------------------------------- #
+    def _compile(self):
+        """Makes copies of mutable parameters and makes them private members."""
+        self._eta = self.learning_rate.eta0 if self.learning_rate else self.eta0
+        self._objective = copy.deepcopy(self.objective)
+        self._optimizer = copy.deepcopy(self.optimizer) if self.optimizer \
+            else GradientDescentOptimizer()
+        self._learning_rate = copy.deepcopy(self.learning_rate)
+        self._blackbox = copy.deepcopy(self.blackbox) if self.blackbox \
+            else BlackBox()
+        self._observers = [o for o in (self._blackbox, self._learning_rate) if o]
 
     # ----------------------------------------------------------------------- #
     def _init_weights(self):
         """Initializes parameters."""
+        n_dims = getattr(self._objective, 'n_dims', 2)
         if self.theta_init is not None:
-            if self.theta_init.shape[0] != 2:
-                raise ValueError("Parameters theta must have shape (2,)")
+            theta = np.array(self.theta_init, dtype=float)
+            if theta.ndim not in (1, 2) or theta.shape[-1] != n_dims:
+                raise ValueError("Parameters theta must have shape ({d},) or "
+                                 "(n_starts, {d})".format(d=n_dims))
             else:
-                self._theta = self.theta_init
+                self._theta = theta
+        elif self.n_starts:
+            validation.validate_int(param=self.n_starts, param_name='n_starts',
+                                    minimum=1, left='closed', right='open')
+            rng = np.random.RandomState(self.random_state)
+            x, y = self._objective.range
+            low = np.resize([x['min'], y['min']], n_dims)
+            high = np.resize([x['max'], y['max']], n_dims)
+            self._theta = rng.uniform(low, high, size=(self.n_starts, n_dims))
         else:            
             rng = np.random.RandomState(self.random_state)         
-            self._theta = rng.randn(2)    
+            self._theta = rng.randn(n_dims)    
+        self._multi_start = self._theta.ndim == 2
+        # Starts that are still being updated
+        self._active = np.ones(self._theta.shape[:-1], dtype=bool)
+        self._optimizer.set_multi_start(self._multi_start)
+
+    # ----------------------------------------------------------------------- #
+    def _on_train_begin(self):
+        """Compiles the estimator and initializes state and observers."""
+        self._compile()
+        self._epoch = 0
+        self._gradient = None
+        self._converged = False
+        self._init_weights()
+        for observer in self._observers:
+            observer.set_model(self)
+            observer.on_train_begin()
+
+    # ----------------------------------------------------------------------- #
+    def _on_epoch_begin(self):
+        for observer in self._observers:
+            observer.on_epoch_begin(epoch=self._epoch)
+
+    # ----------------------------------------------------------------------- #
+    def _on_epoch_end(self, cost, theta, gradient_norm):
+        """Logs the cost at the parameters theta from which the epoch began."""
+        log = {'epoch': self._epoch, 'eta': self._eta, 'theta': theta}
+        if self._multi_start:
+            log['costs'] = cost
+            log['train_cost'] = np.min(cost)
+            log['gradient_norm'] = np.max(gradient_norm, initial=0, 
+                                          where=self._active)
+            log['n_active'] = int(self._active.sum())
+        else:
+            log['train_cost'] = cost
+            log['gradient_norm'] = gradient_norm
+        for observer in self._observers:
+            observer.on_epoch_end(epoch=self._epoch, log=log)
+        self._epoch += 1
+
+    # ----------------------------------------------------------------------- #
+    def _on_train_end(self):
+        self.theta_ = self._theta
+        self.n_iter_ = self._epoch
+        if self._multi_start:
+            self.converged_ = ~self._active
+        for observer in self._observers:
+            observer.on_train_end()
+
+    # ----------------------------------------------------------------------- #
+    def _check_convergence(self, theta, gradient_norm):
+        """Freezes the starts whose gradient norm has fallen below tol.
+
+        Converged starts are restored to theta, the parameters from which
+        the epoch began, so that they remain where they converged.
+        """
+        self._active &= gradient_norm >= self.tol
+        np.copyto(self._theta, theta, where=~self._active[..., np.newaxis])
+        self._converged = self._converged or not self._active.any()
 
     # ----------------------------------------------------------------------- #            
     def fit(self, X=None, y=None):
@@ -1041,8 +1832,8 @@ class GD(BaseEstimator):
         
         Parameters
         ----------
-        objective : object derived from Objective class
-            The objective function to be optimized
+        X, y : None
+            Not used. The objective function is a parameter of the estimator.
 
         Returns
         -------
@@ -1055,12 +1846,17 @@ class GD(BaseEstimator):
 
             self._on_epoch_begin()
 
-            cost = self._objective(self._theta)
+            theta = self._theta
+            cost = self._objective(theta)
 
             self._theta, self._gradient = self._optimizer(gradient=self._objective.gradient, \
-                    learning_rate=self._eta, theta=copy.deepcopy(self._theta))                    
+                    learning_rate=self._eta, theta=self._theta)                    
+
+            gradient_norm = np.linalg.norm(self._gradient, axis=-1)
+            if self.tol is not None:
+                self._check_convergence(theta, gradient_norm)
 
-            self._on_epoch_end()
+            self._on_epoch_end(cost, theta, gradient_norm)
 
         self._on_train_end()
         return self   
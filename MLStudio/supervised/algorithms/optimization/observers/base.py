@@ -49,10 +49,13 @@ class ObserverList(ABC, BaseEstimator):
         observers : list
             List of 'Observer' instances.        
         """
-        self._observers = observers or []                        
+        self._observers = [] if observers is None else observers
         self.params = {}
         self.model = None
 
+    @property
+    def observers(self):
+        return self._observers
 
     def append(self, observer):
         """Appends observer to list of observers.
@@ -420,6 +423,12 @@ class PerformanceObserver(Observer):
             Dictionary containing the data, cost, batch size and current weights
         """                  
         log = log or {}   
+
+        # Costs and scores carried forward between performance snapshots
+        # contain no new information.
+        if log.get('evaluated') is False and self.monitor != 'gradient_norm':
+            self._stabilized = False
+            return
         
         # Obtain current performance
         current = self._get_current_value(log)
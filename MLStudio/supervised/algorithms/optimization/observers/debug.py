@@ -18,7 +18,23 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
-"""Call back that performs gradient checking."""
+"""Call back that performs gradient checking.
+
+The gradient is compared with a central finite difference approximation
+in one of three modes:
+
+    Mode          Evaluations of the cost
+    -----------   --------------------------------------------------------
+    full          Two per parameter.
+    subset        Two per parameter, for n_coordinates random parameters.
+    directional   Two, along a single random direction.
+
+Since the output of the model is a function of the linear combination of
+the inputs and parameters, perturbing a parameter shifts that linear
+combination by a column of X. The shifts of batch_size parameters are
+therefore computed in a single product with X, and each perturbed cost is
+computed from them without a further pass over X.
+"""
 import copy
 import numpy as np
 import pandas as pd
@@ -27,17 +43,59 @@ from scipy.sparse import issparse
 from mlstudio.supervised.algorithms.optimization.observers.base import Observer
 from mlstudio.supervised.algorithms.optimization.services.loss import Loss
 from mlstudio.utils.validation import is_valid_array_size
+from mlstudio.utils.validation import validate_int, validate_string
 
 # --------------------------------------------------------------------------- #
 class GradientCheck(Observer):
-    """Performs gradient checking."""
+    """Performs gradient checking.
+
+    Parameters
+    ----------
+    iterations : int (default=50)
+        The number of epochs between checks.
+
+    epsilon : float (default=10e-7)
+        The step of the finite differences and the largest relative 
+        difference between the gradient and its approximation that passes.
+
+    verbose : bool (default=False)
+        Whether to print a summary of the checks at the end of training.
 
-    def __init__(self, iterations=50, epsilon=10e-7, verbose=False):
+    mode : str 'full', 'subset', or 'directional' (default='full')
+        Whether to check every partial derivative, n_coordinates randomly
+        chosen partial derivatives, or the derivative along one random
+        direction at each check.
+
+    n_coordinates : int (default=10)
+        The number of partial derivatives checked in 'subset' mode.
+
+    batch_size : int (default=100)
+        The number of parameters whose perturbations are computed together,
+        which bounds the memory of the shifts at n_samples x batch_size.
+
+    random_state : int or None (default=None)
+        Seed for the choice of coordinates and directions.
+    """
+
+    def __init__(self, iterations=50, epsilon=10e-7, verbose=False, mode='full',
+                 n_coordinates=10, batch_size=100, random_state=None):
         super(GradientCheck, self).__init__()
         self.epsilon = epsilon
         self.iterations = iterations
         self.verbose = verbose
+        self.mode = mode
+        self.n_coordinates = n_coordinates
+        self.batch_size = batch_size
+        self.random_state = random_state
         self.name = "GradientCheck"
+
+    def _validate(self):
+        validate_string(param=self.mode, param_name='mode', 
+                        valid_values=['full', 'subset', 'directional'])
+        validate_int(param=self.n_coordinates, param_name='n_coordinates',
+                     minimum=1, left='closed', right='open')
+        validate_int(param=self.batch_size, param_name='batch_size',
+                     minimum=1, left='closed', right='open')
         
     def on_train_begin(self, log=None):        
         """Initializes gradient check parameters.
@@ -48,6 +106,8 @@ class GradientCheck(Observer):
             Contains no information
         """
         super(GradientCheck, self).on_train_begin()        
+        self._validate()
+        self._rng = np.random.RandomState(self.random_state)
         self._n = 0
         self._iteration = []
         self._theta = []
@@ -61,74 +121,108 @@ class GradientCheck(Observer):
         self._abs_differences = []
         self._rel_differences = []
         self._results = []    
-        # Obtain a copy of the loss function and turn gradient_scaling off
-        try:
-            self._objective = copy.deepcopy(self.model.task.loss)
-        except:
+        # Obtain a copy of the loss function and turn gradient scaling off
+        if hasattr(self.model, '_loss'):
+            self._objective = copy.deepcopy(self.model._loss)
+            self._objective.gradient_scaling = False
+            # The gradient checked includes any penalty left to a proximal step
+            if self._objective.regularizer:
+                self._objective.regularizer.set_proximal(False)
+        else:
             self._objective = copy.deepcopy(self.model.objective)
-        self._objective.gradient_scaling = False
+            self._objective.gradient_scaler = None
+
+    def _coordinates(self, theta):
+        """Returns the flat indices of the parameters to be checked."""
+        if self.mode == 'subset' and self.n_coordinates < theta.size:
+            return np.sort(self._rng.choice(theta.size, self.n_coordinates, 
+                                            replace=False))
+        return np.arange(theta.size)
+
+    def _direction(self, theta):
+        """Returns a random unit direction in the shape of theta."""
+        direction = self._rng.randn(*theta.shape)
+        return direction / np.linalg.norm(direction)
+
+    def _cost_at(self, theta, y, z):
+        """Computes the cost at theta from the linear output z."""
+        return self._objective.cost(theta, y, self.model._activate(z))
 
     def _check_cost_functions(self, log):
         """Computes gradient and approximation for cost functions."""
-        X = self.model.X_train
-        y = self.model.y_train
-        theta = log.get('theta')               
+        X = self.model.X_train_
+        y = self.model.y_train_
+        theta = np.array(log.get('theta'), dtype=float)
+        h = self.epsilon
 
-        cost = []
+        # Compute cost and gradient for current parameters
+        z = self.model._linear_output(theta, X)
+        J = self._cost_at(theta, y, z)
+        grad = self._objective.gradient(theta, X, y, self.model._activate(z))
+
+        if self.mode == 'directional':
+            # The linear output is linear in theta, so z shifts by z(direction)
+            direction = self._direction(theta)
+            dz = self.model._linear_output(direction, X)
+            J_plus = self._cost_at(theta + h * direction, y, z + h * dz)
+            J_minus = self._cost_at(theta - h * direction, y, z - h * dz)
+            grad_approx = [(J_plus - J_minus) / (2 * h)]
+            return [np.sum(grad * direction)], grad_approx, [J], [J_plus], [J_minus]
+
+        coordinates = self._coordinates(theta)
         cost_plus = []
         cost_minus = []
         grad_approx = []
-        # Compute cost for current parameters
-        y_pred = self.model.task.compute_output(theta, X)
-        J = self._objective(theta, y, y_pred)        
-        for i in np.arange(len(theta)):
-            # Compute theta differentials
-            theta_plus = theta.copy()
-            theta_minus = theta.copy()
-            theta_plus[i] = theta_plus[i] + self.epsilon
-            theta_minus[i] = theta_minus[i] - self.epsilon
-            # Compute associated costs
-            y_pred = self.model.task.compute_output(theta_plus, X)
-            J_plus = self._objective(theta_plus, y, y_pred)
-            y_pred = self.model.task.compute_output(theta_minus, X)
-            J_minus = self._objective(theta_minus, y, y_pred)
-            # Store costs
-            cost.append(J)
-            cost_plus.append(J_plus)
-            cost_minus.append(J_minus)        
-            # Estimate the gradient
-            grad_approx_i = (J_plus - J_minus) / (2 * self.epsilon)         
-            grad_approx.append(grad_approx_i)
-        
-        # Compute gradient via back-propagation
-        y_pred = self.model.task.compute_output(theta, X)
-        grad = self._objective.gradient(theta, X, y, y_pred)         
-        return grad, grad_approx, cost, cost_plus, cost_minus
+        for start in range(0, len(coordinates), self.batch_size):
+            batch = coordinates[start:start + self.batch_size]
+            if theta.ndim == 1:
+                rows, cols = batch, None
+            else:
+                rows, cols = np.unravel_index(batch, theta.shape)
+            # Column j holds the shift of z per unit change of parameter j
+            E = np.zeros((theta.shape[0], len(batch)))
+            E[rows, np.arange(len(batch))] = 1
+            D = self.model._linear_output(E, X)
+            for j, i in enumerate(batch):
+                theta_plus = theta.copy()
+                theta_minus = theta.copy()
+                theta_plus.flat[i] += h
+                theta_minus.flat[i] -= h
+                z_plus = z.copy()
+                z_minus = z.copy()
+                if cols is None:
+                    z_plus += h * D[:, j]
+                    z_minus -= h * D[:, j]
+                else:
+                    z_plus[:, cols[j]] += h * D[:, j]
+                    z_minus[:, cols[j]] -= h * D[:, j]
+                cost_plus.append(self._cost_at(theta_plus, y, z_plus))
+                cost_minus.append(self._cost_at(theta_minus, y, z_minus))
+                grad_approx.append((cost_plus[-1] - cost_minus[-1]) / (2 * h))
+        cost = [J] * len(coordinates)
+        return grad.ravel()[coordinates], grad_approx, cost, cost_plus, cost_minus
 
     def _check_benchmark_functions(self, log):
         """Computes gradient and approximation for benchmark functions."""
-        theta = log.get('theta') 
+        theta = np.array(log.get('theta'), dtype=float)
+        h = self.epsilon
         cost = None
         cost_plus = None
         cost_minus = None             
-        grad_approx = []
-        for i in np.arange(len(theta)):
-
-            # Compute theta differentials
-            theta_plus = theta.copy()
-            theta_minus = theta.copy()
-            theta_plus[i] = theta_plus[i] + self.epsilon
-            theta_minus[i] = theta_minus[i] - self.epsilon
-            # Compute associated costs            
-            J_plus = self._objective(theta_plus)            
-            J_minus = self._objective(theta_minus)
-            # Estimate the gradient
-            grad_approx_i = (J_plus - J_minus) / (2 * self.epsilon)         
-            grad_approx.append(grad_approx_i)
-        
-        # Compute gradient via back-propagation        
         grad = self._objective.gradient(theta)         
-        return grad, grad_approx, cost, cost_plus, cost_minus
+
+        if self.mode == 'directional':
+            direction = self._direction(theta)
+            J_plus = self._objective(theta + h * direction)
+            J_minus = self._objective(theta - h * direction)
+            grad_approx = [(J_plus - J_minus) / (2 * h)]
+            return [np.sum(grad * direction)], grad_approx, cost, cost_plus, cost_minus
+
+        # Benchmarks evaluate the perturbed points as a single batch
+        coordinates = self._coordinates(theta)
+        E = np.eye(theta.size)[coordinates] * h
+        grad_approx = (self._objective(theta + E) - self._objective(theta - E)) / (2 * h)
+        return grad[coordinates], grad_approx, cost, cost_plus, cost_minus
 
     def on_epoch_end(self, epoch, log=None):
         """Checks gradient each self.iterations number of iterations.
@@ -16,26 +16,334 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 nov8.ai                                                  #
 # =========================================================================== #
-"""Module containing observers that monitor and report on optimization."""
+"""Module containing observers that monitor and report on optimization.
+
+Logs are stored column by column in a History object rather than as lists 
+of Python objects. Numeric scalars are written to preallocated NumPy 
+buffers that grow geometrically, so a million batch run stores a few 
+megabytes per key. Array values such as theta and the gradient are stored 
+as rows of a 2D buffer, subject to an optional downsampling policy, which
+keeps every k-th row, and an optional retention limit, which turns the 
+buffer into a ring holding the most recent rows. Values that are not 
+numeric, such as None, are stored in object buffers.
+"""
+from collections.abc import Mapping
 import datetime
+import numbers
+
 import numpy as np
+import pandas as pd
+
 from mlstudio.supervised.algorithms.optimization.observers.base import Observer
+from mlstudio.utils.validation import validate_int
+# --------------------------------------------------------------------------- #
+#                                 COLUMNS                                     #
+# --------------------------------------------------------------------------- #
+class ScalarColumn:
+    """Growable buffer of scalar values.
+
+    The dtype is inferred from the first value and promoted as required,
+    from bool to integer to float. A value that is not numeric, such as
+    None, promotes the column to an object buffer.
+
+    Parameters
+    ----------
+    start : int
+        The row at which the column was first logged.
+
+    capacity : int (default=64)
+        The initial number of rows allocated.
+    """
+
+    def __init__(self, start, capacity=64):
+        self.start = start
+        self._capacity = capacity
+        self._buffer = None
+        self._n = 0
+
+    def _dtype(self, value):
+        if isinstance(value, (bool, np.bool_)):
+            return np.bool_
+        elif isinstance(value, numbers.Integral):
+            return np.int64
+        elif isinstance(value, numbers.Real):
+            return np.float64
+        return object
+
+    def append(self, value):
+        dtype = self._dtype(value)
+        if self._buffer is None:
+            self._buffer = np.empty(self._capacity, dtype=dtype)
+        elif dtype is object and self._buffer.dtype != object:
+            self._buffer = self._buffer.astype(object)
+        elif dtype is not object and self._buffer.dtype != object and \
+            np.promote_types(self._buffer.dtype, dtype) != self._buffer.dtype:
+            self._buffer = self._buffer.astype(
+                np.promote_types(self._buffer.dtype, dtype))
+        if self._n == len(self._buffer):
+            self._buffer = np.resize(self._buffer, 2 * len(self._buffer))
+        self._buffer[self._n] = value
+        self._n += 1
+
+    @property
+    def index(self):
+        return np.arange(self.start, self.start + self._n)
+
+    @property
+    def values(self):
+        return self._buffer[:self._n]
+
+    @property
+    def nbytes(self):
+        return self._buffer.nbytes
+
+# --------------------------------------------------------------------------- #
+class ArrayColumn:
+    """Buffer of array values, stored as rows of a single NumPy array.
+
+    Parameters
+    ----------
+    start : int
+        The row at which the column was first logged.
+
+    capacity : int (default=64)
+        The initial number of rows allocated.
+
+    downsample : int (default=1)
+        Only every downsample-th row is stored.
+
+    retain : int or None (default=None)
+        If not None, only the most recent retain rows are kept, in a 
+        ring buffer.
+    """
+
+    def __init__(self, start, capacity=64, downsample=1, retain=None):
+        self.start = start
+        self._capacity = capacity if retain is None else retain
+        self.downsample = downsample
+        self.retain = retain
+        self._buffer = None
+        self._rows = None
+        self._pending = []
+        self._seen = 0
+        self._n = 0
+
+    def _allocate(self, value):
+        if self.retain is None:
+            # Large arrays start with fewer rows to avoid overallocation 
+            self._capacity = int(np.clip(2**20 // max(value.nbytes, 1), 1, 
+                                         self._capacity))
+        self._buffer = np.empty((self._capacity,) + value.shape, 
+                                dtype=np.result_type(value.dtype, np.float32))
+        self._rows = np.empty(self._capacity, dtype=np.int64)
+        # Rows logged as None before the shape was known are filled with nan
+        for row in self._pending:
+            self._store(np.nan, row)
+        self._pending = []
+
+    def _store(self, value, row):
+        if self.retain is not None:
+            i = self._n % self.retain
+        else:
+            i = self._n
+            if i == len(self._buffer):
+                self._buffer = np.concatenate(
+                    (self._buffer, np.empty_like(self._buffer)))
+                self._rows = np.concatenate(
+                    (self._rows, np.empty_like(self._rows)))
+        self._buffer[i] = value
+        self._rows[i] = row
+        self._n += 1
+
+    def append(self, value):
+        row = self.start + self._seen
+        self._seen += 1
+        if (row - self.start) % self.downsample:
+            return
+        if value is None:
+            if self._buffer is None:
+                self._pending.append(row)
+            else:
+                self._store(np.nan, row)
+            return
+        value = np.asarray(value)
+        if self._buffer is None:
+            self._allocate(value)
+        elif value.shape != self._buffer.shape[1:]:
+            msg = "Expected an array of shape {e}, received {r}.".format(
+                e=str(self._buffer.shape[1:]), r=str(value.shape))
+            raise ValueError(msg)
+        self._store(value, row)
+
+    def _ordered(self, buffer):
+        """Returns the stored rows in the order in which they were logged."""
+        if buffer is None:
+            return np.empty(0)
+        if self.retain is None or self._n <= self.retain:
+            return buffer[:self._n]
+        i = self._n % self.retain
+        return np.concatenate((buffer[i:], buffer[:i]))
+
+    @property
+    def index(self):
+        if self._buffer is None:
+            return np.array(self._pending, dtype=np.int64)
+        return self._ordered(self._rows)
+
+    @property
+    def values(self):
+        if self._buffer is None:
+            return np.array([None] * len(self._pending), dtype=object)
+        return self._ordered(self._buffer)
+
+    @property
+    def nbytes(self):
+        return 0 if self._buffer is None else \
+            self._buffer.nbytes + self._rows.nbytes
+
+# --------------------------------------------------------------------------- #
+#                                 HISTORY                                     #
+# --------------------------------------------------------------------------- #
+class History(Mapping):
+    """Columnar store of logs, accessed as a read-only dictionary of arrays.
+
+    Parameters
+    ----------
+    downsample : int (default=1)
+        Only every downsample-th value of an array key, such as theta, is
+        stored. Scalar keys are always stored in full.
+
+    retain : int or None (default=None)
+        If not None, only the most recent retain stored values of each 
+        array key are kept.
+    """
+
+    def __init__(self, downsample=1, retain=None):
+        self.downsample = downsample
+        self.retain = retain
+        self._columns = {}
+        self._n = 0
+
+    def append(self, log):
+        """Appends a log dictionary as a row of the history."""
+        for k, v in log.items():
+            column = self._columns.get(k)
+            is_array = isinstance(v, np.ndarray) and v.ndim > 0
+            if is_array and isinstance(column, ScalarColumn) and \
+                all(value is None for value in column.values):
+                # Keys such as the gradient are None until first computed
+                column = self._to_array_column(column)
+                self._columns[k] = column
+            if column is None:
+                if is_array:
+                    column = ArrayColumn(start=self._n, 
+                                         downsample=self.downsample,
+                                         retain=self.retain)
+                else:
+                    column = ScalarColumn(start=self._n)
+                self._columns[k] = column
+            column.append(v)
+        self._n += 1
+
+    def _to_array_column(self, column):
+        """Converts a column of None values to an array column."""
+        array_column = ArrayColumn(start=column.start, 
+                                   downsample=self.downsample,
+                                   retain=self.retain)
+        for _ in range(len(column.values)):
+            array_column.append(None)
+        return array_column
+
+    def __getitem__(self, key):
+        return self._columns[key].values
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    @property
+    def n_rows(self):
+        """The number of logs appended to the history."""
+        return self._n
+
+    @property
+    def nbytes(self):
+        """The number of bytes allocated to the column buffers."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def index(self, key):
+        """Returns the rows at which the stored values of key were logged."""
+        return self._columns[key].index
+
+    def to_frame(self, arrays=True):
+        """Returns the history as a DataFrame, with one row per log.
+
+        Parameters
+        ----------
+        arrays : bool (default=True)
+            If True, array keys are expanded into one column per element,
+            named key_0, key_1, and so on. Rows that were not stored are 
+            missing.
+
+        Returns
+        -------
+        df : pd.DataFrame
+        """
+        df = pd.DataFrame(index=pd.RangeIndex(self._n))
+        for k, column in self._columns.items():
+            values = column.values
+            if isinstance(column, ArrayColumn):
+                if not arrays or values.dtype == object:
+                    continue
+                values = values.reshape(len(values), -1)
+                names = [k + '_' + str(i) for i in range(values.shape[1])]
+                df = df.join(pd.DataFrame(values, index=column.index, 
+                                          columns=names))
+            else:
+                df[k] = pd.Series(values, index=column.index)
+        return df
+
 # --------------------------------------------------------------------------- #
 #                                BLACKBOX                                     #
 # --------------------------------------------------------------------------- #
 class BlackBox(Observer):
-    """Repository for data obtained during optimization."""
+    """Repository for data obtained during optimization.
+
+    Parameters
+    ----------
+    downsample : int (default=1)
+        Only every downsample-th value of array keys, such as theta and 
+        the gradient, is stored in the batch and epoch logs.
+
+    retain : int or None (default=None)
+        If not None, only the most recent retain stored values of array 
+        keys are kept in the batch and epoch logs.
+    """
 
-    def __init__(self):
+    def __init__(self, downsample=1, retain=None):
         super(BlackBox, self).__init__()
         self.name = "BlackBox"
+        self.downsample = downsample
+        self.retain = retain
         self.total_epochs = 0
         self.total_batches = 0
         self.start = None 
         self.end = None
         self.duration = None
-        self.epoch_log = {}
-        self.batch_log = {}            
+        self.epoch_log = History(downsample=downsample, retain=retain)
+        self.batch_log = History(downsample=downsample, retain=retain)
+
+    def _validate(self):
+        validate_int(param=self.downsample, param_name='downsample',
+                     minimum=1, left='closed', right='open')
+        if self.retain is not None:
+            validate_int(param=self.retain, param_name='retain',
+                         minimum=1, left='closed', right='open')
 
     def on_train_begin(self, log=None):
         """Sets instance variables at the beginning of training.
@@ -45,13 +353,14 @@ class BlackBox(Observer):
         log : Dict
             Dictionary containing the X and y data
         """ 
+        self._validate()
         self.total_epochs = 0
         self.total_batches = 0
         self.start = datetime.datetime.now()
         self.end = None
         self.duration = None
-        self.epoch_log = {}
-        self.batch_log = {}        
+        self.epoch_log = History(downsample=self.downsample, retain=self.retain)
+        self.batch_log = History(downsample=self.downsample, retain=self.retain)
 
     def on_train_end(self, log=None):        
         """Sets instance variables at end of training.
@@ -78,8 +387,7 @@ class BlackBox(Observer):
         """
         log = log or {}
         self.total_batches += 1
-        for k,v in log.items():
-            self.batch_log.setdefault(k,[]).append(v)            
+        self.batch_log.append(log)
 
     def on_epoch_end(self, epoch, log=None):
         """Updates data and statistics relevant to the training epoch.
@@ -96,5 +404,18 @@ class BlackBox(Observer):
         """
         log = log or {}
         self.total_epochs += 1
-        for k,v in log.items():
-            self.epoch_log.setdefault(k,[]).append(v)
+        self.epoch_log.append(log)
+
+    def to_frame(self, log='epoch', arrays=True):
+        """Returns the epoch or batch log as a DataFrame.
+
+        Parameters
+        ----------
+        log : str 'epoch' or 'batch' (default='epoch')
+            The log to return.
+
+        arrays : bool (default=True)
+            If True, array keys are expanded into one column per element.
+        """
+        history = self.batch_log if log == 'batch' else self.epoch_log
+        return history.to_frame(arrays=arrays)
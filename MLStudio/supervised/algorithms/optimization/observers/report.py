@@ -129,8 +129,13 @@ class Summary(base.Observer):
         log = bb.epoch_log
         d = OrderedDict()
         d['Total CPU Time (s)'] = round(np.sum(log['cpu_time']), 4)
-        d['Average Peak Memory (bytes)'] = round(np.mean(log['peak_memory']), 4)
-        d['Average Current Memory (bytes)'] = round(np.mean(log['current_memory']), 4)
+        # Memory is only reported for the epochs sampled by the profiler
+        peak = [m for m in log.get('peak_memory', []) if m is not None]
+        current = [m for m in log.get('current_memory', []) if m is not None]
+        if peak:
+            d['Average Peak Memory (bytes)'] = round(np.mean(peak), 4)
+        if current:
+            d['Average Current Memory (bytes)'] = round(np.mean(current), 4)
         self.printer.print_dictionary(d, "Resource Consumption")
 
     def _performance_summary(self):        
@@ -146,7 +151,7 @@ class Summary(base.Observer):
         for performance in list(itertools.product(keys, metrics)):
             d = {}
             key = performance[0] + '_' + performance[1]
-            if log.get(key):
+            if key in log:
                 label = datasets[performance[0]] + ' ' + proper(performance[1]) 
                 d['label'] = label
                 if performance[1] == 'score':                    
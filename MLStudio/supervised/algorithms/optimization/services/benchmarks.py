@@ -18,7 +18,14 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
-"""Objective functions and their gradients."""
+"""Objective functions and their gradients.
+
+Each objective and its gradient accept a single point of shape (n_dims,) or
+a batch of m points of shape (m, n_dims), and return a value or array of
+shape (m,), and a gradient of the same shape as theta, respectively. The
+Rosenbrock, Styblinski-Tank and Sum Squares objectives are defined in any
+number of dimensions; the others in two.
+"""
 from abc import ABC, abstractmethod
 
 import numpy as np
@@ -61,13 +68,58 @@ class Benchmark(ABC):
     
     @abstractmethod
     def __call__(self, theta, **kwargs):
-        """Computes the objective function value"""
+        """Computes the objective function value.
+
+        Parameters
+        ----------
+        theta : array-like of shape (n_dims,) or (m, n_dims)
+            A point or a batch of m points.
+
+        Returns
+        -------
+        cost : float or array of shape (m,)
+        """
         pass
     
     @abstractmethod
     def gradient(self, theta, **kwargs):
-        """Computes the gradient of the objective function."""
+        """Computes the gradient of the objective function.
+
+        Parameters
+        ----------
+        theta : array-like of shape (n_dims,) or (m, n_dims)
+            A point or a batch of m points.
+
+        Returns
+        -------
+        gradient : array of shape (n_dims,) or (m, n_dims)
+        """
         pass
+
+    def _check_theta(self, theta):
+        """Returns theta as a float array whose last axis indexes dimensions."""
+        theta = np.asarray(theta, dtype=float)
+        if theta.ndim not in (1, 2):
+            raise ValueError("theta must be a point of shape (n_dims,) or a "
+                             "batch of shape (m, n_dims).")
+        return theta
+
+    def _check_gradient_scale(self, gradient):
+        """Rescales vanishing or exploding gradients if a scaler is provided.
+
+        The gradient of each point in a batch is rescaled by its own norm.
+        """
+        if not self.gradient_scaler:
+            return gradient
+        if gradient.ndim == 1:
+            return self.gradient_scaler.fit_transform(gradient)
+        lower = self.gradient_scaler.lower_threshold
+        upper = self.gradient_scaler.upper_threshold
+        norms = np.linalg.norm(gradient, axis=-1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.where(norms < lower, lower / norms,
+                             np.where(norms > upper, upper / norms, 1.0))
+        return gradient * scale
 # --------------------------------------------------------------------------  #
 class Adjiman(Benchmark):
     """Base class for objective functions.""" 
@@ -93,13 +145,15 @@ class Adjiman(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""
-        return np.cos(theta[0]) * np.sin(theta[1]) - (theta[0] / (theta[1]**2 + 1))
+        theta = self._check_theta(theta)
+        return np.cos(theta[..., 0]) * np.sin(theta[..., 1]) - (theta[..., 0] / (theta[..., 1]**2 + 1))
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = -(1/(theta[1]**2+1))*((theta[1]**2+1)*np.sin(theta[0])*np.sin(theta[1])+1)
-        dfdy = 2*theta[0]*theta[1] /(theta[1]**2+1)**2 + np.cos(theta[0])*np.cos(theta[1])
-        df = np.array([dfdx, dfdy])
+        theta = self._check_theta(theta)
+        dfdx = -(1/(theta[..., 1]**2+1))*((theta[..., 1]**2+1)*np.sin(theta[..., 0])*np.sin(theta[..., 1])+1)
+        dfdy = 2*theta[..., 0]*theta[..., 1] /(theta[..., 1]**2+1)**2 + np.cos(theta[..., 0])*np.cos(theta[..., 1])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df
@@ -129,21 +183,23 @@ class BartelsConn(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""
-        a = abs(theta[0]**2 + theta[1]**2 + theta[0] * theta[1])
-        b = abs(np.sin(theta[0]))
-        c = abs(np.cos(theta[1]))
+        theta = self._check_theta(theta)
+        a = abs(theta[..., 0]**2 + theta[..., 1]**2 + theta[..., 0] * theta[..., 1])
+        b = abs(np.sin(theta[..., 0]))
+        c = abs(np.cos(theta[..., 1]))
         return a + b + c
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        a = (2 * theta[0] + theta[1]) * np.sign(theta[0]**2 + theta[0] * theta[1] + theta[1]**2)
-        b = np.cos(theta[0]) * np.sign(np.sin(theta[0]))
+        theta = self._check_theta(theta)
+        a = (2 * theta[..., 0] + theta[..., 1]) * np.sign(theta[..., 0]**2 + theta[..., 0] * theta[..., 1] + theta[..., 1]**2)
+        b = np.cos(theta[..., 0]) * np.sign(np.sin(theta[..., 0]))
         dfdx = a + b
-        a = (theta[0] + 2 * theta[1]) * np.sign(theta[0]**2 + theta[0] * theta[1] + theta[1]**2)
-        b = np.sin(theta[1]) * np.sign(np.cos(theta[1]))
+        a = (theta[..., 0] + 2 * theta[..., 1]) * np.sign(theta[..., 0]**2 + theta[..., 0] * theta[..., 1] + theta[..., 1]**2)
+        b = np.sin(theta[..., 1]) * np.sign(np.cos(theta[..., 1]))
         dfdy = a - b
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -173,14 +229,16 @@ class Himmelblau(Benchmark):
 
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""
-        return (theta[0]**2 + theta[1] - 11)**2 + (theta[0]+theta[1]**2-7)**2
+        theta = self._check_theta(theta)
+        return (theta[..., 0]**2 + theta[..., 1] - 11)**2 + (theta[..., 0]+theta[..., 1]**2-7)**2
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = 4*theta[0]*(theta[0]**2+theta[1]-11)+2*theta[0]+2*theta[1]**2-14
-        dfdy = 2*theta[0]**2 + 4*theta[1] * (theta[0]+theta[1]**2-7)+2*theta[1]-22
+        theta = self._check_theta(theta)
+        dfdx = 4*theta[..., 0]*(theta[..., 0]**2+theta[..., 1]-11)+2*theta[..., 0]+2*theta[..., 1]**2-14
+        dfdy = 2*theta[..., 0]**2 + 4*theta[..., 1] * (theta[..., 0]+theta[..., 1]**2-7)+2*theta[..., 1]-22
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -211,14 +269,16 @@ class Leon(Benchmark):
 
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""
-        return 100 * (theta[1] - theta[0]**2)**2 + (1 - theta[0])**2
+        theta = self._check_theta(theta)
+        return 100 * (theta[..., 1] - theta[..., 0]**2)**2 + (1 - theta[..., 0])**2
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = -400*(-theta[0]**2+theta[1]) + 2*theta[0] - 2
-        dfdy = -200*theta[0]**2 + 200 * theta[1]
+        theta = self._check_theta(theta)
+        dfdx = -400*(-theta[..., 0]**2+theta[..., 1]) + 2*theta[..., 0] - 2
+        dfdy = -200*theta[..., 0]**2 + 200 * theta[..., 1]
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -228,7 +288,19 @@ class Leon(Benchmark):
 
 # --------------------------------------------------------------------------  #
 class Rosenbrock(Benchmark):
-    """Base class for objective functions."""
+    """Rosenbrock objective function, generalized to n dimensions.
+
+    Parameters
+    ----------
+    n_dims : int (default=2)
+        The number of dimensions of the start point and minimum. Points of
+        any dimension greater than one may be evaluated.
+    """
+
+    def __init__(self, n_dims=2, regularizer=None, gradient_scaler=GradientScaler()):
+        super(Rosenbrock, self).__init__(regularizer=regularizer,
+                                         gradient_scaler=gradient_scaler)
+        self.n_dims = n_dims
 
     @property
     def name(self):
@@ -236,11 +308,11 @@ class Rosenbrock(Benchmark):
 
     @property
     def start(self):
-        return np.array([-5,10])
+        return np.resize(np.array([-5,10]), self.n_dims)
 
     @property
     def minimum(self):
-        return np.array([1,1])  
+        return np.ones(self.n_dims)
 
     @property
     def range(self):
@@ -252,16 +324,20 @@ class Rosenbrock(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""
+        theta = self._check_theta(theta)
         a = 1
         b = 100
-        return b*(theta[1]-theta[0]**2)**2+(a-theta[0])**2
+        x, x_next = theta[..., :-1], theta[..., 1:]
+        return np.sum(b*(x_next-x**2)**2+(a-x)**2, axis=-1)
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = -400*theta[0]*(-theta[0]**2+theta[1])+2*theta[0]-2
-        dfdy = -200*theta[0]**2 + 200 * theta[1]
-        # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        theta = self._check_theta(theta)
+        x, x_next = theta[..., :-1], theta[..., 1:]
+        df = np.zeros_like(theta)
+        # Each coordinate but the last appears as x, each but the first as x_next
+        df[..., :-1] = -400*x*(-x**2+x_next)+2*x-2
+        df[..., 1:] += -200*x**2 + 200 * x_next
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -291,31 +367,33 @@ class Branin02(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""        
-        return (-1.275*theta[0]**2/np.pi**2 + 5*theta[0]/np.pi + theta[1]-6)**2\
-            + (10-5/4*np.pi) * np.cos(theta[0]) * np.cos(theta[1]) \
-                + np.log(theta[0]**2+theta[1]**2+1) + 10
+        theta = self._check_theta(theta)
+        return (-1.275*theta[..., 0]**2/np.pi**2 + 5*theta[..., 0]/np.pi + theta[..., 1]-6)**2\
+            + (10-5/4*np.pi) * np.cos(theta[..., 0]) * np.cos(theta[..., 1]) \
+                + np.log(theta[..., 0]**2+theta[..., 1]**2+1) + 10
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
+        theta = self._check_theta(theta)
         # dfdx
-        a = 1/(4*np.pi**4*(theta[0]**2+theta[1]**2+1))
-        b = 8 * np.pi**4 * theta[0]
-        c = 5*(theta[0] - 2 * np.pi)
-        d = (theta[0]**2+theta[1]**2+1)
-        e = (5 * theta[0]**2 - 20*np.pi*theta[0]+4*np.pi**2*(6-theta[1]))
-        f = 5*np.pi**3 *  (-1+8*np.pi) * (theta[0]**2+theta[1]**2+1) \
-            * np.sin(theta[0]) * np.cos(theta[1])
+        a = 1/(4*np.pi**4*(theta[..., 0]**2+theta[..., 1]**2+1))
+        b = 8 * np.pi**4 * theta[..., 0]
+        c = 5*(theta[..., 0] - 2 * np.pi)
+        d = (theta[..., 0]**2+theta[..., 1]**2+1)
+        e = (5 * theta[..., 0]**2 - 20*np.pi*theta[..., 0]+4*np.pi**2*(6-theta[..., 1]))
+        f = 5*np.pi**3 *  (-1+8*np.pi) * (theta[..., 0]**2+theta[..., 1]**2+1) \
+            * np.sin(theta[..., 0]) * np.cos(theta[..., 1])
         dfdx = a * (b+c*d*e - f)
         # dfdy
-        a = -(5*theta[0]**2/(2*(np.pi**2)))
-        b = (10 * theta[0])/np.pi
-        c = 2 * theta[1]
-        d = (2*theta[1]) / (theta[0]**2+theta[1]**2+1)
+        a = -(5*theta[..., 0]**2/(2*(np.pi**2)))
+        b = (10 * theta[..., 0])/np.pi
+        c = 2 * theta[..., 1]
+        d = (2*theta[..., 1]) / (theta[..., 0]**2+theta[..., 1]**2+1)
         e = (10-(5/(np.pi*4)))
-        f = np.sin(theta[1]) * np.cos(theta[0])
+        f = np.sin(theta[..., 1]) * np.cos(theta[..., 0])
         dfdy = a + b + c + d - e * f - 12
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -323,7 +401,19 @@ class Branin02(Benchmark):
 
 # --------------------------------------------------------------------------  #
 class StyblinskiTank(Benchmark):
-    """Styblinksi-Tank objective functions."""
+    """Styblinksi-Tank objective function, generalized to n dimensions.
+
+    Parameters
+    ----------
+    n_dims : int (default=2)
+        The number of dimensions of the start point and minimum. Points of
+        any dimension may be evaluated.
+    """
+
+    def __init__(self, n_dims=2, regularizer=None, gradient_scaler=GradientScaler()):
+        super(StyblinskiTank, self).__init__(regularizer=regularizer,
+                                             gradient_scaler=gradient_scaler)
+        self.n_dims = n_dims
 
     @property
     def name(self):
@@ -331,11 +421,11 @@ class StyblinskiTank(Benchmark):
 
     @property
     def start(self):
-        return np.array([-5,-4])
+        return np.resize(np.array([-5,-4]), self.n_dims)
 
     @property
     def minimum(self):
-        return np.array([-2.903534, -2.903534])  
+        return np.full(self.n_dims, -2.903534)
 
     @property
     def range(self):
@@ -347,18 +437,13 @@ class StyblinskiTank(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""   
-        a = 0
-        for i in range(len(theta, **kwargs)):
-            a += theta[i]**4 - 16 * theta[i]**2 + 5 * theta[i]
-
-        return 1/2 * a
+        theta = self._check_theta(theta)
+        return 1/2 * np.sum(theta**4 - 16 * theta**2 + 5 * theta, axis=-1)
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = 2*theta[0]**3 - 16 * theta[0] + 5/2
-        dfdy = 2*theta[1]**3 - 16*theta[1] + 5/2
-        # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        theta = self._check_theta(theta)
+        df = 2*theta**3 - 16 * theta + 5/2
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -366,7 +451,19 @@ class StyblinskiTank(Benchmark):
 
 # --------------------------------------------------------------------------  #
 class SumSquares(Benchmark):
-    """Base class for objective functions."""    
+    """Sum of squares objective function, generalized to n dimensions.
+
+    Parameters
+    ----------
+    n_dims : int (default=2)
+        The number of dimensions of the start point and minimum. Points of
+        any dimension may be evaluated.
+    """
+
+    def __init__(self, n_dims=2, regularizer=None, gradient_scaler=GradientScaler()):
+        super(SumSquares, self).__init__(regularizer=regularizer,
+                                         gradient_scaler=gradient_scaler)
+        self.n_dims = n_dims
 
     @property
     def name(self):
@@ -374,11 +471,11 @@ class SumSquares(Benchmark):
 
     @property
     def start(self):
-        return np.array([10,10])
+        return np.full(self.n_dims, 10)
         
     @property
     def minimum(self):
-        return np.array([0,0])           
+        return np.zeros(self.n_dims)
     
     @property
     def range(self):
@@ -389,14 +486,13 @@ class SumSquares(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""        
-        return np.sum(theta[0]**2 + theta[1]**2)
+        theta = self._check_theta(theta)
+        return np.sum(theta**2, axis=-1)
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = 2 * theta[0]
-        dfdy = 2 * theta[1]
-        # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        theta = self._check_theta(theta)
+        df = 2 * theta
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df                
@@ -426,14 +522,16 @@ class ThreeHumpCamel(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""        
-        return 2*theta[0]**2 - 1.05*theta[0]**4 + ((theta[0]**6)/6)+theta[0]*theta[1]+theta[1]**2
+        theta = self._check_theta(theta)
+        return 2*theta[..., 0]**2 - 1.05*theta[..., 0]**4 + ((theta[..., 0]**6)/6)+theta[..., 0]*theta[..., 1]+theta[..., 1]**2
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = theta[0]**5-((21*theta[0]**3)/5)+4*theta[0]+theta[1]
-        dfdy = theta[0]+2*theta[1]
+        theta = self._check_theta(theta)
+        dfdx = theta[..., 0]**5-((21*theta[..., 0]**3)/5)+4*theta[..., 0]+theta[..., 1]
+        dfdy = theta[..., 0]+2*theta[..., 1]
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -463,14 +561,16 @@ class Ursem01(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""        
-        return -np.sin(2*theta[0] - 0.5 * np.pi) - 3 * np.cos(theta[1]) - 0.5 * theta[0]
+        theta = self._check_theta(theta)
+        return -np.sin(2*theta[..., 0] - 0.5 * np.pi) - 3 * np.cos(theta[..., 1]) - 0.5 * theta[..., 0]
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        dfdx = -2 * np.sin(2 * theta[0]) - 0.5
-        dfdy = 3 * np.sin(theta[1])
+        theta = self._check_theta(theta)
+        dfdx = -2 * np.sin(2 * theta[..., 0]) - 0.5
+        dfdy = 3 * np.sin(theta[..., 1])
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
@@ -500,22 +600,24 @@ class Wikipedia(Benchmark):
     
     def __call__(self, theta, **kwargs):
         """Computes the objective function value"""        
-        return np.sin(1/2*theta[0]**2 - 0.25 * theta[1]**2 + 3) * np.cos(2*theta[0]+1-np.exp(theta[1]))
+        theta = self._check_theta(theta)
+        return np.sin(1/2*theta[..., 0]**2 - 0.25 * theta[..., 1]**2 + 3) * np.cos(2*theta[..., 0]+1-np.exp(theta[..., 1]))
 
     def gradient(self, theta, **kwargs):
         """Computes the gradient of the objective function."""
-        a = (theta[0] * np.cos(2*theta[0]-np.exp(theta[1])+1))
-        b = np.cos((theta[0]**2)/2-(theta[1]**2)/4+3)
-        c = -2*np.sin(2*theta[0])-np.exp(theta[1])+1
-        d = np.sin((theta[0]**2)/2-(theta[1]**2)/4+3)
-        e = -theta[1]/2*np.cos(2*theta[0]-np.exp(theta[1])+1)
-        f = np.cos((theta[0]**2)/2-(theta[1]**2)/4+3)
-        g = np.exp(theta[1])*np.sin(2*theta[0]-np.exp(theta[1])+1)
-        h = np.sin((theta[0]**2)/2-(theta[1]**2)/4+3)
+        theta = self._check_theta(theta)
+        a = (theta[..., 0] * np.cos(2*theta[..., 0]-np.exp(theta[..., 1])+1))
+        b = np.cos((theta[..., 0]**2)/2-(theta[..., 1]**2)/4+3)
+        c = -2*np.sin(2*theta[..., 0])-np.exp(theta[..., 1])+1
+        d = np.sin((theta[..., 0]**2)/2-(theta[..., 1]**2)/4+3)
+        e = -theta[..., 1]/2*np.cos(2*theta[..., 0]-np.exp(theta[..., 1])+1)
+        f = np.cos((theta[..., 0]**2)/2-(theta[..., 1]**2)/4+3)
+        g = np.exp(theta[..., 1])*np.sin(2*theta[..., 0]-np.exp(theta[..., 1])+1)
+        h = np.sin((theta[..., 0]**2)/2-(theta[..., 1]**2)/4+3)
         dfdx = a * b + c * d
         dfdy = e * f + g * h
         # Package into gradient vector
-        df = np.array([dfdx, dfdy])
+        df = np.stack([dfdx, dfdy], axis=-1)
         # Check gradient scale 
         df = self._check_gradient_scale(df)                
         return df        
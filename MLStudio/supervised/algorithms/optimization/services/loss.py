@@ -22,7 +22,13 @@ from abc import ABC, abstractmethod
 import numpy as np
 from sklearn.base import BaseEstimator
 
-from mlstudio.utils.data_manager import GradientScaler    
+from mlstudio.utils.data_manager import GradientScaler, linear_gradient
+# --------------------------------------------------------------------------  #
+def _epsilon(y_out):
+    """Returns the smallest offset from 0 and 1 representable in y_out's dtype."""
+    if np.issubdtype(np.asarray(y_out).dtype, np.floating):
+        return max(1e-15, np.finfo(np.asarray(y_out).dtype).eps)
+    return 1e-15
 # --------------------------------------------------------------------------  #
 #                           LOSS BASE CLASS                                   #
 # --------------------------------------------------------------------------  #
@@ -63,6 +69,14 @@ class Loss(ABC, BaseEstimator):
     def gradient_scaling(self, x):
         self._gradient_scaling = x
 
+    @property
+    def gradient_scaler(self):
+        return self._gradient_scaler 
+
+    @gradient_scaler.setter
+    def gradient_scaler(self, x):
+        self._gradient_scaler = x
+
     @property
     def regularizer(self):
         return self._regularizer
@@ -151,8 +165,8 @@ class Quadratic(Loss):
         
         Parameters
         ----------
-        X : array of shape (m_observations, n_features)
-            Input data
+        X : array or csr matrix of shape (m_observations, n_features)
+            Input data, with or without the bias column
 
         y : array of shape (n_features,)
             Ground truth target values
@@ -171,7 +185,7 @@ class Quadratic(Loss):
         # Number of samples in the dataset
         m = y.shape[0]
         # Compute unregularized gradient
-        gradient = (1/m) * X.T.dot(y_out-y)                         
+        gradient = (1/m) * linear_gradient(X, theta, y_out-y)
         # Apply regularization to the weights (not bias) in gradient
         if self._regularizer:
             gradient += self._regularizer.gradient(theta)              
@@ -212,7 +226,8 @@ class CrossEntropy(Loss):
         # Number of samples in the dataset
         m = y.shape[0]
         # Prevent division by zero
-        y_out = np.clip(y_out, 1e-15, 1-1e-15)    
+        eps = _epsilon(y_out)
+        y_out = np.clip(y_out, eps, 1-eps)    
         # Compute unregularized cost
         J = -np.mean(y * np.log(y_out) + (1-y) * np.log(1-y_out)) 
         # Apply regularization to the weights (not bias) in gradient
@@ -226,8 +241,8 @@ class CrossEntropy(Loss):
         
         Parameters
         ----------
-        X : array of shape (m_observations, n_features)
-            Input data
+        X : array or csr matrix of shape (m_observations, n_features)
+            Input data, with or without the bias column
 
         y : array of shape (n_features,)
             Ground truth target values
@@ -246,7 +261,7 @@ class CrossEntropy(Loss):
         # Number of samples in the dataset
         m = X.shape[0]        
         # Compute unregularized gradient
-        gradient = (1/m) * X.T.dot(y_out-y)         
+        gradient = (1/m) * linear_gradient(X, theta, y_out-y)
         # Apply regularization to the weights (not bias) in gradient
         if self._regularizer:
             gradient += self._regularizer.gradient(theta)                
@@ -288,7 +303,8 @@ class CategoricalCrossEntropy(Loss):
         # Number of samples in the dataset
         m = y.shape[0]
         # Prevent division by zero
-        y_out = np.clip(y_out, 1e-15, 1-1e-15)    
+        eps = _epsilon(y_out)
+        y_out = np.clip(y_out, eps, 1-eps)    
         # Compute unregularized cost
         J = -np.mean(np.sum(y * np.log(y_out), axis=1))
         # Add regularizer of weights 
@@ -302,8 +318,8 @@ class CategoricalCrossEntropy(Loss):
         
         Parameters
         ----------
-        X : array of shape (m_observations, n_features)
-            Input data
+        X : array or csr matrix of shape (m_observations, n_features)
+            Input data, with or without the bias column
 
         y : array of shape (n_features,)
             Ground truth target values
@@ -323,7 +339,7 @@ class CategoricalCrossEntropy(Loss):
         # Number of samples in the dataset
         m = y.shape[0]
         # Compute unregularized gradient
-        gradient = -(1/m) * (X.T.dot(y-y_out))
+        gradient = -(1/m) * linear_gradient(X, theta, y-y_out)
         # Add regularizer of weights 
         if self._regularizer:
             gradient += self._regularizer.gradient(theta)     
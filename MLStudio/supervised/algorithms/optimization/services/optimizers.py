@@ -18,7 +18,27 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
-"""Gradient descent optimization algorithms."""
+"""Gradient descent optimization algorithms.
+
+Optimizers update the parameters theta in place via the update method. 
+State and scratch buffers are allocated on the first update and reused
+thereafter, so that once allocated, an update performs no array 
+allocations beyond those made by the gradient function. Calling an 
+optimizer returns updated parameters and leaves theta unchanged.
+
+Updates are elementwise, so theta of shape (K, d) holding K starting
+points of a multi-start optimization is advanced with the same calls as a
+single theta. Optimizers that reduce over the parameters, such as AdaMax,
+keep that state for each row of theta once set_multi_start is called.
+
+The proximal optimizers, ISTA and FISTA, follow each gradient step with the
+proximal operator of the regularizer given to set_proximal, so that an L1
+penalty sets parameters exactly to zero.
+
+Look-ahead optimizers, such as Nesterov and FISTA, evaluate the gradient
+away from theta. Their lookahead attribute tells the estimator not to 
+pass them the output of the model computed at theta.
+"""
 from abc import ABC, abstractmethod
 import math
 
@@ -30,7 +50,25 @@ from mlstudio.utils.data_manager import GradientScaler
 class Optimizer(ABC, BaseEstimator):
     """Base class for all optimizers."""
 
-    @abstractmethod        
+    def __init__(self):
+        self._shape = None
+        self._dtype = None
+        self._multi_start = False
+        self._regularizer = None
+
+    def set_multi_start(self, multi_start=True):
+        """Treats each row of theta as the parameters of a separate start."""
+        self._multi_start = multi_start
+
+    def set_proximal(self, regularizer):
+        """Sets the regularizer whose prox follows each step of a proximal optimizer."""
+        self._regularizer = regularizer
+
+    def _prox(self, theta, learning_rate):
+        """Applies the proximal operator of the regularizer, if any, in place."""
+        if self._regularizer is not None:
+            self._regularizer.prox(theta, learning_rate)
+
     def __call__(self, gradient, learning_rate, theta, **kwargs):   
         """Computes the parameter updates.
         
@@ -56,138 +94,289 @@ class Optimizer(ABC, BaseEstimator):
         grad : array-like
             The gradient of the objective function w.r.t. parameters theta.
         """
-        pass
+        theta = np.array(theta, dtype=np.result_type(theta, np.float32))
+        grad = self.update(gradient, learning_rate, theta, **kwargs)
+        return theta, grad
+
+    def update(self, gradient, learning_rate, theta, **kwargs):
+        """Updates the parameters in place.
+        
+        Parameters
+        ----------
+        gradient : func
+            The function that performs the gradient computation 
+
+        learning_rate : float
+            The learning rate from the estimator object.
+
+        theta : ndarray of floats
+            The model parameters, which are overwritten with the update.
+
+        **kwargs : dict
+            Arbitrary parameters used for computing the gradient.
+
+        Returns
+        -------
+        grad : array-like
+            The gradient of the objective function w.r.t. parameters theta.
+        """
+        grad = gradient(theta, **kwargs)
+        self._check_buffers(theta)
+        self._step(grad, learning_rate, theta)
+        return grad
 
+    def _check_buffers(self, theta):
+        """Allocates state and scratch buffers if theta has a new shape or dtype."""
+        if self._shape != theta.shape or self._dtype != theta.dtype:
+            self._shape = theta.shape
+            self._dtype = theta.dtype
+            self._allocate(theta)
 
+    def _allocate(self, theta):
+        """Allocates a scratch buffer in the shape of theta."""
+        self._buffer = np.zeros_like(theta)
+
+    @abstractmethod
+    def _step(self, grad, learning_rate, theta):
+        """Applies the update to theta in place.
+
+        Parameters
+        ----------
+        grad : array-like
+            The gradient of the objective function w.r.t. parameters theta.
+
+        learning_rate : float
+            The learning rate from the estimator object.
+
+        theta : ndarray of floats
+            The model parameters, which are overwritten with the update.
+        """
+        pass
 
 # --------------------------------------------------------------------------  #
 class GradientDescentOptimizer(Optimizer):
     """Standard gradient descent optimizer."""
 
     def __init__(self):
+        super(GradientDescentOptimizer, self).__init__()
         self.name = "Gradient Descent"
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):        
-        grad = gradient(theta, **kwargs)
-        theta = theta - learning_rate * grad
-        return theta, grad
+    def _step(self, grad, learning_rate, theta):        
+        np.multiply(grad, learning_rate, out=self._buffer)
+        theta -= self._buffer
+
+# --------------------------------------------------------------------------  #
+class ISTA(Optimizer):
+    """Iterative shrinkage-thresholding, or proximal gradient descent.
+
+    Each gradient step on the smooth part of the objective is followed by
+    the proximal operator of the regularizer, which soft-thresholds the 
+    parameters for the L1 and L1_L2 regularizers. 
+    """
+
+    proximal = True
+
+    def __init__(self):
+        super(ISTA, self).__init__()
+        self.name = "ISTA"
+    
+    def _step(self, grad, learning_rate, theta):        
+        np.multiply(grad, learning_rate, out=self._buffer)
+        theta -= self._buffer
+        self._prox(theta, learning_rate)
+
+# --------------------------------------------------------------------------  #
+class FISTA(ISTA):
+    """Fast iterative shrinkage-thresholding.
+
+    ISTA with Nesterov momentum. The gradient is evaluated at an 
+    extrapolation of the last two iterates, and the proximal step from 
+    there gives the next iterate, so that theta itself remains sparse.
+    """
+
+    lookahead = True
+
+    def __init__(self):
+        super(FISTA, self).__init__()
+        self.name = "FISTA"
+        self._t = 1.0
+
+    def _allocate(self, theta):
+        super(FISTA, self)._allocate(theta)
+        self._previous = theta.copy()
+        self._t = 1.0
+
+    def update(self, gradient, learning_rate, theta, **kwargs):
+        self._check_buffers(theta)
+        t = (1 + math.sqrt(1 + 4 * self._t**2)) / 2
+        # Extrapolates from the previous iterate
+        np.subtract(theta, self._previous, out=self._buffer)
+        self._buffer *= (self._t - 1) / t
+        self._buffer += theta
+        self._t = t
+        grad = gradient(self._buffer, **kwargs)
+        np.copyto(self._previous, theta)
+        np.copyto(theta, self._buffer)
+        self._step(grad, learning_rate, theta)
+        return grad
 
 # --------------------------------------------------------------------------  #
 class Momentum(Optimizer):
     """Standard gradient descent optimizer."""
 
     def __init__(self, gamma=0.9):
+        super(Momentum, self).__init__()
         self.name = "Momentum"
         self.gamma = gamma
         self._velocity = 0
 
+    def _allocate(self, theta):
+        super(Momentum, self)._allocate(theta)
+        self._velocity = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):             
-        grad = gradient(theta, **kwargs)
-        self._velocity = self.gamma * self._velocity + learning_rate * grad
-        theta = theta - self._velocity
-        return theta, grad
+    def _step(self, grad, learning_rate, theta):             
+        self._velocity *= self.gamma
+        np.multiply(grad, learning_rate, out=self._buffer)
+        self._velocity += self._buffer
+        theta -= self._velocity
 
 # --------------------------------------------------------------------------  #
 class Nesterov(Optimizer):
     """Nesterov accelerated gradient optimizer."""
 
+    lookahead = True
+
     def __init__(self, gamma=0.9, ):
+        super(Nesterov, self).__init__()
         self.name = "Nesterov"
         self.gamma = gamma
         self._velocity = 0
 
+    def _allocate(self, theta):
+        super(Nesterov, self)._allocate(theta)
+        self._velocity = np.zeros_like(theta)
+
+    def update(self, gradient, learning_rate, theta, **kwargs):
+        # The gradient is evaluated at the look-ahead position 
+        self._check_buffers(theta)
+        np.multiply(self._velocity, self.gamma, out=self._buffer)
+        np.subtract(theta, self._buffer, out=self._buffer)
+        grad = gradient(self._buffer, **kwargs)
+        self._step(grad, learning_rate, theta)
+        return grad
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):
-        next_position = theta - self.gamma * self._velocity        
-        grad = gradient(next_position, **kwargs)
-        self._velocity = self.gamma * self._velocity + learning_rate * grad
-        theta = theta - self._velocity
-        return theta, grad
+    def _step(self, grad, learning_rate, theta):
+        self._velocity *= self.gamma
+        np.multiply(grad, learning_rate, out=self._buffer)
+        self._velocity += self._buffer
+        theta -= self._velocity
 
 # --------------------------------------------------------------------------  #
 class Adagrad(Optimizer):
     """Adagrad optimizer."""
 
     def __init__(self, epsilon=1e-8):
+        super(Adagrad, self).__init__()
         self.name = "Adagrad"
         self.epsilon = epsilon
         self.sum_squared_gradients = 0
 
+    def _allocate(self, theta):
+        super(Adagrad, self)._allocate(theta)
+        self.sum_squared_gradients = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):
-        grad = gradient(theta, **kwargs)
+    def _step(self, grad, learning_rate, theta):
         # Accumulate the square of gradients up to time t
-        self.sum_squared_gradients += np.square(grad)    
-        # Convert to diagonal matrix
-        Gt_ii = np.diag(self.sum_squared_gradients)        
-        # Add an epsilon to diagonal matrix to avoid division by zero
-        epsilon = np.diag(np.full(len(grad),self.epsilon))      
-        Gt_e = np.add(Gt_ii,epsilon)
-        # Take square root of sum of GT and e
-        Gt_e_sqrt = np.sqrt(Gt_e)
-        # Create its inverse
-        Gt_e_sqrt_inv = np.linalg.inv(Gt_e_sqrt)
-        # Perform update
-        theta = theta - learning_rate * Gt_e_sqrt_inv.dot(grad)
-        return theta, grad        
+        buf = self._buffer
+        np.square(grad, out=buf)
+        self.sum_squared_gradients += buf
+        # G_t is diagonal, so the inverse square root of G_t + epsilon*I 
+        # reduces to an elementwise operation on its diagonal.
+        np.add(self.sum_squared_gradients, self.epsilon, out=buf)
+        np.sqrt(buf, out=buf)
+        np.divide(grad, buf, out=buf)
+        buf *= learning_rate
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class Adadelta(Optimizer):
     """Adadelta optimizer."""
 
     def __init__(self, gamma=0.9, epsilon=1e-8):
+        super(Adadelta, self).__init__()
         self.name = "Adadelta"
         self.gamma = gamma
         self.epsilon = epsilon
         self.avg_sqr_gradient = 0
         self.avg_sqr_delta_theta = 0
 
+    def _allocate(self, theta):
+        super(Adadelta, self)._allocate(theta)
+        self._rms_grad = np.zeros_like(theta)
+        self.avg_sqr_gradient = np.zeros_like(theta)
+        self.avg_sqr_delta_theta = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):                
-        grad = gradient(theta, **kwargs)     
-
-        self.avg_sqr_gradient = self.gamma * self.avg_sqr_gradient + \
-            (1 - self.gamma) * np.square(grad)            
-        rms_grad = np.sqrt(np.array(np.square(np.array(self.avg_sqr_gradient, ndmin=1)) + np.array(self.epsilon, ndmin=1), ndmin=1))
+    def _step(self, grad, learning_rate, theta):                
+        buf, rms_grad = self._buffer, self._rms_grad
+
+        np.square(grad, out=buf)
+        buf *= 1 - self.gamma
+        self.avg_sqr_gradient *= self.gamma
+        self.avg_sqr_gradient += buf
+        np.square(self.avg_sqr_gradient, out=rms_grad)
+        rms_grad += self.epsilon
+        np.sqrt(rms_grad, out=rms_grad)
         
-        delta_theta = -learning_rate / rms_grad  * grad            
-
-        self.avg_sqr_delta_theta = self.gamma * self.avg_sqr_delta_theta + \
-            (1 - self.gamma) * np.square(np.array(delta_theta, ndmin=1))
-        rms_delta_theta = np.sqrt(np.array(np.square(np.array(self.avg_sqr_delta_theta, ndmin=1)) + np.array(self.epsilon, ndmin=1),ndmin=1))
-
-        delta_theta = - (rms_delta_theta / rms_grad).dot(grad)
-
-        theta = theta + delta_theta
-        return theta, grad
+        # Candidate update used to accumulate the squared parameter deltas
+        np.divide(grad, rms_grad, out=buf)
+        buf *= -learning_rate
+        np.square(buf, out=buf)
+        buf *= 1 - self.gamma
+        self.avg_sqr_delta_theta *= self.gamma
+        self.avg_sqr_delta_theta += buf
+        np.square(self.avg_sqr_delta_theta, out=buf)
+        buf += self.epsilon
+        np.sqrt(buf, out=buf)
+
+        buf /= rms_grad
+        buf *= grad
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class RMSprop(Optimizer):
     """RMSprop optimizer."""
 
     def __init__(self, gamma=0.9, epsilon=1e-8):     
+        super(RMSprop, self).__init__()
         self.name = "RMSprop"   
         self.gamma = gamma
         self.epsilon = epsilon
         self.avg_sqr_gradient = 0
         self.avg_sqr_delta_theta = 0
 
+    def _allocate(self, theta):
+        super(RMSprop, self)._allocate(theta)
+        self.avg_sqr_gradient = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):                
-        grad = gradient(theta, **kwargs)        
-        self.avg_sqr_gradient = self.gamma * self.avg_sqr_gradient + \
-            0.1 * np.square(grad)
-        rms_grad = np.sqrt(np.array(np.square(np.array(self.avg_sqr_gradient, ndmin=1)) + np.array(self.epsilon, ndmin=1),ndmin=1))
-        theta = theta - (learning_rate / rms_grad) * grad
-        
-        return theta, grad
+    def _step(self, grad, learning_rate, theta):                
+        buf = self._buffer
+        np.square(grad, out=buf)
+        buf *= 0.1
+        self.avg_sqr_gradient *= self.gamma
+        self.avg_sqr_gradient += buf
+        np.square(self.avg_sqr_gradient, out=buf)
+        buf += self.epsilon
+        np.sqrt(buf, out=buf)
+        np.divide(grad, buf, out=buf)
+        buf *= learning_rate
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class Adam(Optimizer):
     """Adam optimizer."""
 
     def __init__(self, beta_one=0.9, beta_two=0.999, epsilon=10e-8):
+        super(Adam, self).__init__()
         self.name = "Adam"
         self.beta_one = beta_one
         self.beta_two = beta_two        
@@ -197,25 +386,30 @@ class Adam(Optimizer):
         self.t = 0
         self.m = 0        
         self.v = 0
+
+    def _allocate(self, theta):
+        super(Adam, self)._allocate(theta)
+        self.m = np.zeros_like(theta)
+        self.v = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):                
+    def _step(self, grad, learning_rate, theta):                
         self.t += 1
-        grad = gradient(theta, **kwargs)        
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad
-        self.v = self.beta_two * self.v + (1 - self.beta_two) * np.square(grad)
+        buf = self._buffer
+        _update_moments(self, grad, buf)
         # Bias corrected moment estimates
-        m_hat = self.m / (1 - self.beta_one**self.t)
-        v_hat = self.v / (1 - self.beta_two**self.t)
-
-        theta = theta - learning_rate / (np.sqrt(np.array(v_hat)) + np.array(self.epsilon)) * m_hat        
-        
-        return theta, grad        
+        np.divide(self.v, 1 - self.beta_two**self.t, out=buf)
+        np.sqrt(buf, out=buf)
+        buf += self.epsilon
+        np.divide(self.m, buf, out=buf)
+        buf *= learning_rate / (1 - self.beta_one**self.t)
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class AdaMax(Optimizer):
     """AdaMax optimizer."""
 
     def __init__(self, beta_one=0.9, beta_two=0.999):    
+        super(AdaMax, self).__init__()
         self.name = "AdaMax"   
         self.beta_one = beta_one
         self.beta_two = beta_two        
@@ -223,22 +417,35 @@ class AdaMax(Optimizer):
         self.m = 0
         self.u = 0
 
+    def _allocate(self, theta):
+        super(AdaMax, self)._allocate(theta)
+        self.m = np.zeros_like(theta)
+        self.u = 0
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):                
+    def _step(self, grad, learning_rate, theta):                
         self.t += 1
-        grad = gradient(theta, **kwargs)                
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad
-        m_hat = self.m / (1 - self.beta_one**self.t)
-        self.u = np.maximum(self.beta_two * self.u, np.linalg.norm(grad,1))    
-        theta = theta - (learning_rate / (1-self.beta_one**self.t)) * m_hat / self.u
-        
-        return theta, grad              
+        buf = self._buffer
+        np.multiply(grad, 1 - self.beta_one, out=buf)
+        self.m *= self.beta_one
+        self.m += buf
+        # Infinity norm is the L1 norm of the gradient
+        np.abs(grad, out=buf)
+        if self._multi_start:
+            norm = buf.sum(axis=-1, keepdims=True)
+        else:
+            norm = buf.sum() if buf.ndim == 1 else buf.sum(axis=0).max()
+        self.u = np.maximum(self.beta_two * self.u, norm)
+        correction = 1 - self.beta_one**self.t
+        np.multiply(self.m, learning_rate / (correction * correction * self.u), 
+                    out=buf)
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class Nadam(Optimizer):
     """Nadam optimizer."""
 
     def __init__(self, beta_one=0.9, beta_two=0.999, epsilon=10e-8):
+        super(Nadam, self).__init__()
         self.name = "Nadam"
         self.beta_one = beta_one        
         self.beta_two = beta_two        
@@ -247,27 +454,35 @@ class Nadam(Optimizer):
         self.m = 0
         self.v = 0
 
+    def _allocate(self, theta):
+        super(Nadam, self)._allocate(theta)
+        self._momentum = np.zeros_like(theta)
+        self.m = np.zeros_like(theta)
+        self.v = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)        
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad   
-        self.v = self.beta_two * self.v + (1 - self.beta_two) * np.square(grad)
-        # Bias corrected moment estimates
-        m_hat = self.m / (1 - self.beta_one**self.t)
-        v_hat = self.v / (1 - self.beta_two**self.t)
-     
-        # Nadam update
-        theta = theta - (learning_rate / (np.sqrt(np.array(v_hat,ndmin=1)) + self.epsilon)) * \
-            (self.beta_one * m_hat + ((1-self.beta_one)* grad)/(1-self.beta_one**self.t))
-
-        return theta, grad                                    
+        buf, momentum = self._buffer, self._momentum
+        _update_moments(self, grad, buf)
+        correction = 1 - self.beta_one**self.t
+        # Nesterov momentum from bias corrected first moment and gradient
+        np.multiply(self.m, self.beta_one / correction, out=momentum)
+        np.multiply(grad, (1 - self.beta_one) / correction, out=buf)
+        momentum += buf
+        # Bias corrected second moment
+        np.divide(self.v, 1 - self.beta_two**self.t, out=buf)
+        np.sqrt(buf, out=buf)
+        buf += self.epsilon
+        np.divide(momentum, buf, out=buf)
+        buf *= learning_rate
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class AMSGrad(Optimizer):
     """AMSGrad optimizer."""
 
     def __init__(self, beta_one=0.9, beta_two=0.999, epsilon=10e-8):
+        super(AMSGrad, self).__init__()
         self.name = "AMSGrad"
         self.beta_one = beta_one        
         self.beta_two = beta_two
@@ -277,22 +492,29 @@ class AMSGrad(Optimizer):
         self.v = 0
         self.v_hat = 0
 
+    def _allocate(self, theta):
+        super(AMSGrad, self)._allocate(theta)
+        self.m = np.zeros_like(theta)
+        self.v = np.zeros_like(theta)
+        self.v_hat = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)        
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad
-        self.v = self.beta_two * self.v + (1 - self.beta_two) * np.square(grad)
-        self.v_hat = np.array(np.maximum(self.v_hat, self.v),ndmin=1)
-        theta = theta - (learning_rate / (np.sqrt(np.array(self.v_hat)) + np.array(self.epsilon))) * self.m
-        
-        return theta, grad                        
+        buf = self._buffer
+        _update_moments(self, grad, buf)
+        np.maximum(self.v_hat, self.v, out=self.v_hat)
+        np.sqrt(self.v_hat, out=buf)
+        buf += self.epsilon
+        np.divide(self.m, buf, out=buf)
+        buf *= learning_rate
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class AdamW(Optimizer):
     """AdamW optimizer."""
 
     def __init__(self, beta_one=0.9, beta_two=0.999, decay_rate=1e-4, epsilon=10e-8):
+        super(AdamW, self).__init__()
         self.name = "AdamW"
         self.beta_one = beta_one        
         self.beta_two = beta_two
@@ -303,17 +525,26 @@ class AdamW(Optimizer):
         self.v = 0
         self.v_hat = 0
 
+    def _allocate(self, theta):
+        super(AdamW, self)._allocate(theta)
+        self._decay = np.zeros_like(theta)
+        self.m = np.zeros_like(theta)
+        self.v = np.zeros_like(theta)
+        self.v_hat = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)        
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad
-        self.v = self.beta_two * self.v + (1 - self.beta_two) * np.square(grad)
-        self.v_hat = np.array(np.maximum(self.v_hat, self.v))
-        theta = theta - (learning_rate / (np.sqrt(np.array(self.v_hat,ndmin=1)) + np.array(self.epsilon, ndmin=1))) * \
-            self.m + self.decay_rate * theta
-        
-        return theta, grad          
+        buf = self._buffer
+        _update_moments(self, grad, buf)
+        np.maximum(self.v_hat, self.v, out=self.v_hat)
+        # Weight decay is computed from theta prior to the update 
+        np.multiply(theta, self.decay_rate, out=self._decay)
+        np.sqrt(self.v_hat, out=buf)
+        buf += self.epsilon
+        np.divide(self.m, buf, out=buf)
+        buf *= learning_rate
+        theta -= buf
+        theta += self._decay
 
 # --------------------------------------------------------------------------  #
 class QHAdam(Optimizer):
@@ -321,6 +552,7 @@ class QHAdam(Optimizer):
 
     def __init__(self, beta_one=0.9, beta_two=0.999, decay_rate=1e-4, epsilon=10e-8,
                  v1=1, v2=1):
+        super(QHAdam, self).__init__()
         self.name = "QH-Adam"
         self.v1 = v1
         self.v2 = v2
@@ -332,66 +564,98 @@ class QHAdam(Optimizer):
         self.v = 0
         self.v_hat = 0
 
+    def _allocate(self, theta):
+        super(QHAdam, self)._allocate(theta)
+        self._numerator = np.zeros_like(theta)
+        self.m = np.zeros_like(theta)
+        self.v = np.zeros_like(theta)
+        self.v_hat = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)        
-        self.m = self.beta_one * self.m + (1 - self.beta_one) * grad
-        self.v = self.beta_two * self.v + (1 - self.beta_two) * np.square(grad)
-        self.v_hat = np.maximum(self.v_hat, self.v)
-        theta = theta - learning_rate * (((1-self.v1)*grad + self.v1 * self.m) /\
-            (np.sqrt(np.array(1-self.v2,ndmin=1))*np.square(np.array(grad,ndmin=1))+self.v2*self.v+self.epsilon))
-        
-        return theta, grad                  
+        buf, numerator = self._buffer, self._numerator
+        _update_moments(self, grad, buf)
+        np.maximum(self.v_hat, self.v, out=self.v_hat)
+        # Quasi-hyperbolic average of the squared gradient and second moment
+        np.multiply(self.v, self.v2, out=numerator)
+        np.square(grad, out=buf)
+        buf *= math.sqrt(1 - self.v2)
+        buf += numerator
+        buf += self.epsilon
+        # Quasi-hyperbolic average of the gradient and first moment
+        np.divide(grad, buf, out=numerator)
+        numerator *= learning_rate * (1 - self.v1)
+        theta -= numerator
+        np.divide(self.m, buf, out=numerator)
+        numerator *= learning_rate * self.v1
+        theta -= numerator
 
 # --------------------------------------------------------------------------  #
 class AggMo(Optimizer):
     """Aggregated Momentum."""
 
     def __init__(self, k=3, betas=[0, 0.9, 0.999], decay_factor=0, epsilon=10e-8):
+        super(AggMo, self).__init__()
         self.name = "AggMo"
         self.k = k
         self.betas = betas
         self.t = 0
         self.v = 0
 
-        
+    def _allocate(self, theta):
+        super(AggMo, self)._allocate(theta)
+        self.v = {}
+        for beta in self.betas:
+            self.v[beta] = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)       
-        if self.v == 0:
-            self.v = {}            
-            for beta in self.betas:
-                self.v[beta] = np.zeros_like(theta)
-        buf = np.zeros_like(theta)
+        buf = self._buffer
+        buf.fill(0)
         for beta in self.betas:
-            self.v[beta] = beta * self.v[beta] - grad
-            buf = buf + self.v[beta]
-        buf = buf / self.k
-
-        theta = theta - learning_rate * buf 
-        
-        return theta, grad        
+            self.v[beta] *= beta
+            self.v[beta] -= grad
+            buf += self.v[beta]
+        buf *= learning_rate / self.k
+        theta -= buf
 
 # --------------------------------------------------------------------------  #
 class QuasiHyperbolicMomentum(Optimizer):
     """Quasi-Hyperbolic Momentum"""
 
     def __init__(self, v=0.7, beta=0.999, epsilon=10e-8):
+        super(QuasiHyperbolicMomentum, self).__init__()
         self.name = "QH-Momentum"       
         self.v = v 
         self.beta = beta
         self.t = 0
         self.m = 0
 
+    def _allocate(self, theta):
+        super(QuasiHyperbolicMomentum, self)._allocate(theta)
+        self._momentum = np.zeros_like(theta)
+        self.m = np.zeros_like(theta)
     
-    def __call__(self, gradient, learning_rate, theta, **kwargs):    
+    def _step(self, grad, learning_rate, theta):    
         self.t += 1
-        grad = gradient(theta, **kwargs)
-        self.m = self.beta * self.m + (1 - self.beta) * grad
-        theta = theta - learning_rate * ((1-self.v) * grad + self.v * self.m)
-        
-        return theta, grad                 
+        buf = self._buffer
+        np.multiply(grad, 1 - self.beta, out=buf)
+        self.m *= self.beta
+        self.m += buf
+        # Quasi-hyperbolic average of the gradient and momentum
+        np.multiply(self.m, self.v, out=self._momentum)
+        np.multiply(grad, 1 - self.v, out=buf)
+        buf += self._momentum
+        buf *= learning_rate
+        theta -= buf
 
-         
\ No newline at end of file
+# --------------------------------------------------------------------------  #
+def _update_moments(optimizer, grad, buf):
+    """Updates first and second moment estimates in place."""
+    np.multiply(grad, 1 - optimizer.beta_one, out=buf)
+    optimizer.m *= optimizer.beta_one
+    optimizer.m += buf
+    np.square(grad, out=buf)
+    buf *= 1 - optimizer.beta_two
+    optimizer.v *= optimizer.beta_two
+    optimizer.v += buf
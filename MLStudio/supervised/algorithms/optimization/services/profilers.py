@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : ML Studio                                                         #
+# Version : 0.1.0                                                             #
+# File    : profilers.py                                                      #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 9:12:44 am                       #
+# Last Modified : Sunday, October 18th 2026, 9:12:44 am                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Resource profilers that measure memory consumption during optimization.
+
+Profiling is opt-in. Each profiler operates in one of three modes:
+
+    Mode        Behavior
+    ----------  -----------------------------------------------------
+    'off'       No memory measurements are taken.
+    'sampled'   Memory is measured every 'sample_freq' epochs.
+    'full'      Memory is measured every epoch.
+
+The TraceMallocProfiler reports memory allocated by the Python interpreter
+and is accurate, but tracemalloc slows allocation heavy code considerably.
+The ResourceProfiler reports the resident set size of the process, which
+is nearly free to obtain.
+"""
+from abc import ABC, abstractmethod
+import sys
+import tracemalloc
+
+from sklearn.base import BaseEstimator
+
+from mlstudio.utils.validation import validate_int, validate_string
+# --------------------------------------------------------------------------  #
+class Profiler(ABC, BaseEstimator):
+    """Base class for all resource profilers.
+
+    Parameters
+    ----------
+    mode : str 'off', 'sampled', or 'full' (default='sampled')
+        Determines the epochs on which memory is measured.
+
+    sample_freq : int (default=10)
+        The number of epochs between measurements in 'sampled' mode.
+    """
+
+    def __init__(self, mode='sampled', sample_freq=10):
+        self.mode = mode
+        self.sample_freq = sample_freq
+        self._profiling = False
+
+    def _validate(self):
+        validate_string(param=self.mode, param_name='mode',
+                        valid_values=['off', 'sampled', 'full'])
+        validate_int(param=self.sample_freq, param_name='sample_freq',
+                     minimum=1, left='closed', right='open')
+
+    def _is_sampled(self, epoch):
+        """Returns True if memory is to be measured during this epoch."""
+        if self.mode == 'full':
+            return True
+        elif self.mode == 'sampled':
+            return epoch % self.sample_freq == 0
+        return False
+
+    def start(self, epoch):
+        """Begins measurement at the start of an epoch if sampled.
+
+        Parameters
+        ----------
+        epoch : int
+            The current epoch
+        """
+        self._validate()
+        self._profiling = self._is_sampled(epoch)
+        if self._profiling:
+            self._start()
+
+    def stop(self, epoch):
+        """Ends measurement at the end of an epoch.
+
+        Parameters
+        ----------
+        epoch : int
+            The current epoch
+
+        Returns
+        -------
+        log : dict
+            Contains 'current_memory' and 'peak_memory' in bytes. The values
+            are None if memory was not measured during the epoch.
+        """
+        log = {'current_memory': None, 'peak_memory': None}
+        if self._profiling:
+            current, peak = self._stop()
+            log['current_memory'] = current
+            log['peak_memory'] = peak
+            self._profiling = False
+        return log
+
+    @abstractmethod
+    def _start(self):
+        """Begins a measurement."""
+        pass
+
+    @abstractmethod
+    def _stop(self):
+        """Ends a measurement and returns current and peak memory in bytes."""
+        pass
+
+# --------------------------------------------------------------------------  #
+class TraceMallocProfiler(Profiler):
+    """Measures memory allocated by the interpreter via tracemalloc."""
+
+    def __init__(self, mode='sampled', sample_freq=10):
+        super(TraceMallocProfiler, self).__init__(mode=mode,
+                                                  sample_freq=sample_freq)
+        self.name = "TraceMalloc Profiler"
+
+    def _start(self):
+        tracemalloc.start()
+
+    def _stop(self):
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current, peak
+
+# --------------------------------------------------------------------------  #
+class ResourceProfiler(Profiler):
+    """Measures the resident set size (RSS) of the process.
+
+    Current memory is read from /proc/self/statm where available. Peak
+    memory is the high-water mark reported by resource.getrusage, which
+    covers the life of the process rather than the epoch. On platforms
+    without the resource module, no measurements are reported.
+    """
+
+    def __init__(self, mode='sampled', sample_freq=10):
+        super(ResourceProfiler, self).__init__(mode=mode,
+                                               sample_freq=sample_freq)
+        self.name = "Resource Profiler"
+
+    def _start(self):
+        pass
+
+    def _current_rss(self):
+        """Returns the current resident set size in bytes or None."""
+        try:
+            import resource
+            with open('/proc/self/statm') as f:
+                pages = int(f.read().split()[1])
+            return pages * resource.getpagesize()
+        except (ImportError, OSError, IndexError, ValueError):
+            return None
+
+    def _peak_rss(self):
+        """Returns the peak resident set size in bytes or None."""
+        try:
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    def _stop(self):
+        return self._current_rss(), self._peak_rss()
@@ -18,7 +18,15 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
-"""Classes used to regularize cost and gradient computations."""
+"""Classes used to regularize cost and gradient computations.
+
+The L1 penalty is not differentiable at zero, and its subgradient, 
+alpha * sign(theta), moves parameters across zero rather than onto it. 
+A regularizer set to proximal mode leaves its L1 penalty out of the 
+gradient, and a proximal optimizer, such as ISTA or FISTA, applies it 
+after each step with the prox method, which soft-thresholds the 
+parameters and so sets small ones exactly to zero. 
+"""
 from abc import ABC, abstractmethod
 import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
@@ -28,10 +36,38 @@ from mlstudio.utils import validation
 # --------------------------------------------------------------------------  #
 class Regularizer(ABC, BaseEstimator, TransformerMixin):
     """Base class for regularization classes."""
+
+    _proximal = False
+
     @abstractmethod
     def __init__(self):
         pass
 
+    def set_proximal(self, proximal=True):
+        """Leaves the non-smooth part of the penalty to the prox method."""
+        self._proximal = proximal
+
+    def prox(self, theta, step):
+        """Applies the proximal operator of the non-smooth penalty in place.
+
+        Parameters
+        ----------
+        theta : np.array shape = (n_features) or (n_features, n_classes)
+            The model parameters, which are overwritten.
+
+        step : float
+            The learning rate of the step preceding the operator.
+        """
+        return theta
+
+    def _soft_threshold(self, theta, threshold):
+        """Shrinks theta towards zero by threshold, in place."""
+        shrunk = np.abs(theta)
+        shrunk -= threshold
+        np.maximum(shrunk, 0, out=shrunk)
+        np.copysign(shrunk, theta, out=theta)
+        return theta
+
     @property
     def alpha(self):
         return self._alpha
@@ -80,7 +116,14 @@ class L1(Regularizer):
         return self.alpha * np.sum(np.abs(theta))
 
     def gradient(self, theta):        
+        if self._proximal:
+            return np.zeros_like(theta)
         return self.alpha * np.sign(theta)        
+
+    def prox(self, theta, step):
+        if self._proximal:
+            self._soft_threshold(theta, step * self.alpha)
+        return theta
     
 # --------------------------------------------------------------------------  #
 class L2(Regularizer):
@@ -118,6 +161,13 @@ class L1_L2(Regularizer):
         return self._alpha * (l1_contr + l2_contr)
 
     def gradient(self, theta):
-        l1_contr = self._ratio * np.sign(theta)
         l2_contr = (1 - self._ratio)  * theta
-        return self._alpha * (l1_contr + l2_contr) 
\ No newline at end of file
+        if self._proximal:
+            return self._alpha * l2_contr
+        l1_contr = self._ratio * np.sign(theta)
+        return self._alpha * (l1_contr + l2_contr)
+
+    def prox(self, theta, step):
+        if self._proximal:
+            self._soft_threshold(theta, step * self._alpha * self._ratio)
+        return theta 
\ No newline at end of file
@@ -12,13 +12,19 @@
 # URL     : https://github.com/decisionscients/MLStudio                       #
 # --------------------------------------------------------------------------  #
 # Created       : Sunday, May 24th 2020, 11:06:10 am                          #
-# Last Modified : Sunday, June 14th 2020, 9:48:14 pm                          #
+# Last Modified : Sunday, October 18th 2026, 4:58:02 pm                       #
 # Modified By   : John James (jjames@decisionscients.com)                     #
 # --------------------------------------------------------------------------  #
 # License : BSD                                                               #
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
 #%%
+"""Benchmarks the optimizers on the objective functions.
+
+Each optimizer is run on each objective by the BenchmarkEngine across a
+pool of processes. Results are checkpointed, so an interrupted run resumes
+where it stopped.
+"""
 from collections import OrderedDict
 from datetime import datetime
 import os
@@ -31,7 +37,8 @@ homedir = str(Path(__file__).parents[3])
 demodir = str(Path(__file__).parents[1])
 sys.path.append(homedir)
 
-from mlstudio.supervised.machine_learning.gradient_descent import GDPureOptimizer
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GD
+from mlstudio.supervised.model.benchmarking import BenchmarkEngine
 from mlstudio.supervised.visual.animations import animate_optimization
 from mlstudio.supervised.algorithms.optimization.services.benchmarks import Adjiman, StyblinskiTank, Wikipedia
 from mlstudio.supervised.algorithms.optimization.services.benchmarks import ThreeHumpCamel, Ursem01, Branin02
@@ -41,12 +48,14 @@ from mlstudio.supervised.algorithms.optimization.services.optimizers import Adam
 from mlstudio.supervised.algorithms.optimization.services.optimizers import Nadam, AMSGrad, QHAdam
 from mlstudio.supervised.algorithms.optimization.services.optimizers import QuasiHyperbolicMomentum
 from mlstudio.supervised.algorithms.optimization.services.optimizers import AggMo
+from mlstudio.supervised.algorithms.optimization.services.profilers import ResourceProfiler
 from mlstudio.utils.data_analyzer import cosine
 from mlstudio.utils.file_manager import save_df
 
 # --------------------------------------------------------------------------  #
 # Designate file locations
 figures = os.path.join(demodir, "figures")
+checkpoint = os.path.join(figures, "Benchmark Optimizations Checkpoint.csv")
 # --------------------------------------------------------------------------  #
 # Package up the objective functions
 optimizers = [Momentum(), Nesterov(), Adagrad(), Adadelta(), RMSprop(), Adam(),
@@ -56,53 +65,39 @@ optimizers = [Momentum(), Nesterov(), Adagrad(), Adadelta(), RMSprop(), Adam(),
 objectives = [Adjiman(), Branin02(), Ursem01(),
               StyblinskiTank(), ThreeHumpCamel(), Wikipedia()]
 
-# --------------------------------------------------------------------------  #
-# Train models
-solutions = OrderedDict()
-results = []
-for objective in objectives:
-    estimators = OrderedDict()   
+estimators = OrderedDict((optimizer.name, GD(eta0=0.01, epochs=500, 
+                                            optimizer=optimizer))
+                         for optimizer in optimizers)
 
-    for optimizer in optimizers:
-        estimators[optimizer.name] = {}
-        model = GDPureOptimizer(learning_rate=0.01,
-                                theta_init=objective.start, 
-                                epochs=500, objective=objective,
-                                optimizer=optimizer)
-        model.fit()
-        sim = cosine(objective.minimum, model.theta_)
-        d = {}
-        d['DateTime'] = datetime.now().strftime("%Y/%m/%d %H:%M:%S")
-        d['Objective'] = model.objective.name
-        d['Optimizer'] = optimizer.name
-        d['Epochs'] = model.epochs        
-        d['Starting Learning Rate'] = model.learning_rate
-        d['Final Learning Rate'] = model.eta
-        if model.schedule:
-            d['Schedule'] = model.schedule.name              
-        else:
-            d['Schedule'] = None            
-        d['gradient_min'] = np.min(model.get_blackbox().epoch_log.get('gradient_norm'))
-        d['gradient_max'] = np.max(model.get_blackbox().epoch_log.get('gradient_norm'))        
-        d['gradient_mean'] = np.mean(model.get_blackbox().epoch_log.get('gradient_norm'))        
-        d['True'] = objective.minimum
-        d['est'] = model.theta_
-        d['sim'] = sim
-        results.append(d)
-        estimators[optimizer.name]['model'] = model
-        estimators[optimizer.name]['results'] = d        
+tasks = OrderedDict((objective.name, {'params': {'objective': objective, 
+                                                 'theta_init': objective.start}})
+                    for objective in objectives)
 
-    solutions[objective.name] = estimators       
-
-df = pd.DataFrame(results)
-df_filename = "Benchmark Optimizations.csv"
-save_df(df, figures, df_filename)
+def similarity(estimator, task):
+    """Cosine similarity between the estimated and true minimum."""
+    return cosine(task['params']['objective'].minimum, estimator.theta_)
 
 # --------------------------------------------------------------------------  #
-# Render plots
-for title, solution in solutions.items():        
-    filename = title + " Optimization.html"
-    filepath = os.path.join(figures, title)
-    animate_optimization(estimators=solution, filepath=filepath)
+# Train models
+if __name__ == "__main__":
+    engine = BenchmarkEngine(random_state=5, checkpoint=checkpoint, 
+                             profiler=ResourceProfiler(mode='full'),
+                             metrics={'sim': similarity}, return_estimators=True)
+    df = engine.run(estimators, tasks)
+    df['DateTime'] = datetime.now().strftime("%Y/%m/%d %H:%M:%S")
+    df_filename = "Benchmark Optimizations.csv"
+    save_df(df, figures, df_filename)
 
-#%#%%
\ No newline at end of file
+    # ----------------------------------------------------------------------  #
+    # Render plots for the models fitted in this run
+    for objective in tasks:
+        solution = OrderedDict()
+        for optimizer in estimators:
+            model = engine.estimators_.get((optimizer, objective))
+            if model is not None:
+                results = df[(df['Estimator'] == optimizer) & (df['Task'] == objective)]
+                solution[optimizer] = {'model': model, 
+                                       'results': results.iloc[0].to_dict()}
+        if solution:
+            filepath = os.path.join(figures, objective)
+            animate_optimization(estimators=solution, filepath=filepath)
@@ -116,20 +116,192 @@ class BaseRegressionMetric(BaseMetric):
                                   "this Abstract Base Class.")
 
 
+def binary_confusion_matrix(y, y_pred):
+    """Computes the binary confusion matrix in a single pass over the data.
+
+    Parameters
+    ----------
+    y : array-like of shape (n_samples,)
+        The true labels in {0, 1}
+
+    y_pred : array-like of shape (n_samples,)
+        The predicted labels in {0, 1}
+
+    Returns
+    -------
+    cm : ndarray of shape (2, 2)
+        Counts with true labels in rows and predicted labels in columns,
+        i.e. [[TN, FP], [FN, TP]].
+    """
+    y = np.asarray(y).ravel()
+    y_pred = np.asarray(y_pred).ravel()
+    if y.shape != y_pred.shape:
+        msg = "y and y_pred must have the same number of observations."
+        raise ValueError(msg)
+    if not (np.isin(y, (0, 1)).all() and np.isin(y_pred, (0, 1)).all()):
+        msg = "Binary classification metrics require labels in {0, 1}."
+        raise ValueError(msg)
+    # Each (y, y_pred) pair maps to a distinct bin in 0..3        
+    idx = (2 * y + y_pred).astype(np.intp, copy=False)
+    return np.bincount(idx, minlength=4).reshape(2, 2)
+
 class BaseBinaryClassificationMetric(BaseMetric):
-    """Base class for regresssion metrics."""
+    """Base class for binary classification metrics.
+
+    Metrics are computed from the binary confusion matrix, which is 
+    counted once per call. Derived metrics share that matrix with the
+    metrics they are composed of via the _compute method. A precomputed
+    matrix may be passed as the 'confusion_matrix' keyword argument.
+    """
 
-    @abstractmethod
     def __call__(self, y, y_pred, *args, **kwargs):
+        cm = kwargs.get('confusion_matrix')
+        if cm is None:
+            cm = binary_confusion_matrix(y, y_pred)
+        return self._compute(cm)
+
+    @abstractmethod
+    def _compute(self, cm):
+        """Computes the metric from a confusion matrix [[TN, FP], [FN, TP]]."""
         raise NotImplementedError("This method is not implemented for "
                                   "this Abstract Base Class.")
 
 
+def multiclass_confusion_matrix(y, y_pred, n_classes=None):
+    """Computes the k x k confusion matrix in a single pass over the data.
+
+    Parameters
+    ----------
+    y : array-like of shape (n_samples,) or (n_samples, n_classes)
+        The true class labels in 0..k-1, or their one-hot encoding.
+
+    y_pred : array-like of shape (n_samples,) or (n_samples, n_classes)
+        The predicted class labels in 0..k-1, or class probabilities.
+
+    n_classes : int (default=None)
+        The number of classes k. If None, k is inferred from the data.
+
+    Returns
+    -------
+    cm : ndarray of shape (k, k)
+        Counts with true classes in rows and predicted classes in columns.
+    """
+    y = np.asarray(y)
+    y_pred = np.asarray(y_pred)
+    if n_classes is None:
+        n_classes = max([a.shape[1] for a in (y, y_pred) if a.ndim == 2] or [0])
+    y = y.argmax(axis=1) if y.ndim == 2 else y.ravel()
+    y_pred = y_pred.argmax(axis=1) if y_pred.ndim == 2 else y_pred.ravel()
+    if y.shape != y_pred.shape:
+        msg = "y and y_pred must have the same number of observations."
+        raise ValueError(msg)
+    y = y.astype(np.intp, copy=False)
+    y_pred = y_pred.astype(np.intp, copy=False)
+    if y.size:
+        lo = min(y.min(), y_pred.min())
+        hi = max(y.max(), y_pred.max())
+        if lo < 0:
+            raise ValueError("Class labels must be non-negative integers.")
+        n_classes = max(n_classes, hi + 1)
+    # Each (y, y_pred) pair maps to a distinct bin in 0..k^2-1
+    bins = y * n_classes + y_pred
+    cm = np.bincount(bins, minlength=n_classes**2)
+    return cm.reshape(n_classes, n_classes)
+
+def one_vs_rest(cm):
+    """Computes one-vs-rest confusion matrices from a k x k confusion matrix.
+
+    Parameters
+    ----------
+    cm : ndarray of shape (k, k)
+        Counts with true classes in rows and predicted classes in columns.
+
+    Returns
+    -------
+    ovr : ndarray of shape (2, 2, k)
+        The binary confusion matrix [[TN, FP], [FN, TP]] for each class.
+    """
+    tp = np.diag(cm)
+    fp = cm.sum(axis=0) - tp
+    fn = cm.sum(axis=1) - tp
+    tn = cm.sum() - tp - fp - fn
+    return np.array([[tn, fp], [fn, tp]])
+
 class BaseMultiClassificationMetric(BaseMetric):
-    """Base class for regresssion metrics."""
+    """Base class for multiclass classification metrics.
+
+    Metrics are computed one-vs-rest from a single k x k confusion matrix.
+    The per-class binary confusion matrices are stacked in an array of 
+    shape (2, 2, k), and each metric is evaluated for all classes at once.
+
+    Parameters
+    ----------
+    average : str 'macro', 'micro', 'weighted' or None (default='macro')
+        'macro' returns the unweighted mean of the per-class scores.
+        'micro' computes the score from the counts summed over classes.
+        'weighted' returns the mean of per-class scores weighted by support.
+        None returns the per-class scores.
+    """
+
+    _averages = ['macro', 'micro', 'weighted', None]
+
+    def __init__(self, average='macro'):
+        self.average = average
 
-    @abstractmethod
     def __call__(self, y, y_pred, *args, **kwargs):
+        cm = kwargs.get('confusion_matrix')
+        if cm is None:
+            cm = multiclass_confusion_matrix(y, y_pred)
+        return self._score(cm, self.average)
+
+    def averages(self, y, y_pred, confusion_matrix=None):
+        """Computes macro, micro and weighted averages from one pass.
+
+        Parameters
+        ----------
+        y : array-like of shape (n_samples,) or (n_samples, n_classes)
+            The true class labels or their one-hot encoding.
+
+        y_pred : array-like of shape (n_samples,) or (n_samples, n_classes)
+            The predicted class labels or class probabilities.
+
+        confusion_matrix : ndarray of shape (k, k) (default=None)
+            A precomputed confusion matrix used in place of y and y_pred.
+
+        Returns
+        -------
+        scores : dict
+            The 'macro', 'micro', and 'weighted' scores.
+        """
+        cm = confusion_matrix
+        if cm is None:
+            cm = multiclass_confusion_matrix(y, y_pred)
+        return {average: self._score(cm, average) \
+            for average in ['macro', 'micro', 'weighted']}
+
+    def _score(self, cm, average):
+        """Computes the averaged score from a k x k confusion matrix."""
+        if average not in self._averages:
+            msg = "average must be one of {v}.".format(v=str(self._averages))
+            raise ValueError(msg)
+        ovr = one_vs_rest(cm)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if average == 'micro':
+                return self._compute(ovr.sum(axis=2))
+            scores = self._compute(ovr)
+            if average == 'macro':
+                return np.mean(scores)
+            elif average == 'weighted':
+                return np.average(scores, weights=ovr[1].sum(axis=0))
+        return scores
+
+    @abstractmethod
+    def _compute(self, cm):
+        """Computes the metric from confusion matrices [[TN, FP], [FN, TP]].
+
+        The counts in cm are scalars or, for per-class scores, arrays of 
+        shape (k,). Implementations must be elementwise.
+        """
         raise NotImplementedError("This method is not implemented for "
                                   "this Abstract Base Class.")
 
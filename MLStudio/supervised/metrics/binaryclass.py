@@ -19,8 +19,10 @@
 """Scorers for binary classification metrics."""
 import math
 import numpy as np
+import pandas as pd
 from mlstudio.supervised.metrics.base import BaseBinaryClassificationMetric
-from mlstudio.supervised.metrics.base import BaseBinaryClassificationMetric
+from mlstudio.supervised.metrics.base import binary_confusion_matrix
+from mlstudio.utils.validation import validate_int, validate_string
 # --------------------------------------------------------------------------- #
 #                        CLASSIFICATION MEASURES                              #
 # --------------------------------------------------------------------------- #
@@ -32,10 +34,8 @@ class TruePositive(BaseBinaryClassificationMetric):
     _name = 'true_positive'
     _label = "True Positive (Power)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred)
-        result = df[(df['y'] == 1) & (df['y_pred'] == 1)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return int(cm[1, 1])
 
 
 class TrueNegative(BaseBinaryClassificationMetric):
@@ -44,10 +44,8 @@ class TrueNegative(BaseBinaryClassificationMetric):
     _name = 'true_negative'
     _label = "True Negative"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred)
-        result = df[(df['y'] == 0) & (df['y_pred'] == 0)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return int(cm[0, 0])
 
 class FalsePositive(BaseBinaryClassificationMetric):
     """Computes the number false positives."""
@@ -55,10 +53,8 @@ class FalsePositive(BaseBinaryClassificationMetric):
     _name = 'false_positive'
     _label = "False Positive (Type I Error)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred)
-        result = df[(df['y'] == 0) & (df['y_pred'] == 1)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return int(cm[0, 1])
 
 class FalseNegative(BaseBinaryClassificationMetric):
     """Computes the number false negatives."""
@@ -66,10 +62,8 @@ class FalseNegative(BaseBinaryClassificationMetric):
     _name = 'false_negative'
     _label = "False Negative (Type II Error)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred)
-        result = df[(df['y'] == 1) & (df['y_pred'] == 0)]
-        return len(result.index)            
+    def _compute(self, cm):
+        return int(cm[1, 0])
 # -------------------------- 1st LEVEL MEASURES ----------------------------- #
 
 class PositiveCondition(BaseBinaryClassificationMetric):
@@ -78,9 +72,9 @@ class PositiveCondition(BaseBinaryClassificationMetric):
     _name = 'positive_condition'
     _label = "Positive Condition"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred)
-        fn = FalseNegative()(y=y, y_pred=y_pred)                              
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         return tp + fn
 
 class NegativeCondition(BaseBinaryClassificationMetric):
@@ -89,10 +83,10 @@ class NegativeCondition(BaseBinaryClassificationMetric):
     _name = 'negative_condition'
     _label = "Negative Condition"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fp = FalsePositive()(y=y, y_pred=y_pred)
-        tn = TrueNegative()(y=y, y_pred=y_pred)                              
-        return fp + tn        
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return fp + tn
 # --------------------------------------------------------------------------- #
 
 class OutcomePositive(BaseBinaryClassificationMetric):
@@ -101,9 +95,9 @@ class OutcomePositive(BaseBinaryClassificationMetric):
     _name = 'outcome_positive'    
     _label = "Outcome Positive"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred)
-        fp = FalsePositive()(y=y, y_pred=y_pred)                              
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fp = FalsePositive()._compute(cm)
         return tp + fp
 
 class OutcomeNegative(BaseBinaryClassificationMetric):
@@ -112,10 +106,10 @@ class OutcomeNegative(BaseBinaryClassificationMetric):
     _name = 'outcome_negative'
     _label = "Outcome Negative"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fn = FalseNegative()(y=y, y_pred=y_pred)
-        tn = TrueNegative()(y=y, y_pred=y_pred)                              
-        return fn + tn        
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return fn + tn
 # --------------------------------------------------------------------------- #
 
 class TrueClassification(BaseBinaryClassificationMetric):
@@ -124,10 +118,10 @@ class TrueClassification(BaseBinaryClassificationMetric):
     _name = 'true_classification'
     _label = "True Classification"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred)
-        tn = TrueNegative()(y=y, y_pred=y_pred)                              
-        return tp + tn        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return tp + tn
 
 class FalseClassification(BaseBinaryClassificationMetric):
     """False classification is the sum of false positives and false negatives."""
@@ -135,10 +129,10 @@ class FalseClassification(BaseBinaryClassificationMetric):
     _name = 'false_classification'
     _label = "False Classification"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fp = FalsePositive()(y=y, y_pred=y_pred)
-        fn = FalseNegative()(y=y, y_pred=y_pred)                              
-        return fp + fn        
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
+        return fp + fn
 # ------------------------ 2ND LEVEL MEASURES ------------------------------- #
 
 class PositiveLikelihoodRatio(BaseBinaryClassificationMetric):
@@ -147,10 +141,10 @@ class PositiveLikelihoodRatio(BaseBinaryClassificationMetric):
     _name = 'positive_likelihood_ratio'
     _label = "Positive Likelihood Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)
-        fpr = FalsePositiveRate()(y, y_pred, *args, **kwargs)
-        return tpr / fpr    
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        fpr = FalsePositiveRate()._compute(cm)
+        return tpr / fpr
 
 class NegativeLikelihoodRatio(BaseBinaryClassificationMetric):
     """Negative likelihood ratio is false negative rate / true negative rate."""
@@ -158,9 +152,9 @@ class NegativeLikelihoodRatio(BaseBinaryClassificationMetric):
     _name = 'negative_likelihood_ratio'
     _label = "Negative Likelihood Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fnr = FalseNegativeRate()(y, y_pred, *args, **kwargs)
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fnr = FalseNegativeRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return fnr / tnr
 # --------------------------------------------------------------------------- #
 
@@ -170,9 +164,9 @@ class Bias(BaseBinaryClassificationMetric):
     _name = 'bias'
     _label = "Bias"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)        
-        return op / y.shape[0]
+    def _compute(self, cm):
+        op = OutcomePositive()._compute(cm)
+        return op / int(cm.sum())
 # --------------------------------------------------------------------------- #
 
 class Prevalence(BaseBinaryClassificationMetric):
@@ -181,9 +175,9 @@ class Prevalence(BaseBinaryClassificationMetric):
     _name = 'prevalence'
     _label = "Prevalence"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
-        return p / y.shape[0]
+    def _compute(self, cm):
+        p = PositiveCondition()._compute(cm)
+        return p / int(cm.sum())
 
 class Skew(BaseBinaryClassificationMetric):
     """Computes skew as ratio of negative and positive condition."""
@@ -191,9 +185,9 @@ class Skew(BaseBinaryClassificationMetric):
     _name = 'skew'
     _label = "Skew"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)        
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        n = NegativeCondition()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return n / p
 # --------------------------------------------------------------------------- #
 
@@ -203,12 +197,12 @@ class CohensKappaChance(BaseBinaryClassificationMetric):
     _name = 'cohens_kappa_chance'
     _label = "Cohen's Kappa Chance"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)        
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)        
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)                
-        return ((p * op) + (n * on)) / y.shape[0]**2
+    def _compute(self, cm):
+        n = NegativeCondition()._compute(cm)
+        p = PositiveCondition()._compute(cm)
+        op = OutcomePositive()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
+        return ((p * op) + (n * on)) / int(cm.sum())**2
 # ------------------------ 3RD LEVEL MEASURES ------------------------------- #
 
 class OddsRatio(BaseBinaryClassificationMetric):
@@ -217,12 +211,12 @@ class OddsRatio(BaseBinaryClassificationMetric):
     _name = 'odds_ratio'
     _label = "Odds Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)        
-        return (tp-tn) / (fp-fn)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
+        return (tp-tn) / (fp-fn)
 
 class DiscrimitivePower(BaseBinaryClassificationMetric):
     """Computes descrimitive power as:
@@ -232,9 +226,9 @@ class DiscrimitivePower(BaseBinaryClassificationMetric):
     _name = 'discrimitive_power'
     _label = "Discrimitive Power"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
+    def _compute(self, cm):
         return (np.sqrt(3) / np.pi) * \
-            np.log(OddsRatio()(y, y_pred, *args, **kwargs))        
+            np.log(OddsRatio()._compute(cm))
 # --------------------------------------------------------------------------- #
 #                        CLASSIFICATION METRICS                               #
 # --------------------------------------------------------------------------- #
@@ -251,9 +245,9 @@ class Accuracy(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):                
-        tc = TrueClassification()(y, y_pred, *args, **kwargs)   
-        return tc / y.shape[0]
+    def _compute(self, cm):
+        tc = TrueClassification()._compute(cm)
+        return tc / int(cm.sum())
 
 class DetectionRate(BaseBinaryClassificationMetric):
     """Computes detection rate as tp/sn."""
@@ -266,9 +260,9 @@ class DetectionRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):   
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        return tp / y.shape[0]        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        return tp / int(cm.sum())
 
 class RejectionRate(BaseBinaryClassificationMetric):
     """Computes rejection rate as tn/sn."""
@@ -281,9 +275,9 @@ class RejectionRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        return tn / y.shape[0]
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        return tn / int(cm.sum())
 # --------------------------------------------------------------------------- #
 
 class PositivePredictiveValue(BaseBinaryClassificationMetric):
@@ -297,9 +291,9 @@ class PositivePredictiveValue(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        op = OutcomePositive()._compute(cm)
         return tp / op
 
 class Precision(PositivePredictiveValue):
@@ -324,9 +318,9 @@ class NegativePredictiveValue(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
         return tn / on
 
 class FalseDiscoveryRate(BaseBinaryClassificationMetric):
@@ -340,9 +334,9 @@ class FalseDiscoveryRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        op = OutcomePositive()._compute(cm)
         return fp / op
 
 class FalseOmissionRate(BaseBinaryClassificationMetric):
@@ -356,9 +350,9 @@ class FalseOmissionRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
         return fn / on
 
 class PredictedPositiveConditionRate(BaseBinaryClassificationMetric):
@@ -372,53 +366,172 @@ class PredictedPositiveConditionRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        return tp / y.shape[0]        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        return tp / int(cm.sum())
 # --------------------------------------------------------------------------- #
 
-class AUC:
-    """Area under Receiver Operating Characteristic (ROC) Curve """
+class AUC(BaseBinaryClassificationMetric):
+    """Area under Receiver Operating Characteristic (ROC) Curve 
+
+    In 'exact' mode, the probabilities are sorted once and the true and 
+    false positive counts at each distinct threshold are obtained by 
+    cumulative sums, an O(n log n) computation. Tied probabilities form a
+    single point on the curve, so ties receive half credit.
+
+    In 'binned' mode, probabilities are counted into 'n_bins' equal width
+    bins over [0, 1], and the curve is computed from the bin counts. The
+    counts can be accumulated over chunks of data with the update method,
+    so that data which don't fit in memory can be scored in a single pass.
+    The error in the AUC is bounded by the fraction of pairs that share
+    a bin.
+
+    Parameters
+    ----------
+    mode : str 'exact' or 'binned' (default='exact')
+        The method by which the ROC curve is computed.
+
+    n_bins : int (default=1000)
+        The number of probability bins in 'binned' mode.
+
+    max_points : int (default=None)
+        The maximum number of points retained in roc_data for plotting.
+        The AUC is always computed from the full curve.
+    """
+    _code = "AUC"
+    _name = 'auc'
+    _label = "Area Under ROC Curve"
+    _best = np.max
+    _better  = np.greater
+    _worst  = -np.Inf
+    _epsilon_factor  = 1
+    _is_probability_metric = True
+
+    def __init__(self, mode='exact', n_bins=1000, max_points=None):
+        self.mode = mode
+        self.n_bins = n_bins
+        self.max_points = max_points
+        self._auc = None
+        self._roc_data = None
+        self._positives = None
+        self._totals = None
+
     @property
     def auc(self):
-        try:
-            return self._roc_data['auc'].sum()
-        except:
+        if self._auc is None:
             raise Exception("AUC has not been calculated.")            
+        return self._auc
+
     @property
     def roc_data(self):
-        try:
-            return self._roc_data
-        except:
+        if self._roc_data is None:
             raise Exception("ROC data has not been calculated.")
-    def _compute_roc_data(self, df):
-        # Compute predictions and sort by probabilities (desc)
-        df['y_prob'] = df['y_pred']
-        df['y_pred'] = int(df['y_prob'].round({'y_prob':0}))
-        df = df.sort_values(by='y_prob', axis=0, ascending=False)
-        # Add true positives and false positives
-        df['tp'] = np.where(df['y_pred']==1 & df['y']==1, 1, 0)
-        df['fp'] = np.where(df['y_pred']==1 & df['y']==0, 1, 0)
-        df['tn'] = np.where(df['y_pred']==0 & df['y']==0, 1, 0)
-        df['fn'] = np.where(df['y_pred']==0 & df['y']==1, 1, 0)
-        # Count them up
-        df['n_tp'] = df.groupby('tp').cumcount()
-        df['n_fp'] = df.groupby('fp').cumcount()
-        df['n_tn'] = df.groupby('tn').cumcount()
-        df['n_fn'] = df.groupby('fn').cumcount()
-        # Compute statistics
-        df['tpr'] = df['n_tp'] / (df['n_tp']+df['n_fn'])
-        df['fpr'] = df['n_fp'] / (df['n_fp']+df['n_tn'])
-        width = df['fpr'].diff()
-        height = (df['tpr'].shift(1) + df['tpr'])/2
-        df['auc'] = width * height
-        self._roc_data = df        
+        return self._roc_data
+
+    def _validate(self):
+        validate_string(param=self.mode, param_name='mode', 
+                        valid_values=['exact', 'binned'])
+        validate_int(param=self.n_bins, param_name='n_bins', minimum=1,
+                     left='closed', right='open')
+        if self.max_points is not None:
+            validate_int(param=self.max_points, param_name='max_points', 
+                         minimum=2, left='closed', right='open')
+
+    def _compute(self, cm):
+        raise NotImplementedError("AUC is computed from probabilities, not "
+                                  "a confusion matrix.")
+
+    def _finalize(self, tps, fps, thresholds):
+        """Computes the AUC and ROC data from cumulative counts."""
+        # Prepend the origin of the curve.
+        tps = np.r_[0, tps]
+        fps = np.r_[0, fps]
+        thresholds = np.r_[np.inf, thresholds]
+        if tps[-1] == 0 or fps[-1] == 0:
+            raise ValueError("AUC is undefined when only one class is present.")
+        tpr = tps / tps[-1]
+        fpr = fps / fps[-1]
+        self._auc = np.trapz(tpr, fpr)
+        if self.max_points is not None and len(tpr) > self.max_points:
+            idx = np.unique(np.linspace(0, len(tpr)-1, self.max_points).astype(int))
+            tpr, fpr, thresholds = tpr[idx], fpr[idx], thresholds[idx]
+        self._roc_data = pd.DataFrame({'threshold': thresholds, 'fpr': fpr,
+                                       'tpr': tpr})
+        return self._auc
+
+    def _exact(self, y, y_prob):
+        """Computes the ROC curve from the sorted probabilities."""
+        # Sort probabilities in descending order
+        order = np.argsort(y_prob, kind='mergesort')[::-1]
+        y_prob = y_prob[order]
+        y = y[order]
+        # The last index of each group of tied probabilities
+        idx = np.r_[np.flatnonzero(np.diff(y_prob)), y.size - 1]
+        tps = np.cumsum(y)[idx]
+        fps = idx + 1 - tps
+        return self._finalize(tps, fps, y_prob[idx])
+
+    def reset(self):
+        """Clears the bin counts accumulated in 'binned' mode."""
+        self._positives = np.zeros(self.n_bins)
+        self._totals = np.zeros(self.n_bins)
+
+    def update(self, y, y_prob):
+        """Accumulates bin counts for a chunk of data in 'binned' mode.
+
+        Parameters
+        ----------
+        y : array-like of shape (n_samples,)
+            The true labels in {0, 1}
+
+        y_prob : array-like of shape (n_samples,)
+            The predicted probabilities of the positive class
+
+        Returns
+        -------
+        auc : float
+            The AUC for all data accumulated since the last reset.
+        """
+        self._validate()
+        if self._totals is None or len(self._totals) != self.n_bins:
+            self.reset()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        y_prob = np.asarray(y_prob, dtype=np.float64).ravel()
+        bins = np.clip((y_prob * self.n_bins).astype(np.intp), 0, self.n_bins-1)
+        self._positives += np.bincount(bins, weights=y, minlength=self.n_bins)
+        self._totals += np.bincount(bins, minlength=self.n_bins)
+        # Accumulate counts from the highest probability bin downward
+        tps = np.cumsum(self._positives[::-1])
+        fps = np.cumsum(self._totals[::-1]) - tps
+        thresholds = np.arange(self.n_bins)[::-1] / self.n_bins
+        return self._finalize(tps, fps, thresholds)
 
     def __call__(self, y, y_pred,  *args, **kwargs):                       
-        df = self._format_results(y, y_pred, *args, **kwargs)
-        self._compute_roc_data(df)
-        return self._roc_data['auc'].sum()
+        """Computes the AUC.
+
+        Parameters
+        ----------
+        y : array-like of shape (n_samples,)
+            The true labels in {0, 1}
+
+        y_pred : array-like of shape (n_samples,)
+            The predicted probabilities of the positive class
+
+        Returns
+        -------
+        auc : float
+        """
+        self._validate()
+        y = np.asarray(y).ravel()
+        y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+        if y.shape != y_pred.shape:
+            msg = "y and y_pred must have the same number of observations."
+            raise ValueError(msg)
+        if self.mode == 'binned':
+            self.reset()
+            return self.update(y, y_pred)
+        return self._exact(y, y_pred)
+
 # --------------------------------------------------------------------------- #
 
 class TruePositiveRate(BaseBinaryClassificationMetric):
@@ -432,9 +545,9 @@ class TruePositiveRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return tp / p
 
 class Sensitivity(TruePositiveRate):
@@ -470,9 +583,9 @@ class FalseNegativeRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return fn / p
 
 class TrueNegativeRate(BaseBinaryClassificationMetric):
@@ -486,9 +599,9 @@ class TrueNegativeRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        n = NegativeCondition()._compute(cm)
         return tn / n
 
 class Specificity(TrueNegativeRate):
@@ -513,9 +626,9 @@ class FalsePositiveRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        n = NegativeCondition()._compute(cm)
         return fp / n
 # --------------------------------------------------------------------------- #
 
@@ -530,9 +643,9 @@ class MissclassificationRate(BaseBinaryClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fc = FalseClassification()(y, y_pred, *args, **kwargs)        
-        return fc / y.shape[0]
+    def _compute(self, cm):
+        fc = FalseClassification()._compute(cm)
+        return fc / int(cm.sum())
 # -------------------------- 1ST LEVEL METRICS ------------------------------ #
 
 class F1(BaseBinaryClassificationMetric):
@@ -546,9 +659,9 @@ class F1(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return 2 * (ppv * tpr) / (ppv + tpr)
 
 class F05(BaseBinaryClassificationMetric):
@@ -562,9 +675,9 @@ class F05(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return (1.25 * ppv * tpr) / (0.25 * ppv + tpr)
 
 class F2(BaseBinaryClassificationMetric):
@@ -578,9 +691,9 @@ class F2(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return (5 * ppv * tpr) / (4 * ppv + tpr)
 
 class FBeta(BaseBinaryClassificationMetric):
@@ -595,8 +708,14 @@ class FBeta(BaseBinaryClassificationMetric):
     _is_probability_metric = False
 
     def __call__(self, y, y_pred, beta,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+        cm = kwargs.get('confusion_matrix')
+        if cm is None:
+            cm = binary_confusion_matrix(y, y_pred)
+        return self._compute(cm, beta)
+
+    def _compute(self, cm, beta=1):
+        ppv = PositivePredictiveValue()._compute(cm)        
+        tpr = TruePositiveRate()._compute(cm)        
         return ((1+beta**2) * ppv * tpr) / ((1+beta**2) * ppv + tpr)
 # --------------------------------------------------------------------------- #
 
@@ -611,9 +730,9 @@ class Informedness(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return tpr + tnr - 1
 
 class Markedness(BaseBinaryClassificationMetric):
@@ -627,9 +746,9 @@ class Markedness(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        npv = NegativePredictiveValue()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        npv = NegativePredictiveValue()._compute(cm)
         return ppv + npv - 1
 
 # --------------------------------------------------------------------------- #
@@ -644,9 +763,9 @@ class BalancedAccuracy(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return (tpr + tnr) / 2
 
 class FowlkesMallowsIndex(BaseBinaryClassificationMetric):
@@ -660,9 +779,9 @@ class FowlkesMallowsIndex(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return np.sqrt(ppv * tpr)
 
 class OptimizationPrecision(BaseBinaryClassificationMetric):
@@ -676,10 +795,10 @@ class OptimizationPrecision(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        acc = Accuracy()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        acc = Accuracy()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return acc - (abs(tpr-tnr)) / (tpr+tnr)
 
 
@@ -694,10 +813,10 @@ class Jaccard(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)            
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         return tp / (tp+fp+fn)
 
 
@@ -714,9 +833,9 @@ class CohensKappa(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        acc = Accuracy()(y, y_pred, *args, **kwargs)        
-        ckc = CohensKappaChance()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        acc = Accuracy()._compute(cm)
+        ckc = CohensKappaChance()._compute(cm)
         return (acc-ckc) / (1-ckc)
 
 # --------------------------------------------------------------------------- #
@@ -731,9 +850,9 @@ class GeometricMean(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
         return np.sqrt(tp*tn)
 
 # --------------------------------------------------------------------------- #
@@ -748,15 +867,15 @@ class AdjustedGeometricMean(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        gm = GeometricMean()(y, y_pred, *args, **kwargs)       
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)         
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        gm = GeometricMean()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
         agm = 0
         if tpr > 0:
-            agm = gm+tnr(fp+tn) / (1+fp+tn)
+            agm = gm+tnr*(fp+tn) / (1+fp+tn)
         return agm
 
 # -------------------------- 2nd LEVEL METRIC ------------------------------- #
@@ -772,9 +891,9 @@ class MatthewsCorrelationCoefficient(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        inform = Informedness()(y, y_pred, *args, **kwargs)        
-        mark = Markedness()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        inform = Informedness()._compute(cm)
+        mark = Markedness()._compute(cm)
         return np.sqrt(inform * mark)
 
 # --------------------------- TEST DIAGNOSTICS ------------------------------ #
@@ -789,11 +908,11 @@ class Significance(BaseBinaryClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         numerator = ((tp*tn)-(fp*fn))**2 * (tp+tn+fp+fn)
         denominator = ((tp+fp) * (tp+fn) * (tn+fp) * (tn+fn))
-        return numerator / denominator
\ No newline at end of file
+        return numerator / denominator
@@ -20,7 +20,6 @@
 import math
 import numpy as np
 from mlstudio.supervised.metrics.base import BaseMultiClassificationMetric
-from mlstudio.supervised.metrics.base import BaseMultiClassificationMetric
 # --------------------------------------------------------------------------- #
 #                        CLASSIFICATION MEASURES                              #
 # --------------------------------------------------------------------------- #
@@ -32,10 +31,8 @@ class TruePositive(BaseMultiClassificationMetric):
     _name = 'true_positive'
     _label = "True Positive (Power)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred, *args, **kwargs)
-        result = df[(df['y'] == positive) & (df['y_pred'] == positive)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return cm[1, 1]
 
 
 class TrueNegative(BaseMultiClassificationMetric):
@@ -44,10 +41,8 @@ class TrueNegative(BaseMultiClassificationMetric):
     _name = 'true_negative'
     _label = "True Negative"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred, *args, **kwargs)
-        result = df[(df['y'] == negative) & (df['y_pred'] == negative)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return cm[0, 0]
 
 class FalsePositive(BaseMultiClassificationMetric):
     """Computes the number false positives."""
@@ -55,10 +50,8 @@ class FalsePositive(BaseMultiClassificationMetric):
     _name = 'false_positive'
     _label = "False Positive (Type I Error)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred, *args, **kwargs)
-        result = df[(df['y'] == negative) & (df['y_pred'] == positive)]
-        return len(result.index)    
+    def _compute(self, cm):
+        return cm[0, 1]
 
 class FalseNegative(BaseMultiClassificationMetric):
     """Computes the number false negatives."""
@@ -66,10 +59,8 @@ class FalseNegative(BaseMultiClassificationMetric):
     _name = 'false_negative'
     _label = "False Negative (Type II Error)"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        df = self._format_results(y=y, y_pred=y_pred, *args, **kwargs)
-        result = df[(df['y'] == positive) & (df['y_pred'] == negative)]
-        return len(result.index)            
+    def _compute(self, cm):
+        return cm[1, 0]
 # -------------------------- 1st LEVEL MEASURES ----------------------------- #
 
 class PositiveCondition(BaseMultiClassificationMetric):
@@ -78,11 +69,9 @@ class PositiveCondition(BaseMultiClassificationMetric):
     _name = 'positive_condition'
     _label = "Positive Condition"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        fn = FalseNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         return tp + fn
 
 class NegativeCondition(BaseMultiClassificationMetric):
@@ -91,12 +80,10 @@ class NegativeCondition(BaseMultiClassificationMetric):
     _name = 'negative_condition'
     _label = "Negative Condition"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fp = FalsePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        tn = TrueNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
-        return fp + tn        
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return fp + tn
 # --------------------------------------------------------------------------- #
 
 class OutcomePositive(BaseMultiClassificationMetric):
@@ -105,11 +92,9 @@ class OutcomePositive(BaseMultiClassificationMetric):
     _name = 'outcome_positive'    
     _label = "Outcome Positive"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        fp = FalsePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fp = FalsePositive()._compute(cm)
         return tp + fp
 
 class OutcomeNegative(BaseMultiClassificationMetric):
@@ -118,12 +103,10 @@ class OutcomeNegative(BaseMultiClassificationMetric):
     _name = 'outcome_negative'
     _label = "Outcome Negative"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fn = FalseNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        tn = TrueNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
-        return fn + tn        
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return fn + tn
 # --------------------------------------------------------------------------- #
 
 class TrueClassification(BaseMultiClassificationMetric):
@@ -132,12 +115,10 @@ class TrueClassification(BaseMultiClassificationMetric):
     _name = 'true_classification'
     _label = "True Classification"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        tn = TrueNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
-        return tp + tn        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return tp + tn
 
 class FalseClassification(BaseMultiClassificationMetric):
     """False classification is the sum of false positives and false negatives."""
@@ -145,12 +126,10 @@ class FalseClassification(BaseMultiClassificationMetric):
     _name = 'false_classification'
     _label = "False Classification"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fp = FalsePositive()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)
-        fn = FalseNegative()(y=y, y_pred=y_pred, negative=negative, 
-                              positive=positive)                              
-        return fp + fn        
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
+        return fp + fn
 # ------------------------ 2ND LEVEL MEASURES ------------------------------- #
 
 class PositiveLikelihoodRatio(BaseMultiClassificationMetric):
@@ -159,10 +138,10 @@ class PositiveLikelihoodRatio(BaseMultiClassificationMetric):
     _name = 'positive_likelihood_ratio'
     _label = "Positive Likelihood Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)
-        fpr = FalsePositiveRate()(y, y_pred, *args, **kwargs)
-        return tpr / fpr    
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        fpr = FalsePositiveRate()._compute(cm)
+        return tpr / fpr
 
 class NegativeLikelihoodRatio(BaseMultiClassificationMetric):
     """Negative likelihood ratio is false negative rate / true negative rate."""
@@ -170,9 +149,9 @@ class NegativeLikelihoodRatio(BaseMultiClassificationMetric):
     _name = 'negative_likelihood_ratio'
     _label = "Negative Likelihood Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        fnr = FalseNegativeRate()(y, y_pred, *args, **kwargs)
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fnr = FalseNegativeRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return fnr / tnr
 # --------------------------------------------------------------------------- #
 
@@ -182,9 +161,9 @@ class Bias(BaseMultiClassificationMetric):
     _name = 'bias'
     _label = "Bias"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)        
-        return op / y.shape[0]
+    def _compute(self, cm):
+        op = OutcomePositive()._compute(cm)
+        return op / cm.sum(axis=(0, 1))
 # --------------------------------------------------------------------------- #
 
 class Prevalence(BaseMultiClassificationMetric):
@@ -193,9 +172,9 @@ class Prevalence(BaseMultiClassificationMetric):
     _name = 'prevalence'
     _label = "Prevalence"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
-        return p / y.shape[0]
+    def _compute(self, cm):
+        p = PositiveCondition()._compute(cm)
+        return p / cm.sum(axis=(0, 1))
 
 class Skew(BaseMultiClassificationMetric):
     """Computes skew as ratio of negative and positive condition."""
@@ -203,9 +182,9 @@ class Skew(BaseMultiClassificationMetric):
     _name = 'skew'
     _label = "Skew"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)        
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        n = NegativeCondition()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return n / p
 # --------------------------------------------------------------------------- #
 
@@ -215,12 +194,12 @@ class CohensKappaChance(BaseMultiClassificationMetric):
     _name = 'cohens_kappa_chance'
     _label = "Cohen's Kappa Chance"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)        
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)        
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)        
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)                
-        return ((p * op) + (n * on)) / y.shape[0]**2
+    def _compute(self, cm):
+        n = NegativeCondition()._compute(cm)
+        p = PositiveCondition()._compute(cm)
+        op = OutcomePositive()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
+        return ((p * op) + (n * on)) / cm.sum(axis=(0, 1))**2
 # ------------------------ 3RD LEVEL MEASURES ------------------------------- #
 
 class OddsRatio(BaseMultiClassificationMetric):
@@ -229,12 +208,12 @@ class OddsRatio(BaseMultiClassificationMetric):
     _name = 'odds_ratio'
     _label = "Odds Ratio"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)        
-        return (tp-tn) / (fp-fn)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
+        return (tp-tn) / (fp-fn)
 
 class DiscrimitivePower(BaseMultiClassificationMetric):
     """Computes descrimitive power as:
@@ -244,16 +223,22 @@ class DiscrimitivePower(BaseMultiClassificationMetric):
     _name = 'discrimitive_power'
     _label = "Discrimitive Power"
 
-    def __call__(self, y, y_pred,  *args, **kwargs):
+    def _compute(self, cm):
         return (np.sqrt(3) / np.pi) * \
-            np.log(OddsRatio()(y, y_pred, *args, **kwargs))        
+            np.log(OddsRatio()._compute(cm))
 # --------------------------------------------------------------------------- #
 #                        CLASSIFICATION METRICS                               #
 # --------------------------------------------------------------------------- #
 # --------------------------- BASE METRICS ---------------------------------- #
 
 class Accuracy(BaseMultiClassificationMetric):
-    """Computes accuracy ratio of true classification and sample size."""
+    """Computes accuracy ratio of true classification and sample size.
+    
+    Accuracy is the fraction of all observations classified correctly, 
+    i.e. the trace of the k x k confusion matrix over the sample size. It
+    is the same for every average. The one-vs-rest accuracy is available 
+    via _compute.
+    """
     _code = "ACC"
     _name = 'accuracy'
     _label = "Accuracy"
@@ -263,9 +248,12 @@ class Accuracy(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):                
-        tc = TrueClassification()(y, y_pred, *args, **kwargs)   
-        return tc / y.shape[0]
+    def _compute(self, cm):
+        tc = TrueClassification()._compute(cm)
+        return tc / cm.sum(axis=(0, 1))
+
+    def _score(self, cm, average):
+        return np.trace(cm) / cm.sum()
 
 class DetectionRate(BaseMultiClassificationMetric):
     """Computes detection rate as tp/sn."""
@@ -278,9 +266,9 @@ class DetectionRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):   
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        return tp / y.shape[0]        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        return tp / cm.sum(axis=(0, 1))
 
 class RejectionRate(BaseMultiClassificationMetric):
     """Computes rejection rate as tn/sn."""
@@ -293,9 +281,9 @@ class RejectionRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        return tn / y.shape[0]
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        return tn / cm.sum(axis=(0, 1))
 # --------------------------------------------------------------------------- #
 
 class PositivePredictiveValue(BaseMultiClassificationMetric):
@@ -309,9 +297,9 @@ class PositivePredictiveValue(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        op = OutcomePositive()._compute(cm)
         return tp / op
 
 class Precision(PositivePredictiveValue):
@@ -337,9 +325,9 @@ class NegativePredictiveValue(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
         return tn / on
 
 class FalseDiscoveryRate(BaseMultiClassificationMetric):
@@ -353,9 +341,9 @@ class FalseDiscoveryRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        op = OutcomePositive()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        op = OutcomePositive()._compute(cm)
         return fp / op
 
 class FalseOmissionRate(BaseMultiClassificationMetric):
@@ -369,9 +357,9 @@ class FalseOmissionRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)
-        on = OutcomeNegative()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        on = OutcomeNegative()._compute(cm)
         return fn / on
 
 class PredictedPositiveConditionRate(BaseMultiClassificationMetric):
@@ -385,10 +373,9 @@ class PredictedPositiveConditionRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        return tp / y.shape[0]        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        return tp / cm.sum(axis=(0, 1))
 # --------------------------------------------------------------------------- #
 
 class AUC:
@@ -445,9 +432,9 @@ class TruePositiveRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return tp / p
 
 class Sensitivity(TruePositiveRate):
@@ -483,9 +470,9 @@ class FalseNegativeRate(BaseMultiClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)
-        p = PositiveCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fn = FalseNegative()._compute(cm)
+        p = PositiveCondition()._compute(cm)
         return fn / p
 
 class TrueNegativeRate(BaseMultiClassificationMetric):
@@ -499,9 +486,9 @@ class TrueNegativeRate(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        tn = TrueNegative()._compute(cm)
+        n = NegativeCondition()._compute(cm)
         return tn / n
 
 class Specificity(TrueNegativeRate):
@@ -526,14 +513,18 @@ class FalsePositiveRate(BaseMultiClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)
-        n = NegativeCondition()(y, y_pred, *args, **kwargs)
+    def _compute(self, cm):
+        fp = FalsePositive()._compute(cm)
+        n = NegativeCondition()._compute(cm)
         return fp / n
 # --------------------------------------------------------------------------- #
 
 class MissclassificationRate(BaseMultiClassificationMetric):
-    """Missclassification rate computed as false classification / negative condition."""       
+    """Missclassification rate computed as false classification / negative condition.
+
+    Like Accuracy, it is computed over all classes from the k x k confusion
+    matrix and is the same for every average.
+    """       
     _code = "MCR"
     _name = 'missclassification_rate'
     _label = "Missclassification Rate"
@@ -543,11 +534,14 @@ class MissclassificationRate(BaseMultiClassificationMetric):
     _epsilon_factor  = -1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        fc = FalseClassification()(y, y_pred, *args, **kwargs)        
-        return fc / y.shape[0]
+    def _compute(self, cm):
+        fc = FalseClassification()._compute(cm)
+        return fc / cm.sum(axis=(0, 1))
 # -------------------------- 1ST LEVEL METRICS ------------------------------ #
 
+    def _score(self, cm, average):
+        return 1 - np.trace(cm) / cm.sum()
+
 class F1(BaseMultiClassificationMetric):
     """F1 score computed as 2 * (PPV * TPR) / (PPV + TPR)."""       
     _code = "F1"
@@ -559,9 +553,9 @@ class F1(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return 2 * (ppv * tpr) / (ppv + tpr)
 
 class F05(BaseMultiClassificationMetric):
@@ -575,9 +569,9 @@ class F05(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return (1.25 * ppv * tpr) / (0.25 * ppv + tpr)
 
 class F2(BaseMultiClassificationMetric):
@@ -591,9 +585,9 @@ class F2(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return (5 * ppv * tpr) / (4 * ppv + tpr)
 
 class FBeta(BaseMultiClassificationMetric):
@@ -607,10 +601,14 @@ class FBeta(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, beta,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        return ((1+beta**2) * ppv * tpr) / ((1+beta**2) * ppv + tpr)
+    def __init__(self, beta=1, average='macro'):
+        super(FBeta, self).__init__(average=average)
+        self.beta = beta
+
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)        
+        tpr = TruePositiveRate()._compute(cm)        
+        return ((1+self.beta**2) * ppv * tpr) / ((1+self.beta**2) * ppv + tpr)
 # --------------------------------------------------------------------------- #
 
 class Informedness(BaseMultiClassificationMetric):
@@ -624,9 +622,9 @@ class Informedness(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return tpr + tnr - 1
 
 class Markedness(BaseMultiClassificationMetric):
@@ -640,9 +638,9 @@ class Markedness(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred,  *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        npv = NegativePredictiveValue()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        npv = NegativePredictiveValue()._compute(cm)
         return ppv + npv - 1
 
 # --------------------------------------------------------------------------- #
@@ -657,9 +655,9 @@ class BalancedAccuracy(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return (tpr + tnr) / 2
 
 class FowlkesMallowsIndex(BaseMultiClassificationMetric):
@@ -673,9 +671,9 @@ class FowlkesMallowsIndex(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        ppv = PositivePredictiveValue()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        ppv = PositivePredictiveValue()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
         return np.sqrt(ppv * tpr)
 
 class OptimizationPrecision(BaseMultiClassificationMetric):
@@ -689,10 +687,10 @@ class OptimizationPrecision(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        acc = Accuracy()(y, y_pred, *args, **kwargs)        
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)        
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        acc = Accuracy()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
         return acc - (abs(tpr-tnr)) / (tpr+tnr)
 
 
@@ -707,10 +705,10 @@ class Jaccard(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)            
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         return tp / (tp+fp+fn)
 
 
@@ -727,9 +725,9 @@ class CohensKappa(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        acc = Accuracy()(y, y_pred, *args, **kwargs)        
-        ckc = CohensKappaChance()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        acc = Accuracy()._compute(cm)
+        ckc = CohensKappaChance()._compute(cm)
         return (acc-ckc) / (1-ckc)
 
 # --------------------------------------------------------------------------- #
@@ -744,9 +742,9 @@ class GeometricMean(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
         return np.sqrt(tp*tn)
 
 # --------------------------------------------------------------------------- #
@@ -761,16 +759,13 @@ class AdjustedGeometricMean(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        gm = GeometricMean()(y, y_pred, *args, **kwargs)       
-        tpr = TruePositiveRate()(y, y_pred, *args, **kwargs)         
-        tnr = TrueNegativeRate()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
-        agm = 0
-        if tpr > 0:
-            agm = gm+tnr(fp+tn) / (1+fp+tn)
-        return agm
+    def _compute(self, cm):
+        gm = GeometricMean()._compute(cm)
+        tpr = TruePositiveRate()._compute(cm)
+        tnr = TrueNegativeRate()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        return np.where(tpr > 0, gm+tnr*(fp+tn) / (1+fp+tn), 0)
 
 # -------------------------- 2nd LEVEL METRIC ------------------------------- #
 
@@ -785,9 +780,9 @@ class MatthewsCorrelationCoefficient(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        inform = Informedness()(y, y_pred, *args, **kwargs)        
-        mark = Markedness()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        inform = Informedness()._compute(cm)
+        mark = Markedness()._compute(cm)
         return np.sqrt(inform * mark)
 
 # --------------------------- TEST DIAGNOSTICS ------------------------------ #
@@ -802,11 +797,11 @@ class Significance(BaseMultiClassificationMetric):
     _epsilon_factor  = 1
     _is_probability_metric = False
 
-    def __call__(self, y, y_pred, *args, **kwargs):           
-        tp = TruePositive()(y, y_pred, *args, **kwargs)        
-        tn = TrueNegative()(y, y_pred, *args, **kwargs)        
-        fp = FalsePositive()(y, y_pred, *args, **kwargs)        
-        fn = FalseNegative()(y, y_pred, *args, **kwargs)        
+    def _compute(self, cm):
+        tp = TruePositive()._compute(cm)
+        tn = TrueNegative()._compute(cm)
+        fp = FalsePositive()._compute(cm)
+        fn = FalseNegative()._compute(cm)
         numerator = ((tp*tn)-(fp*fn))**2 * (tp+tn+fp+fn)
         denominator = ((tp+fp) * (tp+fn) * (tn+fp) * (tn+fn))
-        return numerator / denominator
\ No newline at end of file
+        return numerator / denominator
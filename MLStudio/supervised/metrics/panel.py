@@ -46,6 +46,7 @@ import ZODB, ZODB.FileStorage
 from mlstudio.data.persistence.database import PanelRepoDB
 from mlstudio.utils.format import proper
 from mlstudio.supervised.metrics.regression import *
+from mlstudio.supervised.metrics.base import binary_confusion_matrix
 from mlstudio.utils.validation import validate_regression_scorer
 from mlstudio.utils.validation import validate_binaryclass_scorer
 from mlstudio.utils.validation import validate_multiclass_scorer
@@ -237,6 +238,10 @@ class AbstractPanel(persistent.Persistent):
 
         return params
 
+    def _score(self, estimator, X, y, scorer):
+        """Computes the score for a single scorer."""
+        return estimator.score(X, y)
+
     def __call__(self, estimator, X, y, reference=None):
         """Iterates through the scorers and computes scores.
         
@@ -275,7 +280,7 @@ class AbstractPanel(persistent.Persistent):
             scores['Name'] = scorer.name
             scores['Label'] = scorer.label
             estimator.set_scorer(scorer)
-            scores['Score'] = estimator.score(X, y)
+            scores['Score'] = self._score(estimator, X, y, scorer)
             df = pd.DataFrame(data=scores, index=[0])
             if self._scores is None:
                 self._scores = df
@@ -331,6 +336,35 @@ class BinaryClassPanel(AbstractPanel):
     def _validate_scorer(self, scorer):
         validation.validate_binaryclass_scorer(scorer)        
 
+    def _score(self, estimator, X, y, scorer):
+        """Computes a score from predictions shared across the panel.
+
+        Predictions and the confusion matrix are computed once per panel
+        evaluation and shared by all scorers. Volatile attributes are 
+        used so that the cached arrays are not persisted.
+        """
+        if scorer.is_probability_metric:
+            if 'y_prob' not in self._v_predictions:
+                self._v_predictions['y_prob'] = estimator.predict_proba(X)
+            return scorer(y, self._v_predictions['y_prob'], 
+                          n_features=estimator.n_features_in_)
+
+        if 'y_pred' not in self._v_predictions:
+            y_pred = estimator.predict(X)
+            self._v_predictions['y_pred'] = y_pred
+            self._v_predictions['cm'] = binary_confusion_matrix(y, y_pred)
+        return scorer(y, self._v_predictions['y_pred'], 
+                      n_features=estimator.n_features_in_,
+                      confusion_matrix=self._v_predictions['cm'])
+
+    def __call__(self, estimator, X, y, reference=None):
+        self._v_predictions = {}
+        try:
+            return super(BinaryClassPanel, self).__call__(estimator=estimator,
+                                X=X, y=y, reference=reference)
+        finally:
+            self._v_predictions = {}
+
 # --------------------------------------------------------------------------- #
 class MultiClassPanel(AbstractPanel):
     """Multiclass classification metrics panel.
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : benchmarking.py                                                   #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 4:20:51 pm                       #
+# Last Modified : Sunday, October 18th 2026, 4:20:51 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Runs a grid of estimators and tasks across a pool of processes.
+
+Each job fits a clone of one estimator on one task, a dataset or an
+objective function, and reports its timing, memory and convergence
+statistics as a row of a DataFrame.
+
+The seed of each job is derived from the engine's random_state and the
+names of the estimator and task, so results do not depend upon the number
+of processes or the order in which jobs complete. If a checkpoint file is
+provided, each row is appended to it as its job completes, and the jobs
+already recorded in it are skipped, so an interrupted run resumes where it
+stopped. Jobs recorded with an error are run again, unless retry_errors is
+False.
+"""
+from collections import OrderedDict
+import copy
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, clone
+
+from mlstudio.utils.parallel import execute
+from mlstudio.utils.validation import validate_int
+# --------------------------------------------------------------------------- #
+#                               JOBS                                          #
+# --------------------------------------------------------------------------- #
+def job_seed(random_state, estimator_name, task_name):
+    """Derives the seed of a job from the random_state and the job's names.
+
+    Parameters
+    ----------
+    random_state : int
+        The seed of the benchmark.
+
+    estimator_name, task_name : str
+        The names of the estimator and task.
+
+    Returns
+    -------
+    seed : int
+    """
+    entropy = [random_state, zlib.crc32(str(estimator_name).encode()),
+               zlib.crc32(str(task_name).encode())]
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+def _last(log, key):
+    """Returns the last value of key in a history, or None."""
+    if key not in log or len(log[key]) == 0:
+        return None
+    return log[key][-1]
+
+def _convergence_stats(estimator):
+    """Extracts convergence statistics from a fitted estimator."""
+    stats = OrderedDict()
+    stats['Epochs'] = getattr(estimator, 'n_iter_', None)
+    stats['Converged'] = getattr(estimator, 'converged', None)
+    log = {}
+    if hasattr(estimator, 'get_blackbox'):
+        log = estimator.get_blackbox().epoch_log
+    stats['Final Cost'] = _last(log, 'train_cost')
+    costs = log['train_cost'] if 'train_cost' in log else []
+    costs = np.asarray([c for c in costs if c is not None], dtype=float)
+    stats['Best Cost'] = np.nanmin(costs) if costs.size else None
+    stats['Final Score'] = _last(log, 'train_score')
+    stats['Final Val Score'] = _last(log, 'val_score')
+    stats['Final Gradient Norm'] = _last(log, 'gradient_norm')
+    return stats
+
+def _run_job(job):
+    """Fits one estimator on one task and returns its row of results.
+
+    Exceptions raised by the estimator are recorded in the 'Error' column
+    so that a failed configuration does not end the benchmark.
+    """
+    estimator_name, estimator, task_name, task, seed, profiler, metrics, \
+        return_estimator = job
+    result = OrderedDict([('Estimator', estimator_name), ('Task', task_name),
+                          ('Seed', seed), ('Fit Time (s)', None),
+                          ('Peak Memory (bytes)', None)])
+    result.update(_convergence_stats(None))
+    result.update((name, None) for name in metrics)
+    result['Error'] = None
+    try:
+        estimator = clone(estimator)
+        params = dict(task.get('params', {}))
+        if seed is not None and 'random_state' in estimator.get_params(deep=False):
+            params['random_state'] = seed
+        estimator.set_params(**params)
+        profiler = copy.deepcopy(profiler)
+        if profiler:
+            profiler.start(0)
+        start = time.perf_counter()
+        estimator.fit(task.get('X'), task.get('y'))
+        result['Fit Time (s)'] = time.perf_counter() - start
+        if profiler:
+            result['Peak Memory (bytes)'] = profiler.stop(0)['peak_memory']
+        result.update(_convergence_stats(estimator))
+        for name, metric in metrics.items():
+            result[name] = metric(estimator, task)
+    except Exception as e:
+        result['Error'] = repr(e)
+    return result, estimator if return_estimator else None
+
+# --------------------------------------------------------------------------- #
+#                           BENCHMARK ENGINE                                  #
+# --------------------------------------------------------------------------- #
+class BenchmarkEngine(BaseEstimator):
+    """Fits each estimator on each task across a pool of processes.
+
+    Parameters
+    ----------
+    n_jobs : int or None (default=None)
+        The number of worker processes. If None, one per CPU. If 1, jobs
+        are run in this process.
+
+    random_state : int or None (default=None)
+        The seed from which the seed of each job is derived and set as the
+        random_state of its estimator. If None, estimators retain their
+        own random_state.
+
+    checkpoint : str or None (default=None)
+        The path of a CSV file to which each row of results is appended.
+        Jobs whose results it already contains are not run again.
+
+    profiler : a Profiler object or None (default=None)
+        Measures the peak memory of each fit. Note that a
+        TraceMallocProfiler also slows the fit it measures.
+
+    metrics : dict or None (default=None)
+        Maps column names to functions of a fitted estimator and its task,
+        such as the distance from the true minimum of an objective.
+
+    return_estimators : bool (default=False)
+        Whether the fitted estimators are returned from the workers and
+        retained in the estimators_ attribute, keyed by estimator and
+        task names. Estimators of checkpointed jobs are not available.
+
+    pre_dispatch : int or None (default=None)
+        The maximum number of jobs submitted to the pool at once, which
+        bounds the memory taken by pickled jobs. If None, 2 * n_jobs.
+
+    retry_errors : bool (default=True)
+        Whether the jobs whose results in the checkpoint record an error 
+        are run again.
+    """
+
+    def __init__(self, n_jobs=None, random_state=None, checkpoint=None,
+                 profiler=None, metrics=None, return_estimators=False,
+                 pre_dispatch=None, retry_errors=True):
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.checkpoint = checkpoint
+        self.profiler = profiler
+        self.metrics = metrics
+        self.return_estimators = return_estimators
+        self.pre_dispatch = pre_dispatch
+        self.retry_errors = retry_errors
+
+    def _validate(self):
+        if self.n_jobs is not None:
+            validate_int(param=self.n_jobs, param_name='n_jobs', minimum=1,
+                         left='closed', right='open')
+        if self.pre_dispatch is not None:
+            validate_int(param=self.pre_dispatch, param_name='pre_dispatch',
+                         minimum=1, left='closed', right='open')
+
+    def _load_checkpoint(self):
+        """Returns the rows of results recorded in the checkpoint.
+
+        A job run again is appended to the checkpoint, so only the last 
+        row recorded for each job is returned. Rows that record an error
+        are dropped if retry_errors is True.
+        """
+        if self.checkpoint and os.path.exists(self.checkpoint):
+            df = pd.read_csv(self.checkpoint, dtype={'Estimator': str, 'Task': str})
+            df = df.drop_duplicates(subset=['Estimator', 'Task'], keep='last')
+            if self.retry_errors and 'Error' in df:
+                df = df[df['Error'].isnull()]
+            return df.to_dict('records')
+        return []
+
+    def _save_checkpoint(self, result):
+        """Appends a row of results to the checkpoint."""
+        if self.checkpoint:
+            header = not os.path.exists(self.checkpoint)
+            pd.DataFrame([result]).to_csv(self.checkpoint, mode='a',
+                                          header=header, index=False)
+
+    def _jobs(self, estimators, tasks, completed):
+        """Generates the jobs that have not been completed."""
+        metrics = self.metrics or {}
+        for estimator_name, estimator in estimators.items():
+            for task_name, task in tasks.items():
+                if (str(estimator_name), str(task_name)) in completed:
+                    continue
+                seed = None if self.random_state is None else \
+                    job_seed(self.random_state, estimator_name, task_name)
+                yield (estimator_name, estimator, task_name, task, seed,
+                       self.profiler, metrics, self.return_estimators)
+
+    def _record(self, result, estimator, results):
+        self._save_checkpoint(result)
+        results.append(result)
+        if self.return_estimators:
+            self.estimators_[(result['Estimator'], result['Task'])] = estimator
+
+    def run(self, estimators, tasks):
+        """Fits every estimator on every task.
+
+        Parameters
+        ----------
+        estimators : dict
+            Maps names to unfitted estimators, which are cloned for each job.
+
+        tasks : dict
+            Maps names to tasks. A task is a dict with the optional keys 'X'
+            and 'y', which are passed to fit, and 'params', a dict of
+            estimator parameters set for the task, such as the objective
+            of a pure optimizer.
+
+        Returns
+        -------
+        results : DataFrame
+            One row per estimator and task, in the order of the grid.
+        """
+        self._validate()
+        self.estimators_ = OrderedDict()
+        results = self._load_checkpoint()
+        completed = set((str(r['Estimator']), str(r['Task'])) for r in results)
+        jobs = self._jobs(estimators, tasks, completed)
+        for result, estimator in execute(_run_job, jobs, n_jobs=self.n_jobs,
+                                         pre_dispatch=self.pre_dispatch):
+            self._record(result, estimator, results)
+
+        # Order the rows as the grid, whatever the order of completion
+        order = {(str(e), str(t)): i for i, (e, t) in enumerate(
+            (e, t) for e in estimators for t in tasks)}
+        results.sort(key=lambda r: order.get((str(r['Estimator']),
+                                              str(r['Task'])), len(order)))
+        self.results_ = pd.DataFrame(results)
+        return self.results_
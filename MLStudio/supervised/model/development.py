@@ -28,6 +28,7 @@ import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
 from sklearn.model_selection import cross_validate, learning_curve, validation_curve
+from sklearn.metrics import check_scoring
 from sklearn.model_selection import StratifiedKFold, KFold, RepeatedKFold
 from sklearn.model_selection import ParameterGrid
 from sklearn.model_selection import RepeatedStratifiedKFold, StratifiedShuffleSplit
@@ -36,6 +37,7 @@ from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.pipeline import Pipeline
 from sklearn.utils import check_X_y, check_array
 
+from mlstudio.supervised.model.selection import NestedCV
 from mlstudio.utils.format import proper
 from mlstudio.utils.data_analyzer import one_sample_ttest, critical_values
 # --------------------------------------------------------------------------- #
@@ -69,15 +71,12 @@ class ModelBuilder(BaseEstimator, persistent.Persistent):
     inner_cv : Scikit-Learn Cross Validation object (default=KFold(n_splits=5))
         The object that controls the inner cross-validation loop 
     
-    scoring : str, callable, list/tuple, or dict, (default=None)
+    scoring : str, callable, (default=None)
         A single str (see `The scoring parameter: defining model 
         evaluation rules <https://scikit-learn.org/stable/modules/model_evaluation.html#scoring>`_) 
         or a callable (see `Defining your scoring strategy from metric 
         functions <https://scikit-learn.org/stable/modules/model_evaluation.html#scoring>`_) 
         to evaluate the predictions on the test set.
-
-        For evaluating multiple metrics, either give a list of (unique) 
-        strings or a dict with names as keys and callables as values.
         
         If None, the estimator’s score method is used.        
 
@@ -106,19 +105,20 @@ class ModelBuilder(BaseEstimator, persistent.Persistent):
         will be standardized with zero mean and unit variance.
 
     n_jobs : int, (default=None)    
-        Number of jobs to run in parallel. None means 1 unless unless in a 
-        joblib.parallel_backend context. -1 means using all processors. 
+        Number of processes across which the fits of both the inner and 
+        outer loops are run. None means one per processor, -1 means all 
+        processors, and 1 runs every fit in this process. The training data
+        are shared with the processes through memory mapped files.
 
     pre_dispatch : int, or str, (default=n_jobs)
-        Controls the number of jobs that get dispatched during parallel execution. 
-        Reducing this number can be useful to avoid an explosion of memory consumption 
-        when more jobs get dispatched than CPUs can process. This parameter can be:
+        Controls the number of jobs that are in flight at once during parallel
+        execution. Reducing this number can be useful to avoid an explosion 
+        of memory consumption when more jobs get dispatched than CPUs can 
+        process. This parameter can be:
 
-            None, in which case all the jobs are immediately created and spawned. 
-                Use this for lightweight and fast-running jobs, to avoid delays due 
-                to on-demand spawning of the jobs
+            None, in which case 2 * n_jobs jobs are in flight.
 
-            An int, giving the exact number of total jobs that are spawned
+            An int, giving the exact number of jobs in flight
 
             A str, giving an expression as a function of n_jobs, as in ‘2*n_jobs’        
 
@@ -133,24 +133,17 @@ class ModelBuilder(BaseEstimator, persistent.Persistent):
 
     Attributes
     ----------
-    performance_estimate_ : dict of float arrays of shape (n_splits,)
-        A dict containing test scores, train_scores, fit_times, and score_times.
+    results_ : dict of arrays of shape (n_splits,)
+        A dict containing test scores, train_scores, fit_times, score_times,
+        and the best parameters and fitted estimator of each outer fold.
 
-    gridsearches_ : GridSearchCV objects
-        One GridSearchCV object for each outer fold.       
+    nested_cv_ : NestedCV object
+        The nested cross-validation of the training set.
 
     cv_results_ : dict
-        Results of cross validation on the entire training set, including:
-            * hyperparameter grid
-            * train/test scores / fit times
-            * mean and standard deviation of train/test scores and fit times.
-            * the best estimator     
-            * the best hyperparameters  
-            * best score   
-            * best index   
-            * metric (function or dict)
-            * n_splits    
-            * refit time
+        Results of cross validation on the entire training set, including
+        the hyperparameter grid and the mean, standard deviation and rank of
+        the test scores. Only if refit is True.
 
     final_test_score_ : float
         The score obtained on the original hold-out test/validation set. 
@@ -248,33 +241,35 @@ class ModelBuilder(BaseEstimator, persistent.Persistent):
                 self._parameters.append(d)
         elif isinstance(self.parameters, dict):
             self._parameters = OrderedDict()
-            for k, v in params.items():
+            for k, v in self.parameters.items():
                 k = "est__" + k
                 self._parameters[k] = v                       
 
-    def _build_gridsearch_object(self):
-        """Builds a gridsearch object for inner cross-validation."""
-        self._gridsearch_object =  \
-            GridSearchCV(estimator=self._pipeline,
-                         param_grid=self._parameters,
-                         scoring=self.scoring,
-                         n_jobs=self.n_jobs,
-                         cv=self.inner_cv)
+    def _build_nested_cv_object(self):
+        """Builds the nested cross-validation object."""
+        self.nested_cv_ = \
+            NestedCV(estimator=self._pipeline,
+                     param_grid=self._parameters,
+                     outer_cv=self.outer_cv,
+                     inner_cv=self.inner_cv,
+                     scoring=self.scoring,
+                     n_jobs=self.n_jobs,
+                     pre_dispatch=self.pre_dispatch,
+                     return_train_score=self.return_train_score,
+                     refit=self.refit)
 
     def _evaluate_model_generalization(self):
         """Performs nested cross validation to estimate model building generalization."""        
-
-        cv_results = cross_validate(estimator=self._gridsearch_object,
-                                      X=self.X_train_,
-                                      y=self.y_train_,
-                                      scoring=self.scoring,
-                                      cv=self.outer_cv,
-                                      error_score='raise',
-                                      return_estimator=True,
-                                      return_train_score=self.return_train_score,
-                                      n_jobs=self.n_jobs)
-        
-        self.results_ = cv_results        
+        # The inner and outer loops and the selection of the final model
+        # are run across one pool of processes.
+        self.nested_cv_.fit(self.X_train_, self.y_train_)
+        self.results_ = self.nested_cv_.results_
+        if self.refit:
+            self.cv_results_ = self.nested_cv_.cv_results_
+            self.final_model_ = self.nested_cv_.best_estimator_
+            scorer = check_scoring(self.final_model_, scoring=self.scoring)
+            self.final_test_score_ = scorer(self.final_model_, self.X_test_, 
+                                            self.y_test_)
 
     def fit(self, X, y):
         """Performs nested cross-validation and final model selection.
@@ -287,8 +282,9 @@ class ModelBuilder(BaseEstimator, persistent.Persistent):
         self._prepare_data(X, y)
         self._build_pipeline()
         self._format_param_grid()
-        self._build_gridsearch_object()
+        self._build_nested_cv_object()
         self._evaluate_model_generalization()
+        return self
          
         
 #%%
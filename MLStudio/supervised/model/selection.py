@@ -16,3 +16,524 @@
 # License : BSD                                                               #
 # Copyright (c) 2020 nov8.ai                                                  #
 # =========================================================================== #
+"""Model selection via nested cross-validation.
+
+NestedCV runs the inner and outer loops of nested cross-validation as a
+single stream of jobs across a pool of processes. Every (outer fold,
+candidate, inner fold) fit is an independent job, so a 5 x 5 nested
+cross-validation of a grid of 10 candidates is 250 jobs rather than 5
+searches of 50, and the pool is kept busy until they are done. The inner
+search on all of the data, which selects the final model, is run in the
+same stream. Only the refits of the best candidates, which depend on the
+results of the searches, are run afterwards.
+
+The data are saved once to memory mapped files, to which the workers
+attach without copying; jobs carry only indices into them.
+
+SuccessiveHalving and Hyperband search the hyperparameters of gradient 
+descent estimators on a budget of epochs. Candidates are trained a few 
+epochs at a time with train_epoch, ranked on the last epoch recorded by 
+their BlackBox, and the worst are dropped at each rung. Survivors resume 
+where they stopped, so the winner is trained exactly as a single fit of 
+max_epochs would be.
+"""
+from collections import OrderedDict
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, clone
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import KFold, ParameterGrid, ParameterSampler
+from sklearn.utils import check_random_state
+
+from mlstudio.utils.parallel import SharedArrays, attach, effective_n_jobs, execute
+from mlstudio.utils.validation import validate_int, validate_monitor
+# --------------------------------------------------------------------------- #
+def _fit_and_score(job):
+    """Fits a candidate on the training rows and scores it on the test rows."""
+    key, estimator, params, X, y, train, test, scorer, return_train_score, \
+        return_estimator = job
+    X, y = attach(X), attach(y)
+    estimator = clone(estimator).set_params(**params)
+    result = OrderedDict()
+    start = time.perf_counter()
+    estimator.fit(X[train], y[train])
+    result['fit_time'] = time.perf_counter() - start
+    if test is not None:
+        start = time.perf_counter()
+        result['test_score'] = scorer(estimator, X[test], y[test])
+        result['score_time'] = time.perf_counter() - start
+    if return_train_score:
+        result['train_score'] = scorer(estimator, X[train], y[train])
+    if return_estimator:
+        result['estimator'] = estimator
+    return key, result
+
+# --------------------------------------------------------------------------- #
+class NestedCV(BaseEstimator):
+    """Nested cross-validation with both loops run in one pool of processes.
+
+    Parameters
+    ----------
+    estimator : Scikit-Learn compatible estimator object
+        The estimator, or pipeline, whose selection is evaluated.
+
+    param_grid : dict or list of dicts
+        The candidate parameters, as for ParameterGrid.
+
+    outer_cv : Scikit-Learn Cross Validation object (default=KFold(n_splits=5))
+        Splits the data for the evaluation of the selection process.
+
+    inner_cv : Scikit-Learn Cross Validation object (default=KFold(n_splits=5))
+        Splits each outer training set for the selection of a candidate.
+
+    scoring : str, callable or None (default=None)
+        A single metric, as for check_scoring. If None, the estimator's
+        score method is used.
+
+    n_jobs : int or None (default=None)
+        The number of processes. None means one per CPU, -1 all CPUs, and
+        1 runs all jobs in this process without memory mapping the data.
+
+    pre_dispatch : int, str or None (default='2*n_jobs')
+        The maximum number of jobs in flight, or an expression of n_jobs.
+
+    return_train_score : bool (default=True)
+        Whether the outer results include scores on the training sets.
+
+    refit : bool (default=True)
+        Whether the best candidate of a search of all of the data is refit
+        on all of the data as best_estimator_.
+
+    temp_folder : str or None (default=None)
+        The folder for the memory mapped data. If None, the system's
+        temporary folder.
+
+    Attributes
+    ----------
+    results_ : dict
+        For each outer fold, the 'test_score', 'train_score', 'fit_time',
+        and 'score_time' of its best candidate refit on its training set,
+        as with cross_validate, and its 'best_params' and 'estimator'.
+
+    cv_results_ : dict
+        The 'params', 'mean_test_score', 'std_test_score' and
+        'rank_test_score' of the candidates in the search of all of the data.
+
+    best_params_, best_score_, best_estimator_ :
+        The best candidate of the search of all of the data, its mean inner
+        test score, and the candidate refit on all of the data.
+
+    scorer_ : callable
+        The scorer used.
+    """
+
+    def __init__(self, estimator, param_grid, outer_cv=KFold(n_splits=5),
+                 inner_cv=KFold(n_splits=5), scoring=None, n_jobs=None,
+                 pre_dispatch='2*n_jobs', return_train_score=True, refit=True,
+                 temp_folder=None):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.outer_cv = outer_cv
+        self.inner_cv = inner_cv
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.pre_dispatch = pre_dispatch
+        self.return_train_score = return_train_score
+        self.refit = refit
+        self.temp_folder = temp_folder
+
+    def _searches(self, X, y):
+        """Returns the rows searched and the splits of their inner folds.
+
+        The outer training sets are searched to evaluate the selection 
+        process, and all of the rows are searched if the final model is refit.
+        """
+        self._outer = [(train, test) for train, test in self.outer_cv.split(X, y)]
+        rows = [train for train, _ in self._outer]
+        if self.refit:
+            rows.append(np.arange(len(y)))
+        searches = []
+        for train in rows:
+            # Inner splits need only the number of rows and the target
+            splits = self.inner_cv.split(np.empty((len(train), 0)), y[train])
+            searches.append([(train[a], train[b]) for a, b in splits])
+        return searches
+
+    def _search_jobs(self, searches, X, y):
+        for s, folds in enumerate(searches):
+            for c, params in enumerate(self._candidates):
+                for f, (train, test) in enumerate(folds):
+                    yield ((s, c, f), self.estimator, params, X, y, train, test,
+                           self.scorer_, False, False)
+
+    def _refit_jobs(self, best, X, y):
+        for k, (train, test) in enumerate(self._outer):
+            yield (k, self.estimator, self._candidates[best[k]], X, y, train, 
+                   test, self.scorer_, self.return_train_score, True)
+        if self.refit:
+            yield (len(self._outer), self.estimator, self._candidates[best[-1]],
+                   X, y, np.arange(len(y)), None, self.scorer_, False, True)
+
+    def fit(self, X, y):
+        """Performs nested cross-validation and selects the final model.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+        
+        y : array-like of shape (n_samples,)
+
+        Returns
+        -------
+        self
+        """
+        X, y = np.asarray(X), np.asarray(y)
+        self.scorer_ = check_scoring(self.estimator, scoring=self.scoring)
+        self._candidates = list(ParameterGrid(self.param_grid))
+        searches = self._searches(X, y)
+        n_jobs = effective_n_jobs(self.n_jobs)
+
+        with SharedArrays({'X': X, 'y': y}, shared=n_jobs > 1, 
+                          temp_folder=self.temp_folder) as refs:
+            # Every fit of every search is run in a single stream of jobs
+            scores = np.empty((len(searches), len(self._candidates),
+                               max(len(folds) for folds in searches)))
+            scores.fill(np.nan)
+            jobs = self._search_jobs(searches, refs['X'], refs['y'])
+            for (s, c, f), result in execute(_fit_and_score, jobs, n_jobs, 
+                                             self.pre_dispatch):
+                scores[s, c, f] = result['test_score']
+            mean_scores = np.nanmean(scores, axis=2)
+            best = np.argmax(mean_scores, axis=1)
+
+            # The best candidate of each search is refit on its rows
+            jobs = self._refit_jobs(best, refs['X'], refs['y'])
+            refits = dict(execute(_fit_and_score, jobs, n_jobs, self.pre_dispatch))
+
+        keys = ['test_score', 'fit_time', 'score_time']
+        if self.return_train_score:
+            keys.append('train_score')
+        n_outer = len(self._outer)
+        self.results_ = OrderedDict((k, np.array([refits[i][k] \
+            for i in range(n_outer)])) for k in keys)
+        self.results_['best_params'] = [self._candidates[best[i]] for i in range(n_outer)]
+        self.results_['estimator'] = [refits[i]['estimator'] for i in range(n_outer)]
+
+        if self.refit:
+            final = mean_scores[-1]
+            self.cv_results_ = OrderedDict()
+            self.cv_results_['params'] = self._candidates
+            self.cv_results_['mean_test_score'] = final
+            self.cv_results_['std_test_score'] = np.nanstd(scores[-1], axis=1)
+            self.cv_results_['rank_test_score'] = \
+                np.argsort(np.argsort(-final)) + 1
+            self.best_params_ = self._candidates[best[-1]]
+            self.best_score_ = final[best[-1]]
+            self.best_estimator_ = refits[n_outer]['estimator']
+        return self
+
+# --------------------------------------------------------------------------- #
+#                            SUCCESSIVE HALVING                               #
+# --------------------------------------------------------------------------- #
+def _rank(scores, better):
+    """Returns the order of scores from best to worst, with nan last."""
+    scores = np.asarray(scores, dtype=float)
+    keys = -scores if better(1, 0) else scores.copy()
+    keys[np.isnan(keys)] = np.inf
+    return np.argsort(keys, kind='stable')
+
+class SuccessiveHalving(BaseEstimator):
+    """Successive halving search of a gradient descent estimator.
+
+    Every candidate is trained for min_epochs, after which all but the best
+    1/factor of them are dropped. The survivors are trained on to factor
+    times as many epochs, and so on until max_epochs, so that most of the
+    budget is spent on the most promising candidates. The data are processed
+    and split once, and shared by the candidates.
+
+    Parameters
+    ----------
+    estimator : GradientDescent estimator
+        The estimator to be tuned. Its epochs parameter is set to max_epochs.
+
+    param_grid : dict or list of dicts
+        The candidate parameters, as for ParameterGrid or, if n_candidates
+        is not None, ParameterSampler.
+
+    n_candidates : int or None (default=None)
+        The number of candidates sampled from param_grid. If None, every
+        candidate in the grid is searched.
+
+    monitor : str (default='val_score')
+        The entry of the epoch log on which candidates are ranked. One of
+        'train_cost', 'train_score', 'val_cost', 'val_score' and 
+        'gradient_norm'. Costs are minimized and scores are ranked according
+        to the estimator's scorer.
+
+    min_epochs : int or None (default=None)
+        The epochs for which all candidates are trained. If None, the number
+        at which a single candidate remains at max_epochs.
+
+    max_epochs : int or None (default=None)
+        The epochs for which the best candidates are trained. If None, the
+        epochs of the estimator.
+
+    factor : int (default=3)
+        The proportion of candidates dropped, and the growth in epochs, at
+        each rung.
+
+    random_state : int or None (default=None)
+        Seeds the sampling of candidates.
+
+    Attributes
+    ----------
+    results_ : pd.DataFrame
+        The bracket, rung, candidate, parameters, epochs and monitored value
+        of every candidate at every rung.
+
+    best_params_, best_score_, best_estimator_ :
+        The best candidate trained for max_epochs, its monitored value, and
+        the trained estimator.
+
+    n_epochs_ : int
+        The total number of epochs trained across all candidates.
+    """
+
+    # Parameters that change how the data are processed or split
+    _DATA_PARAMS = ('data_processor', 'val_size', 'random_state', 'dtype')
+
+    def __init__(self, estimator, param_grid, n_candidates=None, 
+                 monitor='val_score', min_epochs=None, max_epochs=None, 
+                 factor=3, random_state=None):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.n_candidates = n_candidates
+        self.monitor = monitor
+        self.min_epochs = min_epochs
+        self.max_epochs = max_epochs
+        self.factor = factor
+        self.random_state = random_state
+
+    def _validate(self):
+        validate_monitor(self.monitor)
+        validate_int(param=self.factor, param_name='factor', minimum=2, 
+                     left='closed', right='open')
+        for name in ('n_candidates', 'min_epochs', 'max_epochs'):
+            if getattr(self, name) is not None:
+                validate_int(param=getattr(self, name), param_name=name, 
+                             minimum=1, left='closed', right='open')
+        if 'val' in self.monitor and not self.estimator.val_size:
+            msg = "Monitoring {m} requires an estimator with a val_size.".format(
+                m=self.monitor)
+            raise ValueError(msg)
+
+    def _sample(self, n_candidates, random_state):
+        """Returns a list of candidate parameters."""
+        if n_candidates is None:
+            candidates = list(ParameterGrid(self.param_grid))
+        else:
+            candidates = list(ParameterSampler(self.param_grid, n_candidates,
+                                               random_state=random_state))
+        for params in candidates:
+            if 'epochs' in params:
+                raise ValueError("The epochs are allocated by the search and "
+                                 "can not be searched.")
+        return candidates
+
+    def _process_data(self, X, y):
+        """Processes and splits the data once for all candidates."""
+        return clone(self.estimator)._process_data(X, y)
+
+    def _start(self, params, X, y, data=None):
+        """Returns a candidate ready to train, without training it.
+
+        The candidate is given the data processed by _process_data, unless 
+        its parameters change how the data are processed or split.
+        """
+        estimator = clone(self.estimator).set_params(epochs=self._max_epochs, 
+                                                     **params)
+        if any(k.split('__')[0] in self._DATA_PARAMS for k in params):
+            data = None
+        estimator._on_train_begin({'X': X, 'y': y, 'data': data})
+        return estimator
+
+    def _resume(self, estimator, epochs):
+        """Trains a candidate on from its last epoch, to epochs in total."""
+        blackbox = estimator.get_blackbox()
+        start = blackbox.total_epochs
+        while blackbox.total_epochs < epochs and not estimator.converged:
+            estimator.train_epoch()
+        self.n_epochs_ += blackbox.total_epochs - start
+        return blackbox.epoch_log[self.monitor][-1]
+
+    def _better(self, estimator):
+        """Returns the comparison of monitored values, as PerformanceObserver."""
+        if 'score' in self.monitor:
+            return estimator.get_scorer().better
+        return np.less
+
+    def _halve(self, candidates, min_epochs, X, y, data=None, bracket=0):
+        """Runs successive halving of candidates, from min_epochs.
+
+        Returns the index of the best candidate, its monitored value and
+        its estimator, trained for max_epochs.
+        """
+        survivors = OrderedDict((k, self._start(params, X, y, data)) \
+            for k, params in enumerate(candidates))
+        epochs, rung = min_epochs, 0
+        while True:
+            scores = [self._resume(estimator, epochs) for estimator in \
+                survivors.values()]
+            for k, score in zip(survivors, scores):
+                self._results.append(OrderedDict([('Bracket', bracket), 
+                    ('Rung', rung), ('Candidate', k), ('Params', candidates[k]),
+                    ('Epochs', epochs), (self.monitor, score)]))
+            better = self._better(next(iter(survivors.values())))
+            order = _rank(scores, better)
+            keys = list(survivors)
+            if epochs >= self._max_epochs:
+                break
+            # Eliminated candidates are released
+            n_keep = max(1, len(survivors) // self.factor)
+            survivors = OrderedDict((keys[i], survivors[keys[i]]) \
+                for i in order[:n_keep])
+            epochs = min(self._max_epochs, epochs * self.factor)
+            rung += 1
+        best = keys[order[0]]
+        return best, scores[order[0]], survivors[best], better
+
+    def _finish(self, best, score, estimator, params):
+        """Finalizes the best candidate and posts the results."""
+        estimator._on_train_end()
+        self.best_params_ = params
+        self.best_score_ = score
+        self.best_estimator_ = estimator
+        self.results_ = pd.DataFrame(self._results)
+
+    def fit(self, X, y=None):
+        """Searches the candidates by successive halving.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+        
+        y : array-like of shape (n_samples,)
+
+        Returns
+        -------
+        self
+        """
+        self._validate()
+        self._max_epochs = self.max_epochs or self.estimator.epochs
+        self._results = []
+        self.n_epochs_ = 0
+        candidates = self._sample(self.n_candidates, self.random_state)
+        min_epochs = self.min_epochs
+        if min_epochs is None:
+            n_rungs = int(math.log(len(candidates), self.factor) + 1e-9)
+            min_epochs = max(1, self._max_epochs // self.factor**n_rungs)
+        data = self._process_data(X, y)
+        best, score, estimator, _ = self._halve(candidates, min_epochs, X, y, 
+                                                data)
+        self._finish(best, score, estimator, candidates[best])
+        return self
+
+# --------------------------------------------------------------------------- #
+class Hyperband(SuccessiveHalving):
+    """Hyperband search of a gradient descent estimator.
+
+    Successive halving must trade the number of candidates against the
+    epochs each is allowed before the first elimination. Hyperband hedges 
+    by running brackets of successive halving from many candidates trained
+    for few epochs down to a few candidates trained for max_epochs. Each
+    bracket samples its own candidates, and the best of the bracket winners
+    is selected.
+
+    Parameters
+    ----------
+    estimator : GradientDescent estimator
+        The estimator to be tuned. Its epochs parameter is set to max_epochs.
+
+    param_grid : dict or list of dicts
+        The distributions or lists of candidate parameters, as for 
+        ParameterSampler.
+
+    monitor : str (default='val_score')
+        The entry of the epoch log on which candidates are ranked.
+
+    min_epochs : int (default=1)
+        The fewest epochs for which candidates are trained, in the most
+        aggressive bracket.
+
+    max_epochs : int or None (default=None)
+        The epochs for which the best candidates are trained. If None, the
+        epochs of the estimator.
+
+    factor : int (default=3)
+        The proportion of candidates dropped, and the growth in epochs, at
+        each rung.
+
+    random_state : int or None (default=None)
+        Seeds the sampling of candidates.
+
+    Attributes
+    ----------
+    results_ : pd.DataFrame
+        The bracket, rung, candidate, parameters, epochs and monitored value
+        of every candidate at every rung. Candidates are numbered within 
+        their bracket.
+
+    best_params_, best_score_, best_estimator_ :
+        The best bracket winner, its monitored value, and the trained 
+        estimator.
+
+    n_epochs_ : int
+        The total number of epochs trained across all candidates.
+    """
+
+    def __init__(self, estimator, param_grid, monitor='val_score', 
+                 min_epochs=1, max_epochs=None, factor=3, random_state=None):
+        super(Hyperband, self).__init__(estimator=estimator, 
+                                        param_grid=param_grid, 
+                                        monitor=monitor, 
+                                        min_epochs=min_epochs, 
+                                        max_epochs=max_epochs, 
+                                        factor=factor, 
+                                        random_state=random_state)
+
+    def fit(self, X, y=None):
+        """Searches the candidates by Hyperband.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+        
+        y : array-like of shape (n_samples,)
+
+        Returns
+        -------
+        self
+        """
+        self._validate()
+        self._max_epochs = self.max_epochs or self.estimator.epochs
+        self._results = []
+        self.n_epochs_ = 0
+        rng = check_random_state(self.random_state)
+        s_max = int(math.log(self._max_epochs / (self.min_epochs or 1), 
+                             self.factor) + 1e-9)
+        data = self._process_data(X, y)
+        winners = []
+        for s in range(s_max, -1, -1):
+            n_candidates = int(math.ceil((s_max + 1) / (s + 1) * self.factor**s))
+            min_epochs = max(1, self._max_epochs // self.factor**s)
+            candidates = self._sample(n_candidates, rng.randint(2**31 - 1))
+            best, score, estimator, better = self._halve(candidates, min_epochs, 
+                                                         X, y, data, s_max - s)
+            winners.append((score, estimator, candidates[best], best))
+        order = _rank([w[0] for w in winners], better)
+        score, estimator, params, best = winners[order[0]]
+        self._finish(best, score, estimator, params)
+        return self
@@ -23,8 +23,99 @@
 import math
 from math import erf
 import numpy as np
+from scipy.linalg import qr
 from scipy.stats import norm
 
+# --------------------------------------------------------------------------- #
+#                               INFLUENCE                                     #
+# --------------------------------------------------------------------------- #
+class Influence:
+    """Residual and influence diagnostics from a single factorization of X.
+
+    The design matrix is factored once by a thin, column pivoted QR 
+    decomposition, X P = Q R, in O(np^2) time and O(np) memory. The 
+    leverage scores, i.e. the diagonal of the hat matrix 
+    H = X(X^TX)^{-1}X^T, are the squared row norms of the first rank(X) 
+    columns of Q, so H itself is never formed. The rank of X is read from
+    the diagonal of R. The diagnostics are computed on first access and
+    shared thereafter.
+
+    Parameters
+    ----------
+    X : ndarray or DataFrame of shape n x m
+        A matrix of n instances with m features
+    
+    y : ndarray or Series of length n
+        An array or series of target or class values 
+
+    y_pred : ndarray or Series of length n
+        An array or series of predictions         
+    """
+
+    def __init__(self, X, y=None, y_pred=None):
+        X = np.asarray(X, dtype=np.float64)
+        self.n, self.p = X.shape
+        Q, R, _ = qr(X, mode='economic', pivoting=True)
+        diag = np.abs(np.diag(R))
+        tol = diag.max() * max(self.n, self.p) * np.finfo(R.dtype).eps \
+            if diag.size else 0
+        self.rank = int(np.sum(diag > tol))
+        self._Q = Q[:, :self.rank]
+        self._residuals = None if y is None or y_pred is None else \
+            np.asarray(y).ravel() - np.asarray(y_pred).ravel()
+        self._leverage = None
+        self._standardized_residuals = None
+        self._studentized_residuals = None
+
+    def _check_residuals(self):
+        if self._residuals is None:
+            raise ValueError("y and y_pred are required for residual diagnostics.")
+        return self._residuals
+
+    @property
+    def leverage(self):
+        """Diagonal of the hat matrix."""
+        if self._leverage is None:
+            self._leverage = np.einsum('ij,ij->i', self._Q, self._Q)
+        return self._leverage
+
+    @property
+    def standardized_residuals(self):
+        """Residuals divided by an estimate of their standard deviation."""
+        if self._standardized_residuals is None:
+            residuals = self._check_residuals()
+            df = self.n - self.rank
+            mse = np.dot(residuals, residuals) / df
+            self._standardized_residuals = residuals / \
+                np.sqrt(mse * (1-self.leverage))
+        return self._standardized_residuals
+
+    @property
+    def studentized_residuals(self):
+        """Deleted residuals divided by their estimated standard deviation."""
+        if self._studentized_residuals is None:
+            # Using the calculation from 
+            # https://newonlinecourses.science.psu.edu/stat462/node/247/
+            n, k = self.n, self.p
+            r = self.standardized_residuals
+            self._studentized_residuals = r * np.sqrt((n-k-2)/(n-k-1-np.square(r)))
+        return self._studentized_residuals
+
+    @property
+    def cooks_distance(self):
+        """Cook's distance for each observation."""
+        e = self._check_residuals()
+        n, p = self.n, self.p
+        s2 = np.dot(e, e) / (n-p)
+        hii = self.leverage
+        return (e**2/ (p * s2)) * (hii/(1-hii)**2)    
+
+    @property
+    def dffits(self):
+        """Difference in fits for each observation."""
+        hii = self.leverage
+        return self.studentized_residuals * np.sqrt(hii/(1-hii))
+
 # --------------------------------------------------------------------------- #
 #                           RESIDUAL ANALYSIS                                 #
 # --------------------------------------------------------------------------- #
@@ -47,21 +138,7 @@ def standardized_residuals(X, y, y_pred):
     y_pred : ndarray or Series of length n
         An array or series of predictions         
     """
-    # Compute residuals
-    residuals = y - y_pred
-    
-    # Compute Leverage
-    hii = leverage(X)
-    
-    # Compute degrees of freedom and MSE
-    rank = np.linalg.matrix_rank(X)
-    df = X.shape[0] - rank
-    mse = np.matmul(residuals, residuals) / df
-
-    # Calculate standardized 
-    standardized_residuals = residuals / np.sqrt(mse  * (1-hii))
-    
-    return standardized_residuals
+    return Influence(X, y, y_pred).standardized_residuals
 
 def studentized_residuals(X, y, y_pred):
     """Computes studentized residuals.
@@ -83,16 +160,7 @@ def studentized_residuals(X, y, y_pred):
     y_pred : ndarray or Series of length n
         An array or series of predictions         
     """    
-    # Using the calculation from 
-    # https://newonlinecourses.science.psu.edu/stat462/node/247/
-    n = X.shape[0]
-    k = X.shape[1]
-    r = standardized_residuals(X=X, y=y, y_pred=y_pred)
-
-    # Calculate studentized residuals 
-    studentized_residuals = r * np.sqrt((n-k-2)/(n-k-1-np.square(r)))
-
-    return studentized_residuals   
+    return Influence(X, y, y_pred).studentized_residuals
 
 # --------------------------------------------------------------------------- #
 #                               QUANTILES                                     #
@@ -167,9 +235,7 @@ def leverage(X):
         Contains the leverage scores for each observation.
     """
 
-    hat = X.dot(np.linalg.inv(X.T.dot(X)).dot(X.T))
-    hii = np.diagonal(hat)
-    return hii
+    return Influence(X).leverage
 
 def cooks_distance(X, y, y_pred):
     """Computes Cook's Distance, a commonly used measure of data point influence.
@@ -205,18 +271,7 @@ def cooks_distance(X, y, y_pred):
             November 29, 2019, from 
             https://en.wikipedia.org/w/index.php?title=Cook%27s_distance&oldid=922838890
     """
-    # Compute residual
-    e = y - y_pred
-    # Set number of observations and predictors
-    n = X.shape[0]
-    p = X.shape[1]
-    # S squared 
-    s2 = np.matmul(e.T,e) / (n-p)
-    # Compute leverage
-    hii = leverage(X)
-    # Obtain studentized residuals 
-    cooks_d = (e**2/ (p * s2)) * (hii/(1-hii)**2)    
-    return cooks_d
+    return Influence(X, y, y_pred).cooks_distance
 
 def dffits(X, y, y_pred):
     """Computes the difference in fits (DFFITS).
@@ -269,7 +324,4 @@ def dffits(X, y, y_pred):
            and Mathematical Statistics. New York: John Wiley & Sons. 
            pp. 11–16. ISBN 0-471-05856-4.
     """
-    r_student = studentized_residuals(X, y, y_pred)
-    hii = leverage(X)
-    df = r_student * np.sqrt(hii/(1-hii))
-    return df
\ No newline at end of file
+    return Influence(X, y, y_pred).dffits
\ No newline at end of file
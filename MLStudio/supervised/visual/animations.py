@@ -99,12 +99,12 @@ def animate_optimization(estimators, max_frames=None, filepath=None, show=True):
         xm, xM = x['min'], x['max']
         ym, yM = y['min'], y['max']
         # Extract model data for plotting gradient descent models         
-        theta = model.get_blackbox().epoch_log.get('theta')
+        theta = np.asarray(model.get_blackbox().epoch_log.get('theta'))
         # Obtain step number for slicing if max_frames is provided.
         step = math.floor(len(theta) / max_frames) if max_frames else None
         # Clip thetas to plotting range 
-        theta_0 = np.clip(np.array(theta['theta_0']), xm, xM)
-        theta_1 = np.clip(np.array(theta['theta_1']), ym, yM)
+        theta_0 = np.clip(theta[:,0], xm, xM)
+        theta_1 = np.clip(theta[:,1], ym, yM)
         # Store individual thetas in dictionary 
         d = OrderedDict()
         d['theta_0'] = theta_0[::step]
@@ -142,8 +142,8 @@ def animate_optimization(estimators, max_frames=None, filepath=None, show=True):
     theta1_mesh = np.linspace(theta1_min, theta1_max, 50)
     theta0_mesh_grid, theta1_mesh_grid = np.meshgrid(theta0_mesh, theta1_mesh)        
     # Create z axis grid based upon X,y and the grid of thetas
-    Js = np.array([objective(THETA) for THETA in zip(np.ravel(theta0_mesh_grid), np.ravel(theta1_mesh_grid))])
-    Js = Js.reshape(theta0_mesh_grid.shape)          
+    THETAS = np.c_[np.ravel(theta0_mesh_grid), np.ravel(theta1_mesh_grid)]
+    Js = objective(THETAS).reshape(theta0_mesh_grid.shape)          
 
     # ------------------------------------------------------------------  #
     # Add colors to model
@@ -339,12 +339,11 @@ def animate_optimization_regression(estimators, max_frames=None, filepath=None,
 
     # ------------------------------------------------------------------  #
     # Create function to create mesh grid of costs 
-    def cost_mesh(X, y, THETA):
-        return(np.sum((X.dot(THETA) - y)**2)/(2*len(y)))          
+    def cost_mesh(X, y, THETAS):
+        return(np.sum((X.dot(THETAS.T) - np.asarray(y)[:, np.newaxis])**2, axis=0)/(2*len(y)))
     # Create z axis grid based upon X,y and the grid of thetas
-    Js = np.array([cost_mesh(X_train_, y_train_, THETA)
-                for THETA in zip(np.ravel(theta0_mesh_grid), np.ravel(theta1_mesh_grid))])
-    Js = Js.reshape(theta0_mesh_grid.shape)          
+    THETAS = np.c_[np.ravel(theta0_mesh_grid), np.ravel(theta1_mesh_grid)]
+    Js = cost_mesh(X_train_, y_train_, THETAS).reshape(theta0_mesh_grid.shape)          
     
     # ------------------------------------------------------------------  #
     # Create regression line data
@@ -488,8 +487,8 @@ class SingleModelSearch3D:
     def __init__(self):
         pass        
 
-    def _cost_mesh(self,X, y, THETA):
-        return(np.sum((X.dot(THETA) - y)**2)/(2*len(y)))        
+    def _cost_mesh(self,X, y, THETAS):
+        return(np.sum((X.dot(THETAS.T) - np.asarray(y)[:, np.newaxis])**2, axis=0)/(2*len(y)))        
 
     def search(self, model, directory=None, filename=None, fontsize=None,
                     interval=200, secs=10, maxframes=100):
@@ -530,9 +529,8 @@ class SingleModelSearch3D:
         theta0_mesh, theta1_mesh = np.meshgrid(theta0_mesh, theta1_mesh)
 
         # Create cost grid based upon X,y and the grid of thetas
-        Js = np.array([self._cost_mesh(model.X, model.y, THETA)
-                    for THETA in zip(np.ravel(theta0_mesh), np.ravel(theta1_mesh))])
-        Js = Js.reshape(theta0_mesh.shape)
+        THETAS = np.c_[np.ravel(theta0_mesh), np.ravel(theta1_mesh)]
+        Js = self._cost_mesh(model.X, model.y, THETAS).reshape(theta0_mesh.shape)
 
         # Set Title
         plt.rc('text', usetex=True)
@@ -753,8 +751,8 @@ class MultiModelSearch3D(animation.FuncAnimation):
             line.set_3d_properties(zpath[:i*nth])
         return self.lines
 
-    def _cost_mesh(self,X, y, THETA):
-        return(np.sum((X.dot(THETA) - y)**2)/(2*len(y))) 
+    def _cost_mesh(self,X, y, THETAS):
+        return(np.sum((X.dot(THETAS.T) - np.asarray(y)[:, np.newaxis])**2, axis=0)/(2*len(y))) 
 
     def _meshgrid(self, models):
         theta0_mins = []
@@ -787,9 +785,8 @@ class MultiModelSearch3D(animation.FuncAnimation):
 
         # Create cost grid based upon x,y the grid of thetas
         theta0_mesh, theta1_mesh = self._meshgrid(models)
-        Js = np.array([self._cost_mesh(X, y, THETA) 
-                    for THETA in zip(np.ravel(theta0_mesh), np.ravel(theta1_mesh))])
-        Js = Js.reshape(theta0_mesh.shape)
+        THETAS = np.c_[np.ravel(theta0_mesh), np.ravel(theta1_mesh)]
+        Js = self._cost_mesh(X, y, THETAS).reshape(theta0_mesh.shape)
 
         # Set Title
         title = 'Gradient Descent Trajectories'
@@ -32,9 +32,10 @@ import statsmodels.api as sm
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
 from .base import ModelVisualizer
-from mlstudio.analysis.model_validation import standardized_residuals
-from mlstudio.analysis.model_validation import studentized_residuals, quantile
-from mlstudio.analysis.model_validation import leverage, cooks_distance
+from mlstudio.supervised.model.validation import Influence, quantile
+from mlstudio.supervised.model.validation import standardized_residuals
+from mlstudio.supervised.model.validation import studentized_residuals
+from mlstudio.supervised.model.validation import cooks_distance
 from mlstudio.supervised.visual import COLORS
 from mlstudio.supervised.machine_learning.linear_regression import LinearRegression
 from mlstudio.utils.format import proper        
@@ -796,8 +797,9 @@ class ResidualsLeverage(ModelVisualizer):
         # Compute standardized residuals
         self.estimator.fit(X,y)
         y_pred = self.estimator.predict(X)
-        residuals = y - y_pred        
-        residuals = standardized_residuals(X, y, y_pred)
+        # Factor X once for residuals, leverage and cooks distances
+        influence = Influence(X, y, y_pred)
+        residuals = influence.standardized_residuals
 
         # Flatten arrays (just in case)
         y = y.ravel()
@@ -805,8 +807,8 @@ class ResidualsLeverage(ModelVisualizer):
         residuals = residuals.ravel()
 
         # Compute Leverage and cooks distances
-        lev = leverage(X) 
-        cooks = cooks_distance(X, y, y_pred)
+        lev = influence.leverage
+        cooks = influence.cooks_distance
 
         # Create lowess smoothing line
         z1 = lowess(residuals, lev, frac=1./3, it=0, is_sorted=False, 
@@ -590,7 +590,7 @@ class OptimizationCurve(BaseVisualizer):
         else:
             d['yaxis_title'] = self.estimator.metric.label
             d['Training Score'] = self.estimator.get_blackbox().epoch_log.get('train_score')
-            if self.estimator.get_blackbox().epoch_log.get('val_score'):
+            if 'val_score' in self.estimator.get_blackbox().epoch_log:
                 d['Validation Score'] = self.estimator.get_blackbox().epoch_log.get('val_score')            
         return d
 
@@ -24,6 +24,7 @@ import sys
 
 import numpy as np
 import pandas as pd
+from scipy.sparse import issparse
 from scipy.stats import skew, kurtosis, ttest_1samp, t
 from mlstudio.utils.validation import check_X, check_y, check_X_y
 
@@ -139,12 +140,27 @@ def get_features(X):
         features = ['X_' + str(i) for i in range(X.shape[1])]
     return features
 
+def get_size(X):
+    """Returns the number of bytes consumed by the data in an array.
+
+    For csr matrices, this is the size of the data, indices and index 
+    pointer arrays. sys.getsizeof is used for other objects.
+    """
+    if issparse(X):
+        X = X.tocsr()
+        return X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+    elif isinstance(X, np.ndarray):
+        return X.nbytes
+    elif isinstance(X, (pd.DataFrame, pd.Series)):
+        return int(np.sum(X.memory_usage(index=False, deep=True)))
+    return sys.getsizeof(X)
+
 def get_feature_info(X):
     d = OrderedDict()
     X = check_X(X)
     d['n_observations'] = X.shape[0]    
     d['n_features'] = X.shape[1]
-    d['size (Bytes)'] = sys.getsizeof(X)
+    d['size (Bytes)'] = get_size(X)
     return d
     
 
@@ -201,7 +217,7 @@ def get_target_info(y):
     d['data_class'] = data_class
     d['classes'] = classes
     d['n_classes'] = n_classes
-    d['size (Bytes)'] = sys.getsizeof(y)
+    d['size (Bytes)'] = get_size(y)
     return d
     
 
@@ -67,6 +67,60 @@ def unpack_parameters(theta):
         weights = np.atleast_1d(theta[1:,:])
     return bias, weights
 
+def linear_output(X, theta):
+    """Computes the linear combination of the inputs and the parameters.
+
+    If X has one column fewer than theta has rows, X has no bias column, 
+    and theta[0] is applied implicitly as the intercept, without copying X.
+
+    Parameters
+    ----------
+    X : array-like or csr matrix of shape (n_samples, n_features)
+        Input data, with or without the bias column.
+
+    theta : array-like of shape (n_features,) or (n_features, n_classes)
+        The parameters, with the bias parameter first.
+
+    Returns
+    -------
+    z : array-like of shape (n_samples,) or (n_samples, n_classes)
+    """
+    if X.shape[1] != theta.shape[0] - 1:
+        return np.asarray(X.dot(theta))
+    z = np.asarray(X.dot(theta[1:]))
+    z += theta[0]
+    return z
+
+def linear_gradient(X, theta, residual):
+    """Computes X.T.dot(residual), the unnormalized gradient w.r.t. theta.
+
+    If X has no bias column, the gradient w.r.t. the intercept theta[0], 
+    which is the sum of the residuals, is computed separately.
+
+    Parameters
+    ----------
+    X : array-like or csr matrix of shape (n_samples, n_features)
+        Input data, with or without the bias column.
+
+    theta : array-like of shape (n_features,) or (n_features, n_classes)
+        The parameters, with the bias parameter first.
+
+    residual : array-like of shape (n_samples,) or (n_samples, n_classes)
+        The derivative of the loss w.r.t. the linear output.
+
+    Returns
+    -------
+    gradient : array-like in the shape of theta
+    """
+    if X.shape[1] != theta.shape[0] - 1:
+        return np.asarray(X.T.dot(residual))
+    weights = np.asarray(X.T.dot(residual))
+    gradient = np.empty((weights.shape[0] + 1,) + weights.shape[1:], 
+                        dtype=np.result_type(weights, residual))
+    gradient[0] = residual.sum(axis=0)
+    gradient[1:] = weights
+    return gradient
+
 # --------------------------------------------------------------------------- #
 #                               TRANSFORMERS                                  #
 # --------------------------------------------------------------------------- #
@@ -228,7 +282,7 @@ class MinMaxScaler(BaseTransformer):
         """
         X = X - self.data_min_
         X = np.divide(X, self.data_range_, 
-                      out = np.zeros(X.shape,dtype=float), 
+                      out = np.zeros(X.shape,dtype=np.result_type(X, np.float32)), 
                       where = self.data_range_ != 0)        
         return X
 
@@ -535,9 +589,23 @@ class GradientScaler(BaseTransformer, TransformerMixin):
         return X
 
 class AddBiasTerm(BaseTransformer, TransformerMixin):
-    """Adds bias term of ones to matrix."""
+    """Adds bias term of ones to matrix.
+    
+    Parameters
+    ----------
+    dtype : str, numpy dtype or None (default=None)
+        The dtype of the transformed matrix. If None, numeric input 
+        retains its dtype.
+
+    implicit : bool (default=False)
+        If True, no column is added. X is validated and converted to dtype,
+        but otherwise not copied, and estimators apply the bias parameter 
+        theta[0] as an intercept. See linear_output and linear_gradient.
+    """
 
-    def __init__(self):
+    def __init__(self, dtype=None, implicit=False):
+        self.dtype = dtype
+        self.implicit = implicit
         self._is_fitted = False
 
     @property
@@ -557,14 +625,17 @@ class AddBiasTerm(BaseTransformer, TransformerMixin):
         """Adds bias term to csr matrix."""
         X = coo_to_csr(X)
         ones = np.ones((X.shape[0],1))
-        bias_term = csr_matrix(ones, dtype=float)
+        bias_term = csr_matrix(ones, dtype=X.dtype)
         X = hstack((bias_term, X)) 
         X = coo_to_csr(X)
         return X
 
     def transform(self, X, y=None):
         """Adds bias term to matrix and returns it to the caller."""
-        X = check_array(X, accept_sparse=True, accept_large_sparse=True)
+        X = check_array(X, accept_sparse=True, accept_large_sparse=True,
+                        dtype=self.dtype or "numeric")
+        if self.implicit:
+            return X
         if issparse(X):
             X = self._transform_csr(X)
         else:
@@ -574,6 +645,8 @@ class AddBiasTerm(BaseTransformer, TransformerMixin):
     def inverse_transform(self, X):
         """Removes bias term from matrix and returns it to caller."""
         X = coo_to_csr(X)
+        if self.implicit:
+            return X
         return X[:,1:]
 
     def fit_transform(self, X):
@@ -606,9 +679,19 @@ class ZeroBiasTerm(BaseTransformer, TransformerMixin):
 # --------------------------------------------------------------------------- #
 # Data shuffler
 class DataShuffler(BaseTransformer, TransformerMixin):
-    """Shuffles data."""
+    """Shuffles data.
+    
+    X and y are shuffled by a single permutation of the row indices, so 
+    they remain aligned. csr matrices are supported.
 
-    def __init__(self):
+    Parameters
+    ----------
+    copy : bool (default=True)
+        If False, numpy arrays are shuffled in place rather than copied.
+    """
+
+    def __init__(self, copy=True):
+        self.copy = copy
         self._is_fitted = False    
 
     @property
@@ -648,11 +731,7 @@ class DataShuffler(BaseTransformer, TransformerMixin):
         X, y    : Inputs and target data         
         
         """
-        rg = np.random.default_rng(seed=random_state)
-        X = rg.permutation(X)   
-        if y is not None:
-            y = rg.permutation(y)    
-        return X, y
+        return shuffle_data(X, y, random_state, copy=self.copy)
 
     def fit_transform(self, X, y=None, random_state=None):
         """Executes fit and transform in sequence."""
@@ -757,30 +836,53 @@ class DataSplitter(BaseTransformer, TransformerMixin):
 
 
 
-def shuffle_data(X, y=None, random_state=None):
+def shuffle_data(X, y=None, random_state=None, copy=True):
     """ Random shuffle of the samples in X and y.
     
-    Shuffles data
+    A single permutation of the row indices is applied to both X and y,
+    which keeps the rows aligned and supports csr matrices.
 
     Parameters
     ----------
-    X : array_like of shape (m, n_features)
+    X : array_like or csr matrix of shape (m, n_features)
         Input data
 
     y : array_like of shape (m,)
         Target data    
 
+    random_state : int (default=None)
+        Seed for reproducibility of pseudo-randomization
+
+    copy : bool (default=True)
+        If False, numpy arrays are shuffled in place, without allocating
+        a copy. The same random stream drives the shuffles of X and y, so
+        they receive the same permutation. Other inputs, such as csr 
+        matrices, are always copied.
+
     Returns
     -------
     Shuffled X, and y
     
     """    
     rg = np.random.default_rng(seed=random_state)
-    X = rg.permutation(X)   
+    if not copy and _is_writeable_array(X) and \
+        (y is None or _is_writeable_array(y)):
+        state = rg.bit_generator.state
+        rg.shuffle(X)
+        if y is not None:
+            rg.bit_generator.state = state
+            rg.shuffle(y)
+        return X, y
+    idx = rg.permutation(X.shape[0])
+    X = X[idx]
     if y is not None:
-        y = rg.permutation(y)    
+        y = y[idx]
     return X, y
 
+def _is_writeable_array(X):
+    """Returns True if X is a numpy array that can be shuffled in place."""
+    return isinstance(X, np.ndarray) and X.flags.writeable
+
 # --------------------------------------------------------------------------- #
 #                              SAMPLE                                         #
 # --------------------------------------------------------------------------- #    
@@ -898,7 +1000,161 @@ def data_split(X, y, test_size=0.3, stratify=False, random_state=None):
 
     return X_train, X_test, y_train, y_test
 
-def batch_iterator(X, y=None, batch_size=None):
+# --------------------------------------------------------------------------- #
+#                              BATCHING                                       #
+# --------------------------------------------------------------------------- #
+class BatchSampler(BaseEstimator):
+    """Generates minibatches from permutations of the row indices.
+
+    Shuffling permutes an array of n_samples integers each epoch rather 
+    than the data itself. Without shuffling, batches are contiguous slices,
+    which are views of dense arrays. The random generator persists across
+    calls, so each epoch sees a new permutation, and a given random_state
+    reproduces the same sequence of permutations.
+
+    Parameters
+    ----------
+    shuffle : bool (default=True)
+        Whether the rows are permuted at the start of each epoch.
+
+    drop_last : bool (default=False)
+        Whether a final batch smaller than batch_size is discarded.
+
+    stratify : bool (default=False)
+        Whether shuffled batches preserve the class proportions of y. 
+        Requires y, which may be class labels or one-hot encoded.
+
+    buffered : bool (default=False)
+        Whether shuffled rows of dense arrays are gathered into buffers 
+        that are allocated once and reused for every batch. Batches are 
+        then overwritten by the next batch and must not be retained.
+
+    random_state : int or None (default=None)
+        Seed for the permutations.
+    """
+
+    def __init__(self, shuffle=True, drop_last=False, stratify=False, 
+                 buffered=False, random_state=None):
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.stratify = stratify
+        self.buffered = buffered
+        self.random_state = random_state
+        self._rng = None
+        self._buffers = {}
+
+    def reset(self):
+        """Restarts the sequence of permutations from the random_state."""
+        self._rng = np.random.default_rng(self.random_state)
+        self._buffers = {}
+
+    def _permutation(self, n_samples, y=None):
+        """Returns a permutation of the row indices, stratified by y if requested."""
+        if not self.stratify:
+            return self._rng.permutation(n_samples)
+        if y is None:
+            raise ValueError("Stratified batches require the target y.")
+        y = np.asarray(y)
+        labels = y.argmax(axis=1) if y.ndim > 1 else y
+        _, labels = np.unique(labels, return_inverse=True)
+        # Spread each class evenly over [0, 1) in random order, then sort,
+        # so that every contiguous batch draws from each class in proportion.
+        position = np.empty(n_samples)
+        for k in range(labels.max() + 1):
+            idx = np.flatnonzero(labels == k)
+            self._rng.shuffle(idx)
+            position[idx] = (np.arange(len(idx)) + self._rng.random()) / len(idx)
+        return np.argsort(position, kind='stable')
+
+    def shard_order(self, n_shards):
+        """Returns the order in which the shards of a DataSource are read.
+
+        Shuffled shards are read in a new random order each epoch, and 
+        the rows within each shard are then permuted by indices.
+
+        Parameters
+        ----------
+        n_shards : int
+            The number of shards.
+        """
+        if self._rng is None:
+            self.reset()
+        if self.shuffle:
+            return self._rng.permutation(n_shards)
+        return np.arange(n_shards)
+
+    def indices(self, n_samples, batch_size=None, y=None):
+        """Generates the row indices of each batch.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of rows in the data.
+
+        batch_size : int or None (default=None)
+            The number of rows per batch. If None, a single batch contains 
+            all rows, in their original order.
+
+        y : array-like or None (default=None)
+            The target, required for stratification.
+
+        Returns
+        -------
+        A generator of slices, if the data is not shuffled, or of arrays of
+        row indices.
+        """
+        if self._rng is None:
+            self.reset()
+        if batch_size is None or batch_size >= n_samples:
+            # The full batch gradient does not depend upon the row order
+            yield slice(0, n_samples)
+            return
+        order = self._permutation(n_samples, y) if self.shuffle else None
+        stop = n_samples - n_samples % batch_size if self.drop_last else n_samples
+        for i in range(0, stop, batch_size):
+            j = min(i + batch_size, n_samples)
+            yield slice(i, j) if order is None else order[i:j]
+
+    def _gather(self, key, A, idx):
+        """Gathers rows of A into a reusable buffer or a new array."""
+        if isinstance(idx, slice) or not self.buffered or \
+            not isinstance(A, np.ndarray):
+            return A[idx]
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape[1:] != A.shape[1:] or \
+            buffer.dtype != A.dtype or buffer.shape[0] < len(idx):
+            buffer = np.empty((len(idx),) + A.shape[1:], dtype=A.dtype)
+            self._buffers[key] = buffer
+        return np.take(A, idx, axis=0, out=buffer[:len(idx)])
+
+    def batches(self, X, y=None, batch_size=None):
+        """Generates batches of X and, if provided, y.
+
+        Parameters
+        ----------
+        X : array-like or csr matrix of shape (n_samples, n_features)
+            Input data
+
+        y : array-like of shape (n_samples,) or (n_samples, n_classes)
+            Target data
+
+        batch_size : int or None (default=None)
+            The number of rows per batch. If None, a single batch is 
+            generated.
+
+        Returns
+        -------
+        A generator of X_batch, or of (X_batch, y_batch) if y is provided.
+        """
+        for idx in self.indices(X.shape[0], batch_size, y):
+            if y is not None:
+                yield self._gather('X', X, idx), self._gather('y', y, idx)
+            else:
+                yield self._gather('X', X, idx)
+
+# --------------------------------------------------------------------------- #
+def batch_iterator(X, y=None, batch_size=None, shuffle=False, drop_last=False,
+                   stratify=False, random_state=None):
     """Batch generator.
     
     Creates an iterable of batches of the designated batch size.
@@ -915,6 +1171,18 @@ def batch_iterator(X, y=None, batch_size=None):
     batch_size : None or int, optional (default=None)
         The number of observations to be included in each batch. 
 
+    shuffle : bool (default=False)
+        Whether the rows are visited in random order. 
+
+    drop_last : bool (default=False)
+        Whether a final batch smaller than batch_size is discarded.
+
+    stratify : bool (default=False)
+        Whether shuffled batches preserve the class proportions of y.
+
+    random_state : int or None (default=None)
+        Seed for the permutation.
+
     Returns
     -------
     array-like
@@ -922,14 +1190,9 @@ def batch_iterator(X, y=None, batch_size=None):
         is None, a single batch containing all data is generated.
     
     """
-    n_samples = X.shape[0]
-    if batch_size is None:
-        batch_size = n_samples    
-    for i in np.arange(0, n_samples, batch_size):
-        if y is not None:
-            yield X[i:i+batch_size], y[i:i+batch_size]
-        else:
-            yield X[i:i+batch_size]
+    sampler = BatchSampler(shuffle=shuffle, drop_last=drop_last, 
+                           stratify=stratify, random_state=random_state)
+    return sampler.batches(X, y, batch_size)
 
 def one_hot(x, n_classes=None, dtype='float32'):
     """Converts a vector of integers to one-hot encoding. 
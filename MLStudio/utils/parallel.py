@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : parallel.py                                                       #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 8:12:05 pm                       #
+# Last Modified : Sunday, October 18th 2026, 8:12:05 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Execution of jobs across a pool of processes.
+
+execute applies a function to a stream of jobs, keeping at most
+pre_dispatch of them in flight, so that the memory taken by pickled jobs
+is bounded however many there are. Arrays shared by every job are not
+pickled at all: SharedArrays saves them once to memory mapped files, and
+each job carries only the path, which attach opens once per process. The
+pages of the files are shared by all processes through the page cache.
+"""
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import os
+import shutil
+import tempfile
+
+import numpy as np
+# --------------------------------------------------------------------------- #
+def effective_n_jobs(n_jobs=None):
+    """Returns the number of processes for n_jobs.
+
+    None means one per CPU, and negative values count back from the number
+    of CPUs, so that -1 means all of them.
+    """
+    n_cpus = os.cpu_count() or 1
+    if n_jobs is None:
+        return n_cpus
+    if n_jobs < 0:
+        return max(1, n_cpus + 1 + n_jobs)
+    return max(1, n_jobs)
+
+# --------------------------------------------------------------------------- #
+def _pre_dispatch(pre_dispatch, n_jobs):
+    """Evaluates pre_dispatch, which may be an expression of n_jobs."""
+    if pre_dispatch is None:
+        return 2 * n_jobs
+    if isinstance(pre_dispatch, str):
+        pre_dispatch = eval(pre_dispatch, {}, {'n_jobs': n_jobs})
+    return max(1, int(pre_dispatch))
+
+# --------------------------------------------------------------------------- #
+def execute(func, jobs, n_jobs=None, pre_dispatch=None):
+    """Applies func to each job across a pool of processes.
+
+    Parameters
+    ----------
+    func : callable
+        A picklable function of one job.
+
+    jobs : iterable
+        The jobs, which are consumed lazily as others complete.
+
+    n_jobs : int or None (default=None)
+        The number of processes. If 1, jobs are run in this process.
+        See effective_n_jobs.
+
+    pre_dispatch : int, str or None (default=None)
+        The maximum number of jobs submitted at once, or an expression of
+        n_jobs, such as '2*n_jobs'. If None, 2 * n_jobs.
+
+    Yields
+    ------
+    result
+        The value of func for each job, in the order of completion.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs == 1:
+        for job in jobs:
+            yield func(job)
+        return
+    pre_dispatch = _pre_dispatch(pre_dispatch, n_jobs)
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        pending = set()
+        for job in jobs:
+            if len(pending) >= pre_dispatch:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(func, job))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+# --------------------------------------------------------------------------- #
+#                               SHARED ARRAYS                                 #
+# --------------------------------------------------------------------------- #
+# Arrays attached by this process, keyed by path
+_attached = {}
+
+def attach(ref):
+    """Returns the array referred to by a SharedArrays path, or ref itself."""
+    if not isinstance(ref, str):
+        return ref
+    if ref not in _attached:
+        _attached[ref] = np.load(ref, mmap_mode='r')
+    return _attached[ref]
+
+class SharedArrays:
+    """Saves arrays to memory mapped files for the duration of a context.
+
+    Parameters
+    ----------
+    arrays : dict
+        Maps names to the arrays to be shared.
+
+    shared : bool (default=True)
+        If False, the arrays themselves are returned as their references,
+        as is appropriate when jobs are run in this process.
+
+    temp_folder : str or None (default=None)
+        The folder in which the files are created. If None, the system's
+        temporary folder, which is memory backed on many Linux hosts.
+
+    Examples
+    --------
+    >>> with SharedArrays({'X': X, 'y': y}) as refs:
+    ...     results = list(execute(func, ((refs['X'], refs['y'], i) for i in range(10))))
+    """
+
+    def __init__(self, arrays, shared=True, temp_folder=None):
+        self.arrays = arrays
+        self.shared = shared
+        self.temp_folder = temp_folder
+
+    def __enter__(self):
+        self._folder = None
+        if not self.shared:
+            return dict(self.arrays)
+        self._folder = tempfile.mkdtemp(prefix='mlstudio_', dir=self.temp_folder)
+        refs = {}
+        for name, array in self.arrays.items():
+            path = os.path.join(self._folder, name + '.npy')
+            np.save(path, np.asarray(array))
+            refs[name] = path
+        return refs
+
+    def __exit__(self, *args):
+        if self._folder:
+            for path in [p for p in _attached if p.startswith(self._folder)]:
+                del _attached[path]
+            shutil.rmtree(self._folder, ignore_errors=True)
+        return False
@@ -176,6 +176,18 @@ def validate_black_box(param):
         raise TypeError("The BlackBox observer from optimization.observers.history is required.")
     return True        
 # --------------------------------------------------------------------------  #        
+def validate_profiler(param):
+    from mlstudio.supervised.algorithms.optimization.services.profilers import Profiler
+    if not isinstance(param, Profiler):
+        raise TypeError("The profiler parameter must be a Profiler object from optimization.services.profilers.")
+    return True        
+# --------------------------------------------------------------------------  #        
+def validate_batch_sampler(param):
+    from mlstudio.utils.data_manager import BatchSampler
+    if not isinstance(param, BatchSampler):
+        raise TypeError("The batch_sampler parameter must be a BatchSampler object from utils.data_manager.")
+    return True        
+# --------------------------------------------------------------------------  #        
 def validate_regression_loss(param):
     from mlstudio.supervised.algorithms.optimization.services import loss
     valid_loss_classes = (loss.Quadratic,)
@@ -450,6 +462,19 @@ def validate_estimator(estimator):
     validate_summary(estimator.summary)
     validate_bool(param=estimator.check_gradient, param_name='check_gradient')
     validate_gradient_checker(estimator.gradient_checker)
+    validate_string(param=estimator.snapshot_mode, param_name='snapshot_mode',
+                    valid_values=['full', 'fast'])
+    validate_int(param=estimator.snapshot_freq, param_name='snapshot_freq',
+                 minimum=1, left='closed', right='open')
+    if estimator.snapshot_interval:
+        validate_range(estimator.snapshot_interval, param_name='snapshot_interval',
+                       minimum=0, left='open', right='open')
+    if estimator.profiler is not None:
+        validate_profiler(estimator.profiler)
+    validate_string(param=estimator.dtype, param_name='dtype',
+                    valid_values=['float32', 'float64'])
+    if estimator.batch_sampler is not None:
+        validate_batch_sampler(estimator.batch_sampler)
 
     if estimator.verbose:
         validate_int(param=estimator.verbose, param_name='verbose',
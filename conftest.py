@@ -38,11 +38,21 @@ import warnings
 warnings.filterwarnings('ignore')
 warnings.filterwarnings("ignore", category=PendingDeprecationWarning)
 
+from mlstudio.data_services.preprocessing import RegressionDataProcessor
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GDRegressor
+from mlstudio.supervised.algorithms.optimization.observers.base import ObserverList
+from mlstudio.supervised.algorithms.optimization.observers.debug import GradientCheck
+from mlstudio.supervised.algorithms.optimization.observers.history import BlackBox
+from mlstudio.supervised.algorithms.optimization.observers.report import Progress, Summary
+from mlstudio.supervised.algorithms.optimization.services.loss import Quadratic
 from mlstudio.supervised.algorithms.optimization.services.optimizers import Adagrad
+from mlstudio.supervised.algorithms.optimization.services.optimizers import GradientDescentOptimizer
 from mlstudio.supervised.algorithms.optimization.services.benchmarks import StyblinskiTank
 from mlstudio.supervised.algorithms.optimization.observers.learning_rate import TimeDecay
-from mlstudio.supervised.metrics.regression import MeanSquaredError
-from mlstudio.utils.data_manager import StandardScaler
+from mlstudio.supervised.metrics.regression import MeanSquaredError, R2
+from mlstudio.utils.data_manager import StandardScaler, AddBiasTerm, DataSplitter
+from mlstudio.utils.data_manager import LabelEncoder, OneHotLabelEncoder
+from mlstudio.utils.print import Printer
 
 
 homedir = str(Path(__file__).parents[0])
@@ -377,6 +387,33 @@ def get_mock_estimator():
 @fixture(scope='session')
 def get_regression_estimator():
     return GDRegressor()
+
+# ---------------------------------------------------------------------------- #
+def make_gd_regressor(regularizer=None, optimizer=None, implicit=False, 
+                      data_processor=None, **kwargs):
+    """Builds a GDRegressor with each of its components.
+
+    Parameters not given default to a quadratic loss, gradient descent and
+    random_state=5. If implicit is True, the bias is applied as an intercept.
+    """
+    if data_processor is None:
+        data_processor = RegressionDataProcessor(
+            add_bias_transformer=AddBiasTerm(implicit=implicit),
+            split_transformer=DataSplitter(), 
+            one_hot_label_encoder=OneHotLabelEncoder(),
+            label_encoder=LabelEncoder())
+    if optimizer is None:
+        optimizer = GradientDescentOptimizer()
+    kwargs.setdefault('random_state', 5)
+    return GDRegressor(loss=Quadratic(regularizer=regularizer), 
+                       data_processor=data_processor, optimizer=optimizer, 
+                       scorer=R2(), observer_list=ObserverList(), progress=Progress(),
+                       blackbox=BlackBox(), summary=Summary(printer=Printer()),
+                       gradient_checker=GradientCheck(), **kwargs)
+
+@fixture(scope="session")
+def get_gd_regressor():
+    return make_gd_regressor
 # ---------------------------------------------------------------------------- #
 #                                   TEST PACKAGES                              #
 # ---------------------------------------------------------------------------- #
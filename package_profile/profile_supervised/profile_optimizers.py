@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : profile_optimizers.py                                             #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 10:31:05 am                      #
+# Last Modified : Sunday, October 18th 2026, 10:31:05 am                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Benchmarks allocations and time per step for in place optimizer updates.
+
+Each optimizer is run for a number of steps on a large parameter vector
+via the update method, which modifies theta in place, and via __call__,
+which returns a new theta. The gradient function writes into a
+preallocated buffer so that the optimizer's own allocations are measured.
+"""
+from pathlib import Path
+import site
+import time
+import tracemalloc
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+site.addsitedir(PROJECT_DIR)
+
+import numpy as np
+import pandas as pd
+
+from mlstudio.supervised.algorithms.optimization.services.optimizers import GradientDescentOptimizer
+from mlstudio.supervised.algorithms.optimization.services.optimizers import Momentum, Nesterov
+from mlstudio.supervised.algorithms.optimization.services.optimizers import Adadelta, RMSprop
+from mlstudio.supervised.algorithms.optimization.services.optimizers import Adam, AdaMax, Nadam
+from mlstudio.supervised.algorithms.optimization.services.optimizers import AMSGrad, AdamW
+from mlstudio.supervised.algorithms.optimization.services.optimizers import QHAdam, AggMo
+from mlstudio.supervised.algorithms.optimization.services.optimizers import QuasiHyperbolicMomentum
+
+OPTIMIZERS = [GradientDescentOptimizer, Momentum, Nesterov, Adadelta, RMSprop,
+              Adam, AdaMax, Nadam, AMSGrad, AdamW, QHAdam, AggMo,
+              QuasiHyperbolicMomentum]
+# --------------------------------------------------------------------------- #
+#                               GRADIENT                                      #
+# --------------------------------------------------------------------------- #
+class QuadraticGradient:
+    """Gradient of 0.5 * ||theta||^2 written into a preallocated buffer."""
+    def __init__(self, shape):
+        self._grad = np.zeros(shape)
+
+    def __call__(self, theta):
+        np.copyto(self._grad, theta)
+        return self._grad
+
+# --------------------------------------------------------------------------- #
+#                               BENCHMARK                                     #
+# --------------------------------------------------------------------------- #
+def _run(step, steps):
+    """Returns seconds per step and peak bytes allocated per step."""
+    start = time.perf_counter()
+    for _ in range(steps):
+        step()
+    duration = (time.perf_counter() - start) / steps
+    tracemalloc.start()
+    step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+def benchmark_optimizers(n_params=1000000, steps=100, learning_rate=0.01):
+    """Benchmarks in place and copying updates for each optimizer."""
+    results = []
+    gradient = QuadraticGradient(n_params)
+    for optimizer in OPTIMIZERS:
+        # In place updates. The first update allocates the buffers.
+        o = optimizer()
+        theta = np.random.RandomState(5).randn(n_params)
+        o.update(gradient, learning_rate, theta)
+        update_time, update_bytes = _run(
+            lambda: o.update(gradient, learning_rate, theta), steps)
+        # Copying updates
+        o = optimizer()
+        theta = np.random.RandomState(5).randn(n_params)
+        o(gradient, learning_rate, theta)
+        call_time, call_bytes = _run(
+            lambda: o(gradient, learning_rate, theta), steps)
+
+        results.append({'Optimizer': o.name,
+                        'Update (ms/step)': update_time * 1000,
+                        'Update (bytes/step)': update_bytes,
+                        'Call (ms/step)': call_time * 1000,
+                        'Call (bytes/step)': call_bytes})
+    return pd.DataFrame(results)
+
+if __name__ == "__main__":
+    print(benchmark_optimizers().to_string(index=False))
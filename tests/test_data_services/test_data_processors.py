@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_data_processors.py                                           #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 11:24:51 pm                      #
+# Last Modified : Sunday, October 18th 2026, 11:24:51 pm                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests shuffling of training data by the data processors."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.data_services.preprocessing import RegressionDataProcessor
+from mlstudio.data_services.preprocessing import BinaryClassDataProcessor
+from mlstudio.data_services.preprocessing import MultiClassDataProcessor
+from mlstudio.utils.data_manager import AddBiasTerm, DataShuffler, DataSplitter
+from mlstudio.utils.data_manager import LabelEncoder, OneHotLabelEncoder
+# --------------------------------------------------------------------------  #
+def _processor(processor):
+    return processor(add_bias_transformer=AddBiasTerm(), 
+                     split_transformer=DataSplitter(),
+                     label_encoder=LabelEncoder(), 
+                     one_hot_label_encoder=OneHotLabelEncoder(),
+                     shuffle_transformer=DataShuffler())
+
+@mark.data_services
+@mark.data_processors
+class DataProcessorShuffleTests:
+
+    @pytest.mark.parametrize("processor, n_classes", 
+                             [(RegressionDataProcessor, None), 
+                              (BinaryClassDataProcessor, 2),
+                              (MultiClassDataProcessor, 3)])
+    def test_process_train_data_shuffle(self, processor, n_classes):
+        X = np.arange(100, dtype=float).reshape(-1, 1) * np.ones((1, 3))
+        y = np.arange(100) if n_classes is None else np.arange(100) % n_classes
+        X_orig, y_orig = X.copy(), y.copy()
+        data = _processor(processor).process_train_data(X, y, random_state=5)
+        X_train, y_train = data['X_train_']['data'], data['y_train_']['data']
+        rows = X_train[:, 1].astype(int)
+        assert np.array_equal(X_train[:, 0], np.ones(100)), "Bias term not added"
+        assert not np.array_equal(rows, np.arange(100)), "Training data not shuffled"
+        assert np.array_equal(np.sort(rows), np.arange(100)), "Rows not a permutation"
+        if n_classes is not None and y_train.ndim > 1:
+            y_train = y_train.argmax(axis=1)
+        assert np.array_equal(y_train, y[rows]), "X and y not aligned after shuffle"
+        assert np.array_equal(X, X_orig) and np.array_equal(y, y_orig), \
+            "Caller's data modified"
+        again = _processor(processor).process_train_data(X, y, random_state=5)
+        assert np.array_equal(again['X_train_']['data'], X_train), "Shuffle not reproducible"
+        # Without a shuffle transformer the order is preserved
+        data = processor(add_bias_transformer=AddBiasTerm(), label_encoder=LabelEncoder(),
+                         one_hot_label_encoder=OneHotLabelEncoder()).process_train_data(X, y)
+        assert np.array_equal(data['X_train_']['data'][:, 1], X[:, 0]), \
+            "Data shuffled without a shuffle transformer"
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_data_sources.py                                              #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 3:05:17 pm                       #
+# Last Modified : Sunday, October 18th 2026, 3:05:17 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests data sources for out-of-core training."""
+import numpy as np
+import pandas as pd
+import pytest
+from pytest import mark
+from sklearn.datasets import make_regression
+
+from mlstudio.data_services.data_sources import DataSource, ArraySource, NpySource, CSVSource
+from mlstudio.data_services.preprocessing import RegressionDataProcessor
+from mlstudio.data_services.preprocessing import BinaryClassDataProcessor
+from mlstudio.utils.data_manager import AddBiasTerm, DataSplitter, LabelEncoder
+# --------------------------------------------------------------------------  #
+@pytest.fixture
+def sources(tmp_path):
+    """Returns the same data as in memory, memory mapped, npy and csv sources."""
+    X = np.arange(300, dtype=float).reshape(100, 3)
+    y = X[:, 0] / 3
+    np.save(tmp_path / 'X.npy', X)
+    X_mmap = np.load(tmp_path / 'X.npy', mmap_mode='r')
+    X_files, y_files, csv_files = [], [], []
+    for i, rows in enumerate([slice(0, 40), slice(40, 80), slice(80, 100)]):
+        X_files.append(str(tmp_path / 'X{}.npy'.format(i)))
+        y_files.append(str(tmp_path / 'y{}.npy'.format(i)))
+        csv_files.append(str(tmp_path / 'data{}.csv'.format(i)))
+        np.save(X_files[-1], X[rows])
+        np.save(y_files[-1], y[rows])
+        df = pd.DataFrame(X[rows], columns=['a', 'b', 'c'])
+        df['target'] = y[rows]
+        df.to_csv(csv_files[-1], index=False)
+    return X, y, [ArraySource(X, y, shard_size=40),
+                  ArraySource(X_mmap, y, shard_size=40),
+                  NpySource(X_files, y_files),
+                  CSVSource(csv_files, target_column='target')]
+
+@mark.data_services
+@mark.data_sources
+class DataSourceTests:
+
+    def test_data_sources(self, sources):
+        X, y, sources = sources
+        for source in sources:
+            name = source.__class__.__name__
+            assert source.shape == X.shape, name + ": shape incorrect"
+            assert np.array_equal(source.shard_sizes, [40, 40, 20]), name + ": shard sizes incorrect"
+            assert np.array_equal(source.target(), y), name + ": target incorrect"
+            X_read = np.concatenate([source.read(i) for i in range(source.n_shards)])
+            assert np.array_equal(X_read, X), name + ": features incorrect"
+
+    def test_data_source_split(self, sources):
+        X, y, sources = sources
+        for source in sources:
+            name = source.__class__.__name__
+            train, val = source.split(val_size=0.25, random_state=5)
+            assert np.array_equal(train.shard_sizes, [30, 30, 15]), name + ": train shard sizes incorrect"
+            assert np.array_equal(val.shard_sizes, [10, 10, 5]), name + ": val shard sizes incorrect"
+            # Since y is a multiple of the first column, rows and targets align
+            for subset in [train, val]:
+                X_read = np.concatenate([subset.read(i) for i in range(subset.n_shards)])
+                assert np.array_equal(X_read[:, 0] / 3, subset.target()), name + ": X and y not aligned"
+            # The split is disjoint, exhaustive and reproducible
+            rows = np.concatenate([train.target(), val.target()])
+            assert np.array_equal(np.sort(rows), y), name + ": split not a partition"
+            assert np.array_equal(val.target(), source.split(0.25, 5)[1].target()), \
+                name + ": split not reproducible"
+
+    def test_process_source(self, sources):
+        X, y, sources = sources
+        processor = RegressionDataProcessor(add_bias_transformer=AddBiasTerm(),
+                                            split_transformer=DataSplitter())
+        data = processor.process_source(sources[1], val_size=0.2, random_state=5)
+        assert data['X_train_']['metadata']['orig']['n_features'] == 3, "Original n_features incorrect"
+        assert data['X_train_']['metadata']['processed']['n_features'] == 4, "Processed n_features incorrect"
+        assert data['X_train_']['data'].shape[0] == data['y_train_']['data'].shape[0] == 80, "Train size incorrect"
+        assert data['X_val_']['data'].shape[0] == data['y_val_']['data'].shape[0] == 20, "Val size incorrect"
+        X_batch = processor.transform_batch(data['X_train_']['data'].read(0))
+        assert np.array_equal(X_batch[:, 0], np.ones(32)), "Bias term not added to batch"
+        # Class labels are encoded
+        processor = BinaryClassDataProcessor(add_bias_transformer=AddBiasTerm(),
+                                             split_transformer=DataSplitter(),
+                                             label_encoder=LabelEncoder())
+        data = processor.process_source(ArraySource(X, np.where(y > 50, 7, 3)))
+        assert np.array_equal(np.unique(data['y_train_']['data']), [0, 1]), "Labels not encoded"
+        assert np.array_equal(data['y_train_']['metadata']['orig']['classes'], [3, 7]), "Classes incorrect"
+
+    def test_fit_source(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        memory = get_gd_regressor(epochs=50, val_size=None).fit(X, y)
+        source = ArraySource(X, y, shard_size=64)
+        est = get_gd_regressor(epochs=50, val_size=None).fit(source)
+        assert isinstance(est.X_train_, ArraySource), "Source read into memory"
+        assert np.allclose(est.intercept_, memory.intercept_) and \
+            np.allclose(est.coef_, memory.coef_), \
+            "Fit on a source differs from the fit in memory"
+        # The costs and scores are computed from the source shard by shard
+        log, memory_log = est.get_blackbox().epoch_log, memory.get_blackbox().epoch_log
+        for key in ['train_cost', 'train_score']:
+            assert np.allclose(log[key], memory_log[key]), key + " from source incorrect"
+        assert np.allclose(est.predict(source), memory.predict(X)), "Predictions from source incorrect"
+        assert np.isclose(est.score(source, y), memory.score(X, y)), "Score from source incorrect"
+        # Validation data are split from the source
+        est = get_gd_regressor(epochs=50).fit(source)
+        assert isinstance(est.X_val_, DataSource), "Validation set read into memory"
+        X_val = np.concatenate([est.X_val_.read(i) for i in range(est.X_val_.n_shards)])
+        assert np.isclose(est.score(est.X_val_, est.y_val_), est.score(X_val, est.y_val_)), \
+            "Validation score from source incorrect"
+        assert np.all(np.isfinite(est.get_blackbox().epoch_log['val_score'])), \
+            "Validation scores not logged"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : ML Studio                                                         #
+# Version : 0.1.14                                                            #
+# File    : test_ols_regression.py                                            #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 12:14:36 pm                      #
+# Last Modified : Sunday, October 18th 2026, 12:14:36 pm                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests for the closed form OLS regression solvers."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.supervised.algorithms.ols_regression import OLSRegression
+# --------------------------------------------------------------------------  #
+def _data(n=1000, p=6, seed=5):
+    rng = np.random.RandomState(seed)
+    X = rng.randn(n, p) * np.logspace(0, 3, p) + 50
+    theta = rng.randn(p)
+    y = X.dot(theta) + 3 + rng.randn(n)
+    return X, y
+
+@mark.ols
+class OLSRegressionTests:
+
+    @mark.parametrize("solver", ['auto', 'normal', 'qr', 'svd'])
+    def test_ols_solvers(self, solver):
+        X, y = _data()
+        theta = np.linalg.lstsq(np.column_stack([np.ones(X.shape[0]), X]), y, rcond=None)[0]
+        est = OLSRegression(solver=solver).fit(X, y)
+        assert np.allclose(est.intercept_, theta[0]), "Intercept error"
+        assert np.allclose(est.coef_, theta[1:]), "Coefficient error"
+
+    def test_ols_chunked(self, tmpdir):
+        X, y = _data()
+        expected = OLSRegression(solver='svd').fit(X, y)
+        path = str(tmpdir.join("X.dat"))
+        X_mmap = np.memmap(path, dtype=np.float64, mode='w+', shape=X.shape)
+        X_mmap[:] = X
+        est = OLSRegression(chunk_size=128).fit(X_mmap, y)
+        assert np.allclose(est.coef_, expected.coef_), "Chunked coefficient error"
+        assert np.allclose(est.intercept_, expected.intercept_), "Chunked intercept error"
+
+    def test_ols_rank_deficient(self):
+        X, y = _data()
+        X = np.column_stack([X, X[:, 0] - X[:, 1]])
+        est = OLSRegression().fit(X, y)
+        assert est.solver_ == 'svd', "Auto solver did not fall back to svd"
+        expected = OLSRegression(solver='svd').fit(X, y)
+        assert np.allclose(est.predict(X), expected.predict(X)), "Rank deficient prediction error"
+        with pytest.raises(np.linalg.LinAlgError):
+            OLSRegression(solver='qr').fit(X, y)
+
+    def test_ols_validation(self):
+        X, y = _data()
+        with pytest.raises(ValueError):
+            OLSRegression(solver='cholesky').fit(X, y)
+        with pytest.raises(ValueError):
+            OLSRegression(solver='qr', chunk_size=100).fit(X, y)
+        with pytest.raises(TypeError):
+            OLSRegression(chunk_size=1.5).fit(X, y)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_proximal.py                                                  #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 10:47:12 pm                       #
+# Last Modified : Sunday, October 18th 2026, 10:47:12 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests proximal optimization of L1 regularized estimators."""
+import numpy as np
+import pytest
+from pytest import mark
+from sklearn.datasets import make_regression
+from sklearn.linear_model import Lasso, ElasticNet
+
+from mlstudio.supervised.algorithms.optimization.services.optimizers import GradientDescentOptimizer
+from mlstudio.supervised.algorithms.optimization.services.optimizers import ISTA, FISTA
+from mlstudio.supervised.algorithms.optimization.services.regularizers import L1, L1_L2
+# --------------------------------------------------------------------------  #
+params = {'epochs': 300, 'eta0': 0.5, 'val_size': None}
+
+def _data():
+    X, y = make_regression(n_samples=500, n_features=200, n_informative=10, 
+                           noise=1, random_state=5)
+    return X / np.linalg.norm(X, axis=0) * np.sqrt(len(X)), y
+
+def _lasso_objective(est, X, y, alpha):
+    """Returns the Lasso objective, with the bias penalized, at the estimator's theta."""
+    theta = np.r_[est.intercept_, est.coef_]
+    residual = np.c_[np.ones(len(X)), X].dot(theta) - y
+    return np.mean(residual**2) / 2 + alpha * np.sum(np.abs(theta))
+
+@mark.gradient_descent
+@mark.proximal
+class ProximalTests:
+
+    @pytest.mark.parametrize("regularizer, reference", 
+                             [(L1(alpha=1), Lasso(alpha=1)), 
+                              (L1_L2(alpha=1, ratio=0.5), ElasticNet(alpha=1, l1_ratio=0.5))])
+    def test_proximal_ista(self, regularizer, reference, get_gd_regressor):
+        X, y = _data()
+        est = get_gd_regressor(regularizer, ISTA(), **params).fit(X, y)
+        # Lasso and ElasticNet fit without an intercept penalize the bias as ISTA does
+        reference.set_params(fit_intercept=False, tol=1e-12, max_iter=100000)
+        reference.fit(np.c_[np.ones(len(X)), X], y)
+        assert np.allclose(np.r_[est.intercept_, est.coef_], reference.coef_, atol=1e-4), \
+            "ISTA solution differs from coordinate descent"
+        assert np.array_equal(est.coef_ == 0, reference.coef_[1:] == 0), \
+            "ISTA solution not sparse"
+
+    def test_proximal_sparsity(self, get_gd_regressor):
+        X, y = _data()
+        ista = get_gd_regressor(L1(alpha=1), ISTA(), **params).fit(X, y)
+        fista = get_gd_regressor(L1(alpha=1), FISTA(), **params).fit(X, y)
+        gd = get_gd_regressor(L1(alpha=1), GradientDescentOptimizer(), **params).fit(X, y)
+        assert np.array_equal(fista.coef_ == 0, ista.coef_ == 0), "FISTA support incorrect"
+        # FISTA reaches an objective at or below that of ISTA in as many epochs
+        for epochs in [10, 50]:
+            ista = get_gd_regressor(L1(alpha=1), ISTA(), **dict(params, epochs=epochs)).fit(X, y)
+            fista = get_gd_regressor(L1(alpha=1), FISTA(), **dict(params, epochs=epochs)).fit(X, y)
+            assert _lasso_objective(fista, X, y, 1) <= _lasso_objective(ista, X, y, 1) + 1e-8, \
+                "FISTA objective above that of ISTA after {e} epochs".format(e=epochs)
+        assert np.all(gd.coef_ != 0), "Subgradient descent set parameters to zero"
+
+    def test_proximal_refit(self, get_gd_regressor):
+        X, y = _data()
+        est = get_gd_regressor(L1(alpha=1), ISTA(), **params).fit(X, y)
+        # Refitting with a subgradient optimizer restores the L1 gradient
+        est.set_params(optimizer=GradientDescentOptimizer()).fit(X, y)
+        theta = np.r_[est.intercept_, est.coef_]
+        assert np.any(est.loss.regularizer.gradient(theta) != 0), \
+            "L1 gradient left in proximal mode after refit"
+        assert np.all(est.coef_ != 0), "Subgradient descent set parameters to zero"
+
+    def test_proximal_predict(self, get_gd_regressor):
+        X, y = _data()
+        est = get_gd_regressor(L1(alpha=1), ISTA(), **params).fit(X, y)
+        assert est._support is not None, "Sparse support not recorded"
+        assert len(est._support) == np.sum(est.coef_ != 0), "Sparse support incorrect"
+        dense = X.dot(est.coef_) + est.intercept_
+        assert np.allclose(est.predict(X), dense), "Sparse predictions incorrect"
+        # Dense parameters are predicted from all features
+        est = get_gd_regressor(L1(alpha=1e-3), ISTA(), **params).fit(X, y)
+        assert est._support is None, "Sparse support recorded for dense parameters"
+        assert np.allclose(est.predict(X), X.dot(est.coef_) + est.intercept_), \
+            "Dense predictions incorrect"
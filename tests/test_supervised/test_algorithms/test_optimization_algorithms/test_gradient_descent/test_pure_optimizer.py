@@ -84,4 +84,44 @@ class PureOptimizerObjectiveTests:
                 if solution_norm - objective_min_norm > 50:
                     print(msg)
 
-    
\ No newline at end of file
+    
+# --------------------------------------------------------------------------  #
+#                           TEST MULTI-START                                  #
+# --------------------------------------------------------------------------  #
+@mark.gradient_descent
+@mark.pure_optimizer
+@mark.multi_start
+class PureOptimizerMultiStartTests:
+
+    @pytest.mark.parametrize("optimizer", [GradientDescentOptimizer, Momentum,
+                                           Nesterov, Adadelta, Adam, AdaMax])
+    def test_pure_optimizer_multi_start(self, optimizer):
+        starts = np.random.RandomState(5).uniform(-4, 4, size=(6, 2))
+        est = GD(epochs=200, theta_init=starts, objective=Himmelblau(),
+                 optimizer=optimizer(), tol=1e-3)
+        est.fit()
+        singles = [GD(epochs=200, theta_init=start, objective=Himmelblau(),
+                      optimizer=optimizer(), tol=1e-3).fit() for start in starts]
+        assert est.theta_.shape == (6, 2), "theta_ shape incorrect"
+        assert np.allclose(est.theta_, [single.theta_ for single in singles]), \
+            "Starts differ from single fits"
+        assert np.array_equal(est.converged_, [single.converged for single in singles]), \
+            "Convergence mask differs from single fits"
+
+    def test_pure_optimizer_multi_start_log(self):
+        est = GD(epochs=500, n_starts=20, objective=Himmelblau(), tol=1e-3,
+                 random_state=5)
+        est.fit()
+        log = est.get_blackbox().epoch_log
+        x, y = Himmelblau().range
+        assert est.theta_.shape == (20, 2), "theta_ shape incorrect"
+        assert np.all(log['theta'][0] >= [x['min'], y['min']]) and \
+            np.all(log['theta'][0] <= [x['max'], y['max']]), "Starts not drawn from the range"
+        assert log['costs'][-1].shape == (20,), "Costs of starts not logged"
+        assert log['train_cost'][-1] == np.min(log['costs'][-1]), "Best cost not logged"
+        assert log['n_active'][-1] == 20 - est.converged_.sum(), "Active starts not logged"
+        # Converged starts are no longer updated
+        frozen = np.array(log['theta'][-1])[est.converged_]
+        assert np.array_equal(frozen, est.theta_[est.converged_]), "Converged starts updated"
+        assert est.converged and est.n_iter_ < 500, \
+            "Training did not end when all starts converged"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_regularization_path.py                                       #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 9:58:40 pm                       #
+# Last Modified : Sunday, October 18th 2026, 9:58:40 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests regularization paths of gradient descent estimators."""
+import numpy as np
+import pytest
+from pytest import mark
+from sklearn.datasets import make_regression
+from sklearn.linear_model import enet_path
+
+from mlstudio.supervised.algorithms.optimization.services.regularizers import L1, L2, L1_L2
+# --------------------------------------------------------------------------  #
+@mark.gradient_descent
+@mark.regularization_path
+class RegularizationPathTests:
+
+    @pytest.mark.parametrize("regularizer, ratio", [(L1(), 1.0), (L1_L2(ratio=0.5), 0.5)])
+    @pytest.mark.parametrize("implicit", [False, True])
+    def test_regularization_path_cd(self, regularizer, ratio, implicit, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=20, n_informative=5, 
+                               noise=10, random_state=5)
+        est = get_gd_regressor(regularizer, implicit=implicit, epochs=1000, val_size=None)
+        alphas, thetas, n_iter = est.regularization_path(X, y, n_alphas=20, 
+                                                         solver='cd', tol=1e-10)
+        assert np.all(np.diff(alphas) < 0), "Alphas not decreasing"
+        assert np.all(thetas[0] == 0), "Parameters not zero at alpha_max"
+        # enet_path has no intercept, so the bias column is penalized as in theta
+        _, coefs, _ = enet_path(np.c_[np.ones(len(X)), X], y, l1_ratio=ratio, 
+                                alphas=alphas, tol=1e-12, max_iter=100000)
+        assert np.allclose(thetas, coefs.T, atol=1e-6), "Coordinate descent path incorrect"
+        assert np.allclose(est.coef_, thetas[-1][1:]), "Estimator not left at the last alpha"
+        assert est.alpha_ == alphas[-1], "Last alpha not recorded"
+        assert est.get_params()['loss'].regularizer.alpha == regularizer.alpha, \
+            "Alpha of the loss changed by the path"
+
+    def test_regularization_path_gd(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=10, noise=10, random_state=5)
+        est = get_gd_regressor(L2(alpha=0.5), eta0=0.1, epochs=1000, val_size=None)
+        alphas, thetas, n_iter = est.regularization_path(X, y, 
+                                    alphas=np.geomspace(1e-3, 1, 10), tol=1e-8)
+        assert np.all(np.diff(alphas) < 0), "Alphas not decreasing"
+        # The L2 gradient, alpha * theta, is that of alpha / 2 * |theta|^2
+        X1 = np.c_[np.ones(len(X)), X]
+        gram = X1.T.dot(X1) / len(X)
+        exact = [np.linalg.solve(gram + alpha * np.eye(11), X1.T.dot(y) / len(X))
+                 for alpha in alphas]
+        assert np.allclose(thetas, exact, atol=1e-3), "Gradient descent path incorrect"
+        assert n_iter.sum() < 0.5 * len(alphas) * est.epochs, "Alphas not warm started"
+        assert est.n_iter_ == n_iter.sum(), "Epochs of the path not recorded"
+        assert est.alpha_ == alphas[-1], "Last alpha not recorded"
+        assert est.loss.regularizer.alpha == 0.5, "Alpha of the loss changed by the path"
+
+    def test_regularization_path_auto(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=20, n_informative=5, 
+                               noise=10, random_state=5)
+        _, auto, _ = get_gd_regressor(L1(), val_size=None).regularization_path(
+            X, y, n_alphas=10)
+        _, cd, _ = get_gd_regressor(L1(), val_size=None).regularization_path(
+            X, y, n_alphas=10, solver='cd')
+        assert np.array_equal(auto, cd), "Coordinate descent not selected for L1"
+        with pytest.warns(UserWarning):
+            get_gd_regressor(L1(), epochs=5, val_size=None).regularization_path(
+                X, y, n_alphas=2, solver='gd')
+
+    def test_regularization_path_validation(self, get_gd_regressor):
+        X, y = make_regression(n_samples=50, n_features=2, random_state=5)
+        with pytest.raises(ValueError):
+            get_gd_regressor(None).regularization_path(X, y)
+        with pytest.raises(ValueError):
+            get_gd_regressor(L2()).regularization_path(X, y)
+        with pytest.raises(ValueError):
+            get_gd_regressor(L2()).regularization_path(X, y, alphas=[0.1], solver='cd')
+        with pytest.raises(ValueError):
+            get_gd_regressor(L1()).regularization_path(X, y, solver='newton')
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_snapshot.py                                                  #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 11:52:37 pm                      #
+# Last Modified : Sunday, October 18th 2026, 11:52:37 pm                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the cadence and modes of performance snapshots."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pytest import mark
+from sklearn.datasets import make_regression
+
+from mlstudio.supervised.algorithms.optimization import gradient_descent
+# --------------------------------------------------------------------------  #
+def _evaluated(est):
+    return np.flatnonzero(est.get_blackbox().epoch_log['evaluated'])
+
+@mark.gradient_descent
+@mark.snapshot
+class SnapshotTests:
+
+    def test_snapshot_mode(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        full = get_gd_regressor(epochs=100).fit(X, y)
+        fast = get_gd_regressor(epochs=100, snapshot_mode='fast').fit(X, y)
+        full_log = full.get_blackbox().epoch_log
+        fast_log = fast.get_blackbox().epoch_log
+        for key in ['train_cost', 'train_score', 'val_cost', 'val_score']:
+            assert len(fast_log[key]) == 100, "Fast snapshot " + key + " not logged"
+            assert np.allclose(full_log[key], fast_log[key]), \
+                "Fast snapshot " + key + " differs from full snapshot"
+        assert np.allclose(full.coef_, fast.coef_), "Fast snapshot changed the solution"
+        assert np.array_equal(_evaluated(full), np.arange(100)), "Epochs not all evaluated"
+        assert np.array_equal(_evaluated(fast), np.arange(100)), "Epochs not all evaluated"
+
+    @pytest.mark.parametrize("mode", ['full', 'fast'])
+    def test_snapshot_freq(self, get_gd_regressor, mode):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        every = get_gd_regressor(epochs=100, snapshot_mode=mode).fit(X, y)
+        est = get_gd_regressor(epochs=100, snapshot_mode=mode, snapshot_freq=10).fit(X, y)
+        # Every 10 epochs, plus the final epoch
+        evaluated = _evaluated(est)
+        assert np.array_equal(evaluated, list(range(0, 100, 10)) + [99]), \
+            "snapshot_freq not honored"
+        log, every_log = est.get_blackbox().epoch_log, every.get_blackbox().epoch_log
+        assert len(log['train_cost']) == 100, "Epochs between snapshots not logged"
+        for key in ['train_cost', 'val_score']:
+            values, expected = np.array(log[key]), np.array(every_log[key])
+            assert np.allclose(values[evaluated], expected[evaluated]), \
+                key + " incorrect at snapshots"
+            # The last snapshot is carried forward to the epochs in between
+            last = evaluated[np.searchsorted(evaluated, np.arange(100), side='right') - 1]
+            assert np.array_equal(values, values[last]), key + " not carried forward"
+        assert np.allclose(est.coef_, every.coef_), "Snapshot cadence changed the solution"
+
+    def test_snapshot_interval(self, get_gd_regressor, monkeypatch):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        est = get_gd_regressor(epochs=100, snapshot_freq=10, snapshot_interval=4)
+        # A clock that advances by one second per epoch
+        monkeypatch.setattr(gradient_descent, 'time', 
+                            SimpleNamespace(perf_counter=lambda: est._epoch))
+        est.fit(X, y)
+        assert np.array_equal(_evaluated(est), list(range(0, 100, 4)) + [99]), \
+            "snapshot_interval not honored, or did not take precedence"
+
+    def test_snapshot_validation(self, get_gd_regressor):
+        X, y = make_regression(n_samples=50, n_features=2, random_state=5)
+        with pytest.raises(ValueError):
+            get_gd_regressor(snapshot_mode='hat').fit(X, y)
+        with pytest.raises(ValueError):
+            get_gd_regressor(snapshot_freq=0).fit(X, y)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_sparse.py                                                    #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 11:58:09 pm                      #
+# Last Modified : Sunday, October 18th 2026, 11:58:09 pm                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests training of gradient descent estimators on csr matrices."""
+import numpy as np
+import pytest
+from pytest import mark
+from scipy.sparse import csr_matrix, issparse
+from sklearn.datasets import make_regression
+# --------------------------------------------------------------------------  #
+@mark.gradient_descent
+@mark.sparse
+class SparseTests:
+
+    @pytest.mark.parametrize("implicit", [False, True])
+    @pytest.mark.parametrize("batch_size", [None, 32])
+    def test_sparse_fit(self, get_gd_regressor, implicit, batch_size):
+        X, y = make_regression(n_samples=200, n_features=20, noise=10, random_state=5)
+        # Mostly zero features, as from one-hot or hashed encodings
+        X[np.random.RandomState(5).rand(*X.shape) < 0.8] = 0
+        X_csr = csr_matrix(X)
+        dense = get_gd_regressor(epochs=50, implicit=implicit, 
+                                 batch_size=batch_size).fit(X, y)
+        est = get_gd_regressor(epochs=50, implicit=implicit, 
+                               batch_size=batch_size).fit(X_csr, y)
+        assert issparse(est.X_train_), "Training data densified"
+        assert np.allclose(est.intercept_, dense.intercept_) and \
+            np.allclose(est.coef_, dense.coef_), "Sparse fit differs from dense fit"
+        log, dense_log = est.get_blackbox().epoch_log, dense.get_blackbox().epoch_log
+        for key in ['train_cost', 'val_score']:
+            assert np.allclose(log[key], dense_log[key]), key + " of sparse fit incorrect"
+        assert np.allclose(est.predict(X_csr), dense.predict(X)), "Sparse predictions incorrect"
+        assert np.allclose(est.predict(X), dense.predict(X)), "Dense predictions incorrect"
+        assert np.isclose(est.score(X_csr, y), dense.score(X, y)), "Sparse score incorrect"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_warm_start.py                                                #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 9:31:17 pm                       #
+# Last Modified : Sunday, October 18th 2026, 9:31:17 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests warm starts and partial_fit of gradient descent estimators."""
+import numpy as np
+import pytest
+from pytest import mark
+from sklearn.datasets import make_regression
+
+from mlstudio.supervised.algorithms.optimization.services.optimizers import Adam
+# --------------------------------------------------------------------------  #
+@mark.gradient_descent
+@mark.warm_start
+class WarmStartTests:
+
+    def test_warm_start(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        cold = get_gd_regressor(optimizer=Adam(), epochs=50).fit(X, y)
+        warm = get_gd_regressor(optimizer=Adam(), epochs=20, warm_start=True).fit(X, y)
+        warm.set_params(epochs=30).fit(X, y)
+        assert warm.n_iter_ == 50, "Warm start did not continue the epochs"
+        assert np.allclose(warm.coef_, cold.coef_), \
+            "Warm start did not continue from theta and optimizer state"
+        assert len(warm.get_blackbox().epoch_log['train_cost']) == 50, \
+            "Warm start did not continue the history"
+        # Without a warm start, each fit starts afresh
+        refit = get_gd_regressor(optimizer=Adam(), epochs=50).fit(X, y).fit(X, y)
+        assert refit.n_iter_ == 50 and np.allclose(refit.coef_, cold.coef_), \
+            "Fit without a warm start continued training"
+        # New data are processed and must have the same features
+        warm.fit(X[:100], y[:100])
+        assert warm.X_train_.shape[0] < 100, "New data not processed"
+        with pytest.raises(ValueError):
+            warm.fit(X[:, :3], y)
+
+    def test_partial_fit(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        est = get_gd_regressor(optimizer=Adam(), val_size=None, epochs=10).fit(X, y)
+        incremental = get_gd_regressor(optimizer=Adam(), val_size=None)
+        for _ in range(10):
+            incremental.partial_fit(X, y)
+        assert incremental.n_iter_ == 10, "partial_fit did not train one epoch per call"
+        assert np.allclose(incremental.coef_, est.coef_), \
+            "partial_fit differs from an equivalent fit"
+        # Batches are not split, and each is trained on in turn
+        batches = get_gd_regressor(optimizer=Adam())
+        for i in range(0, 200, 50):
+            batches.partial_fit(X[i:i+50], y[i:i+50])
+            assert batches.X_train_.shape == (50, 6), "Batch not processed"
+        assert batches.n_iter_ == 4, "Batches not trained incrementally"
+        with pytest.raises(ValueError):
+            batches.partial_fit(X[:, :3], y)
+        # A warm fit on the first batch after others prepares it again
+        X1, y1, X2, y2 = X[:150], y[:150], X[150:], y[150:]
+        est = get_gd_regressor(optimizer=Adam(), val_size=None, epochs=1)
+        est.partial_fit(X1, y1)
+        est.partial_fit(X2, y2)
+        est.set_params(warm_start=True).fit(X1, y1)
+        assert est.X_train_.shape[0] == 150, "Warm fit trained on the last batch"
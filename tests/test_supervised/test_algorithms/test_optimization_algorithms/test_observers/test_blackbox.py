@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : ML Studio                                                         #
+# Version : 0.1.14                                                            #
+# File    : test_blackbox.py                                                  #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 12:48:03 pm                      #
+# Last Modified : Sunday, October 18th 2026, 12:48:03 pm                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the BlackBox observer and its columnar history."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.supervised.algorithms.optimization.observers.history import BlackBox
+from mlstudio.supervised.algorithms.optimization.observers.history import History
+# --------------------------------------------------------------------------  #
+def _log(i, p=3):
+    return {'epoch': i, 'eta': 0.1, 'evaluated': i % 2 == 0,
+            'theta': np.full(p, float(i)), 
+            'gradient': None if i == 0 else np.full(p, float(i)),
+            'peak_memory': None}
+
+@mark.blackbox
+class BlackBoxTests:
+
+    def test_blackbox_history(self):
+        bb = BlackBox()
+        bb.on_train_begin()
+        for i in range(100):
+            bb.on_epoch_end(i, _log(i))
+        log = bb.epoch_log
+        assert bb.total_epochs == 100, "BlackBox epoch count error"
+        assert log['epoch'].dtype == np.int64, "Integer column dtype error"
+        assert log['evaluated'].dtype == np.bool_, "Boolean column dtype error"
+        assert np.array_equal(log.get('epoch'), np.arange(100)), "Scalar column error"
+        assert log['theta'].shape == (100, 3), "Array column shape error"
+        assert np.isnan(log['gradient'][0]).all(), "Deferred array column error"
+        assert np.array_equal(log['gradient'][1:, 0], np.arange(1, 100)), "Deferred array column error"
+        assert all(m is None for m in log['peak_memory']), "Object column error"
+        assert log.get('val_cost') is None, "Missing key error"
+        df = bb.to_frame()
+        assert df.shape == (100, 10), "to_frame shape error"
+        assert np.array_equal(df['theta_2'], np.arange(100)), "to_frame array column error"
+
+    def test_blackbox_retention(self):
+        history = History(downsample=10, retain=5)
+        for i in range(1000):
+            history.append(_log(i))
+        assert len(history['epoch']) == 1000, "Scalar columns must not be downsampled"
+        assert np.array_equal(history.index('theta'), [950, 960, 970, 980, 990]), \
+            "Ring buffer order error"
+        assert np.array_equal(history['theta'][:, 0], [950, 960, 970, 980, 990]), \
+            "Ring buffer values error"
+        df = history.to_frame()
+        assert df['theta_0'].notna().sum() == 5, "to_frame retention error"
+        assert df.loc[990, 'theta_0'] == 990, "to_frame alignment error"
+
+    def test_blackbox_scalar_promotion(self):
+        history = History()
+        for value in [True, 2, 2.5]:
+            history.append({'x': value})
+        assert history['x'].dtype == np.float64, "Numeric promotion error"
+        history.append({'x': None})
+        assert history['x'].dtype == object, "Object promotion error"
+        assert list(history['x']) == [1.0, 2.0, 2.5, None], "Promotion values error"
+
+    def test_blackbox_validation(self):
+        with pytest.raises(ValueError):
+            BlackBox(downsample=0).on_train_begin()
+        with pytest.raises(TypeError):
+            BlackBox(retain=2.5).on_train_begin()
+        history = History()
+        history.append({'theta': np.zeros(3)})
+        with pytest.raises(ValueError):
+            history.append({'theta': np.zeros(4)})
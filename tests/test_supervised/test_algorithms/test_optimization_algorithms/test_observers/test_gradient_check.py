@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_gradient_check.py                                            #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 7:41:26 pm                       #
+# Last Modified : Sunday, October 18th 2026, 7:41:26 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the gradient check observer."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.data_services.preprocessing import RegressionDataProcessor
+from mlstudio.data_services.preprocessing import BinaryClassDataProcessor
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GD
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GDBinaryclass
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GDRegressor
+from mlstudio.supervised.algorithms.optimization.observers.debug import GradientCheck
+from mlstudio.supervised.algorithms.optimization.services.activations import Sigmoid
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Himmelblau
+from mlstudio.supervised.algorithms.optimization.services.loss import Quadratic, CrossEntropy
+# --------------------------------------------------------------------------  #
+class BrokenQuadratic(Quadratic):
+    """Quadratic loss whose gradient is off by a factor of two."""
+    def gradient(self, theta, X, y, y_out):
+        return 2 * super(BrokenQuadratic, self).gradient(theta, X, y, y_out)
+
+def _model(estimator, X, y):
+    """Sets the training data a gradient check reads from an estimator."""
+    estimator.X_train_ = X
+    estimator.y_train_ = y
+    return estimator
+
+def _check(model, theta, **kwargs):
+    checker = GradientCheck(iterations=1, random_state=5, **kwargs)
+    checker.set_model(model)
+    checker.on_train_begin()
+    checker.on_epoch_end(epoch=0, log={'epoch': 0, 'theta': theta})
+    return checker
+
+@mark.observer
+@mark.gradient_check
+class GradientCheckTests:
+
+    @pytest.mark.parametrize("mode", ['full', 'subset', 'directional'])
+    def test_gradient_check(self, mode):
+        rng = np.random.RandomState(5)
+        X = np.c_[np.ones(100), rng.randn(100, 30)]
+        y = X.dot(rng.randn(31))
+        theta = rng.randn(31)
+        regressor = _model(GDRegressor(loss=Quadratic(), 
+                           data_processor=RegressionDataProcessor()), X, y)
+        checker = _check(regressor, theta, mode=mode, batch_size=7)
+        n = {'full': 31, 'subset': 10, 'directional': 1}[mode]
+        assert len(checker._approximations[0]) == n, "Wrong number of derivatives checked"
+        assert checker._results == [True], "Correct gradient failed the check"
+        # A classifier, with a bias term applied implicitly. Small parameters
+        # keep its probabilities clear of the clipping in the loss.
+        classifier = _model(GDBinaryclass(loss=CrossEntropy(), activation=Sigmoid(),
+                            data_processor=BinaryClassDataProcessor()),
+                            X[:, 1:], (y > 0).astype(float))
+        checker = _check(classifier, theta / 10, mode=mode, batch_size=7)
+        assert checker._results == [True], "Correct classifier gradient failed the check"
+        # An incorrect gradient fails
+        regressor = _model(GDRegressor(loss=BrokenQuadratic(), 
+                           data_processor=RegressionDataProcessor()), X, y)
+        checker = _check(regressor, theta, mode=mode, batch_size=7)
+        assert checker._results == [False], "Incorrect gradient passed the check"
+
+    @pytest.mark.parametrize("mode", ['full', 'subset', 'directional'])
+    def test_gradient_check_benchmark(self, mode):
+        model = GD(epochs=10, objective=Himmelblau(), random_state=5).fit()
+        checker = _check(model, model.theta_, mode=mode)
+        assert checker._results == [True], "Correct benchmark gradient failed the check"
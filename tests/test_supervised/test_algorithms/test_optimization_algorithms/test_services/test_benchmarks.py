@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_benchmarks.py                                                #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 6:02:14 pm                       #
+# Last Modified : Sunday, October 18th 2026, 6:02:14 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests batched and n-dimensional evaluation of benchmark functions."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Adjiman
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import BartelsConn
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Himmelblau
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Leon
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Rosenbrock
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Branin02
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import StyblinskiTank
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import SumSquares
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import ThreeHumpCamel
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Ursem01
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Wikipedia
+# --------------------------------------------------------------------------  #
+benchmarks = [Adjiman, BartelsConn, Himmelblau, Leon, Rosenbrock, Branin02,
+              StyblinskiTank, SumSquares, ThreeHumpCamel, Ursem01, Wikipedia]
+
+def numerical_gradient(objective, theta, h=1e-6):
+    """Approximates the gradient of an objective by central differences."""
+    return np.array([(objective(theta + e) - objective(theta - e)) / (2 * h)
+                     for e in np.eye(len(theta)) * h])
+
+@mark.benchmarks
+class BenchmarkTests:
+
+    @pytest.mark.parametrize("benchmark", benchmarks)
+    def test_benchmark_batch(self, benchmark):
+        objective = benchmark()
+        thetas = np.random.RandomState(5).uniform(-2, 2, size=(20, 2))
+        costs = objective(thetas)
+        gradients = objective.gradient(thetas)
+        assert costs.shape == (20,), objective.name + ": cost shape incorrect"
+        assert gradients.shape == (20, 2), objective.name + ": gradient shape incorrect"
+        assert np.allclose(costs, [objective(theta) for theta in thetas]), \
+            objective.name + ": batched costs differ from those of single points"
+        assert np.allclose(gradients, [objective.gradient(theta) for theta in thetas]), \
+            objective.name + ": batched gradients differ from those of single points"
+
+    @pytest.mark.parametrize("benchmark", [Rosenbrock, StyblinskiTank, SumSquares])
+    def test_benchmark_n_dims(self, benchmark):
+        objective = benchmark(n_dims=5, gradient_scaler=None)
+        assert objective.start.shape == objective.minimum.shape == (5,), \
+            objective.name + ": start or minimum not of n_dims"
+        thetas = np.random.RandomState(5).uniform(-2, 2, size=(10, 5))
+        expected = np.array([numerical_gradient(objective, theta) for theta in thetas])
+        assert np.allclose(objective.gradient(thetas), expected, rtol=1e-4, atol=1e-4), \
+            objective.name + ": gradient incorrect"
+        # The minimum is a stationary point
+        assert np.allclose(objective.gradient(objective.minimum), 0, atol=1e-4), \
+            objective.name + ": gradient at minimum not zero"
+
+    def test_benchmark_gradient_scale_batch(self):
+        objective = SumSquares()
+        thetas = np.array([[1e12, 0], [1, 1], [1e-12, 0]])
+        gradients = objective.gradient(thetas)
+        for gradient, theta in zip(gradients, thetas):
+            assert np.allclose(gradient, objective.gradient(theta)), \
+                "Gradients of a batch not scaled independently"
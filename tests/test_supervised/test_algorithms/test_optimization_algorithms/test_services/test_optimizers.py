@@ -41,7 +41,8 @@ from mlstudio.supervised.algorithms.optimization.services.optimizers import Mome
 from mlstudio.supervised.algorithms.optimization.services.optimizers import Adagrad, Adadelta     
 from mlstudio.supervised.algorithms.optimization.services.optimizers import RMSprop, Adam, AdaMax
 from mlstudio.supervised.algorithms.optimization.services.optimizers import Nadam, AMSGrad, AdamW
-from mlstudio.supervised.algorithms.optimization.services.optimizers import AggMo, QuasiHyperbolicMomentum
+from mlstudio.supervised.algorithms.optimization.services.optimizers import AggMo, QuasiHyperbolicMomentum, QHAdam
+from mlstudio.supervised.algorithms.optimization.services.optimizers import ISTA, FISTA
 # --------------------------------------------------------------------------  #
 # Mock gradient function
 def gradient(theta):
@@ -92,4 +93,99 @@ def test_optimizer_adagrad(get_optimization_adagrad_test_package):
                 i = str(i),
                 e=str(p['theta'][i]), a=str(theta)
         )
-        theta, grad = optimizer(gradient, alpha, theta)          
\ No newline at end of file
+        theta, grad = optimizer(gradient, alpha, theta)          
+
+# --------------------------------------------------------------------------  #
+# Dense Adagrad update, inverting the n x n matrix G_t + epsilon*I each step
+def dense_adagrad(gradient, learning_rate, theta, sum_squared_gradients, 
+                  epsilon=1e-8):
+    grad = gradient(theta)
+    sum_squared_gradients = sum_squared_gradients + np.square(grad)
+    Gt_e = np.diag(sum_squared_gradients) + np.diag(np.full(len(grad), epsilon))
+    Gt_e_sqrt_inv = np.linalg.inv(np.sqrt(Gt_e))
+    theta = theta - learning_rate * Gt_e_sqrt_inv.dot(grad)
+    return theta, sum_squared_gradients
+
+@mark.optimizers
+@mark.adagrad
+def test_optimizer_adagrad_dense_equivalence():
+    rng = np.random.RandomState(5)
+    X = rng.randn(50, 8)
+    y = rng.randn(50)
+    def quadratic_gradient(theta):
+        return X.T.dot(X.dot(theta) - y) / X.shape[0]
+    theta_dense = rng.randn(8)
+    theta = theta_dense.copy()
+    sum_squared_gradients = np.zeros(8)
+    optimizer = Adagrad()
+    for i in range(50):
+        theta_dense, sum_squared_gradients = dense_adagrad(
+            quadratic_gradient, 0.1, theta_dense, sum_squared_gradients)
+        theta, grad = optimizer(quadratic_gradient, 0.1, theta)
+        assert np.allclose(theta, theta_dense), \
+            "Adagrad differs from dense Adagrad on iteration {i}".format(i=str(i))
+    assert np.allclose(optimizer.sum_squared_gradients, sum_squared_gradients)
+
+# --------------------------------------------------------------------------  #
+# Gradient function that writes into a preallocated buffer
+class InPlaceGradient:
+    def __init__(self, shape):
+        self._grad = np.zeros(shape)
+    def __call__(self, theta):
+        np.multiply(theta, 0.95, out=self._grad)
+        return self._grad
+
+optimizers = [GradientDescentOptimizer, Momentum, Nesterov, Adagrad, Adadelta,
+              RMSprop, Adam, AdaMax, Nadam, AMSGrad, AdamW, QHAdam, AggMo,
+              QuasiHyperbolicMomentum, ISTA, FISTA]
+
+@mark.optimizers
+@mark.parametrize("optimizer", optimizers)
+def test_optimizer_update_in_place(optimizer):
+    theta_init = np.random.RandomState(5).randn(10)
+    theta = theta_init.copy()
+    called = optimizer()
+    updated = optimizer()
+    for i in range(20):
+        expected, grad = called(gradient, 0.01, theta)        
+        assert not np.shares_memory(expected, theta), "Call must not modify theta"
+        theta_id = id(theta)
+        updated.update(gradient, 0.01, theta)
+        assert id(theta) == theta_id, "Update must modify theta in place"
+        assert np.allclose(theta, expected), \
+            "{o} update differs from call on iteration {i}".format(
+                o=updated.name, i=str(i))
+
+@mark.optimizers
+@mark.parametrize("optimizer", optimizers)
+def test_optimizer_update_allocations(optimizer):
+    import tracemalloc
+    theta = np.random.RandomState(5).randn(1000)
+    grad = InPlaceGradient(theta.shape)
+    optimizer = optimizer()
+    # The first update allocates the state and scratch buffers
+    optimizer.update(grad, 0.01, theta)
+    tracemalloc.start()
+    for i in range(10):
+        optimizer.update(grad, 0.01, theta)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < theta.nbytes, \
+        "{o} allocates {p} bytes per update.".format(o=optimizer.name, p=str(peak))
+
+@mark.optimizers
+@mark.parametrize("optimizer", optimizers)
+def test_optimizer_dtype(optimizer):
+    theta = np.random.RandomState(5).randn(10).astype(np.float32)
+    optimizer = optimizer()
+    for i in range(5):
+        optimizer.update(gradient, 0.01, theta)
+    assert theta.dtype == np.float32, "Update changed the dtype of theta"
+    buffers = [v for v in vars(optimizer).values() if isinstance(v, np.ndarray)]
+    assert all(b.dtype == np.float32 for b in buffers), "Buffers not allocated in theta's dtype"
+    theta_new, _ = optimizer(gradient, 0.01, theta)
+    assert theta_new.dtype == np.float32, "Call changed the dtype of theta"
+    # Buffers are reallocated when the dtype of theta changes
+    optimizer.update(gradient, 0.01, theta.astype(np.float64))
+    buffers = [v for v in vars(optimizer).values() if isinstance(v, np.ndarray)]
+    assert all(b.dtype == np.float64 for b in buffers), "Buffers not reallocated for new dtype"
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : ML Studio                                                         #
+# Version : 0.1.14                                                            #
+# File    : test_profilers.py                                                 #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 9:40:12 am                       #
+# Last Modified : Sunday, October 18th 2026, 9:40:12 am                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Test resource profilers."""
+import tracemalloc
+
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.supervised.algorithms.optimization.services.profilers import TraceMallocProfiler
+from mlstudio.supervised.algorithms.optimization.services.profilers import ResourceProfiler
+# --------------------------------------------------------------------------  #
+def _profile(profiler, epochs=10):
+    """Runs the profiler over a number of epochs and returns its logs."""
+    logs = []
+    for epoch in range(epochs):
+        profiler.start(epoch)
+        x = np.ones(10000)
+        logs.append(profiler.stop(epoch))
+    return logs
+
+@mark.profilers
+class ProfilerTests:
+
+    def test_profiler_modes(self):
+        for profiler in [TraceMallocProfiler, ResourceProfiler]:
+            logs = _profile(profiler(mode='off'))
+            assert all(log['peak_memory'] is None for log in logs), "Profiler off mode error"
+            logs = _profile(profiler(mode='sampled', sample_freq=5))
+            sampled = [log['peak_memory'] is not None for log in logs]
+            assert sampled == [True] + 4*[False] + [True] + 4*[False], "Profiler sampled mode error"
+            logs = _profile(profiler(mode='full'))
+            assert all(log['peak_memory'] is not None for log in logs), "Profiler full mode error"
+        # Tracing must not remain active between sampled epochs
+        assert not tracemalloc.is_tracing(), "TraceMallocProfiler left tracemalloc running"
+
+    def test_profiler_validation(self):
+        with pytest.raises(ValueError):
+            TraceMallocProfiler(mode='hat').start(0)
+        with pytest.raises(ValueError):
+            ResourceProfiler(sample_freq=0).start(0)
@@ -215,4 +215,150 @@ class ClassificationMetricTests:
         metric = 'SKEW'
         scorer = classification.Skew()
         d = get_classification_metric_test_package        
-        self._evaluate(d, scorer, test, metric)                                                                
\ No newline at end of file
+        self._evaluate(d, scorer, test, metric)                                                                
+# --------------------------------------------------------------------------- #
+@mark.metrics
+@mark.classification_metrics
+def test_binary_confusion_matrix():
+    from sklearn.metrics import confusion_matrix
+    from mlstudio.supervised.metrics.base import binary_confusion_matrix
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 2, 1000)
+    y_pred = rng.randint(0, 2, 1000)
+    cm = binary_confusion_matrix(y, y_pred)
+    assert np.array_equal(cm, confusion_matrix(y, y_pred, labels=[0,1])), \
+        "Binary confusion matrix doesn't match sklearn."
+    assert np.array_equal(cm, binary_confusion_matrix(y.astype(float), y_pred.astype(bool))), \
+        "Binary confusion matrix doesn't accept float and boolean labels."
+    with pytest.raises(ValueError):
+        binary_confusion_matrix(y, y_pred * 2)
+    with pytest.raises(ValueError):
+        binary_confusion_matrix(y, y_pred * 0.5)
+    with pytest.raises(ValueError):
+        binary_confusion_matrix(y, y_pred[:10])
+    # Invalid pairs that fall into valid bins are rejected
+    for y_bad, y_pred_bad in [([0], [2]), ([1], [-1]), ([0.5], [1]), ([2], [-1])]:
+        with pytest.raises(ValueError):
+            binary_confusion_matrix(y_bad, y_pred_bad)
+
+@mark.metrics
+@mark.classification_metrics
+def test_binary_metrics_shared_confusion_matrix():
+    from mlstudio.supervised.metrics.base import binary_confusion_matrix
+    from sklearn.metrics import matthews_corrcoef
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 2, 1000)
+    y_pred = np.where(rng.rand(1000) < 0.8, y, 1-y)
+    cm = binary_confusion_matrix(y, y_pred)
+    scorers = {binaryclass.Accuracy(): accuracy_score, 
+               binaryclass.BalancedAccuracy(): balanced_accuracy_score,
+               binaryclass.F1(): f1_score, binaryclass.Precision(): precision_score,
+               binaryclass.Recall(): recall_score,
+               binaryclass.MatthewsCorrelationCoefficient(): matthews_corrcoef}
+    for scorer, skl_scorer in scorers.items():
+        expected = skl_scorer(y, y_pred)
+        assert np.isclose(scorer(y, y_pred), expected), \
+            scorer.label + " doesn't match sklearn."
+        # A precomputed confusion matrix is used in place of the data
+        assert np.isclose(scorer(None, None, confusion_matrix=cm), expected), \
+            scorer.label + " doesn't use the precomputed confusion matrix."
+    assert np.isclose(binaryclass.FBeta()(y, y_pred, 2), 
+                      binaryclass.FBeta()(None, None, 2, confusion_matrix=cm)), \
+                          "FBeta doesn't use the precomputed confusion matrix."
+
+# --------------------------------------------------------------------------- #
+@mark.metrics
+@mark.classification_metrics
+@mark.auc
+def test_auc():
+    from sklearn.metrics import roc_curve
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 2, 1000)
+    # Rounding creates many tied probabilities
+    y_prob = np.round(rng.rand(1000) * 0.6 + 0.3 * y, 2)
+    scorer = binaryclass.AUC()
+    assert scorer.is_probability_metric, "AUC must be a probability metric."
+    assert np.isclose(scorer(y, y_prob), roc_auc_score(y, y_prob)), \
+        "AUC doesn't match sklearn."
+    fpr, tpr, _ = roc_curve(y, y_prob, drop_intermediate=False)
+    assert np.allclose(scorer.roc_data['fpr'], fpr), "ROC fpr doesn't match sklearn."
+    assert np.allclose(scorer.roc_data['tpr'], tpr), "ROC tpr doesn't match sklearn."
+    # Downsampled curve retains its end points and the exact AUC
+    scorer = binaryclass.AUC(max_points=10)
+    assert np.isclose(scorer(y, y_prob), roc_auc_score(y, y_prob)), \
+        "Downsampling changed the AUC."
+    assert len(scorer.roc_data) == 10, "ROC data wasn't downsampled."
+    assert scorer.roc_data['fpr'].iloc[0] == 0 and scorer.roc_data['fpr'].iloc[-1] == 1
+    with pytest.raises(ValueError):
+        binaryclass.AUC()(np.ones(10), rng.rand(10))
+    with pytest.raises(ValueError):
+        binaryclass.AUC(mode='fast')(y, y_prob)
+
+@mark.metrics
+@mark.classification_metrics
+@mark.auc
+def test_auc_binned():
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 2, 10000)
+    y_prob = rng.rand(10000) * 0.6 + 0.3 * y
+    expected = roc_auc_score(y, y_prob)
+    scorer = binaryclass.AUC(mode='binned', n_bins=1000)
+    assert np.isclose(scorer(y, y_prob), expected, atol=1e-3), \
+        "Binned AUC not close to sklearn."
+    # Streaming the data in chunks gives the same result as a single pass
+    scorer.reset()
+    for chunk in np.array_split(np.arange(10000), 7):
+        auc = scorer.update(y[chunk], y_prob[chunk])
+    assert np.isclose(auc, binaryclass.AUC(mode='binned', n_bins=1000)(y, y_prob)), \
+        "Streaming binned AUC differs from single pass."
+
+# --------------------------------------------------------------------------- #
+@mark.metrics
+@mark.classification_metrics
+@mark.multiclass_metrics
+def test_multiclass_confusion_matrix():
+    from sklearn.metrics import confusion_matrix
+    from mlstudio.supervised.metrics.base import multiclass_confusion_matrix
+    from mlstudio.supervised.metrics.base import one_vs_rest
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 5, 1000)
+    y_pred = rng.randint(0, 5, 1000)
+    cm = multiclass_confusion_matrix(y, y_pred)
+    assert np.array_equal(cm, confusion_matrix(y, y_pred)), \
+        "Multiclass confusion matrix doesn't match sklearn."
+    # One-hot encoded targets and probabilities are accepted
+    assert np.array_equal(cm, multiclass_confusion_matrix(np.eye(5)[y], np.eye(5)[y_pred])), \
+        "Multiclass confusion matrix doesn't accept one-hot encoded data."
+    assert multiclass_confusion_matrix(y, y_pred, n_classes=8).shape == (8, 8)
+    ovr = one_vs_rest(cm)
+    assert ovr.shape == (2, 2, 5), "One-vs-rest confusion matrices have wrong shape."
+    assert np.all(ovr.sum(axis=(0, 1)) == 1000), "One-vs-rest counts don't sum to n."
+    with pytest.raises(ValueError):
+        multiclass_confusion_matrix(y, y_pred[:10])
+
+@mark.metrics
+@mark.classification_metrics
+@mark.multiclass_metrics
+def test_multiclass_metrics_averages():
+    from sklearn.metrics import jaccard_score
+    from mlstudio.supervised.metrics import multiclass
+    rng = np.random.RandomState(5)
+    y = rng.randint(0, 5, 1000)
+    y_pred = np.where(rng.rand(1000) < 0.7, y, rng.randint(0, 5, 1000))
+    scorers = {multiclass.Precision: precision_score, 
+               multiclass.Recall: recall_score,
+               multiclass.F1: f1_score, multiclass.Jaccard: jaccard_score}
+    for scorer, skl_scorer in scorers.items():
+        for average in ['macro', 'micro', 'weighted', None]:
+            assert np.allclose(scorer(average=average)(y, y_pred), 
+                               skl_scorer(y, y_pred, average=average)), \
+                "{s} {a} average doesn't match sklearn.".format(
+                    s=scorer.__name__, a=str(average))
+        averages = scorer().averages(y, y_pred)
+        for average, score in averages.items():
+            assert np.isclose(score, skl_scorer(y, y_pred, average=average))
+    assert np.isclose(multiclass.Accuracy()(y, y_pred), accuracy_score(y, y_pred))
+    assert np.isclose(multiclass.MissclassificationRate()(y, y_pred), 
+                      1 - accuracy_score(y, y_pred))
+    with pytest.raises(ValueError):
+        multiclass.F1(average='samples')(y, y_pred)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_benchmarking.py                                              #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 5:07:33 pm                       #
+# Last Modified : Sunday, October 18th 2026, 5:07:33 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the benchmark engine."""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pytest import mark
+
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GD
+from mlstudio.supervised.algorithms.optimization.services.benchmarks import Adjiman, Himmelblau
+from mlstudio.supervised.algorithms.optimization.services.optimizers import Momentum, Adam
+from mlstudio.supervised.model.benchmarking import BenchmarkEngine
+# --------------------------------------------------------------------------  #
+def distance(estimator, task):
+    return np.linalg.norm(estimator.theta_ - task['params']['objective'].minimum)
+
+def _grid():
+    estimators = OrderedDict([('Momentum', GD(epochs=20, optimizer=Momentum())),
+                              ('Adam', GD(epochs=20, optimizer=Adam())),
+                              ('Broken', GD(epochs=20, theta_init=np.zeros(3)))])
+    tasks = OrderedDict((o.name, {'params': {'objective': o}})
+                        for o in [Adjiman(), Himmelblau()])
+    return estimators, tasks
+
+@mark.benchmarking
+class BenchmarkEngineTests:
+
+    def test_benchmark_engine(self):
+        estimators, tasks = _grid()
+        serial = BenchmarkEngine(n_jobs=1, random_state=5,
+                                 metrics={'distance': distance}).run(estimators, tasks)
+        parallel = BenchmarkEngine(n_jobs=2, random_state=5,
+                                   metrics={'distance': distance}).run(estimators, tasks)
+        assert list(serial['Estimator']) == ['Momentum'] * 2 + ['Adam'] * 2 + ['Broken'] * 2, \
+            "Rows not in grid order"
+        assert serial['Seed'].nunique() == 6, "Jobs not seeded separately"
+        assert serial['Seed'].equals(parallel['Seed']), "Seeds depend upon the pool"
+        completed = serial['Error'].isnull()
+        assert list(completed) == [True] * 4 + [False] * 2, "Errors not recorded"
+        assert np.allclose(serial['distance'][completed].astype(float),
+                           parallel['distance'][completed].astype(float)), \
+            "Parallel results differ"
+        assert (serial['Epochs'][completed] == 20).all(), "Epochs not recorded"
+
+    def test_benchmark_engine_checkpoint(self, tmp_path):
+        estimators, tasks = _grid()
+        checkpoint = str(tmp_path / 'checkpoint.csv')
+        full = BenchmarkEngine(n_jobs=1, random_state=5,
+                               checkpoint=checkpoint).run(estimators, tasks)
+        # Simulate an interrupted run
+        pd.read_csv(checkpoint).iloc[:2].to_csv(checkpoint, index=False)
+        engine = BenchmarkEngine(n_jobs=1, random_state=5, checkpoint=checkpoint,
+                                 return_estimators=True)
+        resumed = engine.run(estimators, tasks)
+        assert len(engine.estimators_) == 4, "Checkpointed jobs were run again"
+        assert len(pd.read_csv(checkpoint)) == 6, "Checkpoint incomplete"
+        assert np.allclose(resumed['Final Cost'].astype(float),
+                           full['Final Cost'].astype(float), equal_nan=True), \
+            "Resumed results differ"
+
+    def test_benchmark_engine_checkpoint_errors(self, tmp_path):
+        estimators, tasks = _grid()
+        checkpoint = str(tmp_path / 'checkpoint.csv')
+        BenchmarkEngine(n_jobs=1, random_state=5, checkpoint=checkpoint).run(estimators, tasks)
+        # Errored jobs are run again on resume
+        engine = BenchmarkEngine(n_jobs=1, random_state=5, checkpoint=checkpoint,
+                                 return_estimators=True)
+        resumed = engine.run(estimators, tasks)
+        assert list(engine.estimators_) == [('Broken', task) for task in tasks], \
+            "Errored jobs not run again"
+        assert len(resumed) == 6, "Errored jobs recorded twice"
+        assert list(resumed['Error'].isnull()) == [True] * 4 + [False] * 2, \
+            "Errors not recorded"
+        # Unless retry_errors is False
+        engine = BenchmarkEngine(n_jobs=1, random_state=5, checkpoint=checkpoint,
+                                 return_estimators=True, retry_errors=False)
+        resumed = engine.run(estimators, tasks)
+        assert len(engine.estimators_) == 0, "Errored jobs run again"
+        assert len(resumed) == 6, "Errored jobs recorded twice"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_halving.py                                                   #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 9:05:48 pm                       #
+# Last Modified : Sunday, October 18th 2026, 9:05:48 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests successive halving and Hyperband searches."""
+import numpy as np
+import pytest
+from pytest import mark
+from sklearn.base import clone
+from sklearn.datasets import make_regression
+
+from mlstudio.supervised.algorithms.optimization.gradient_descent import GDRegressor
+from mlstudio.supervised.model.selection import SuccessiveHalving, Hyperband
+# --------------------------------------------------------------------------  #
+grid = {'eta0': [0.0001, 0.001, 0.01, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0]}
+
+@mark.halving
+class SuccessiveHalvingTests:
+
+    def test_successive_halving(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        search = SuccessiveHalving(get_gd_regressor(epochs=27), grid).fit(X, y)
+        rungs = search.results_.groupby('Rung')
+        assert list(rungs.size()) == [9, 3, 1], "Candidates not halved at each rung"
+        assert list(rungs['Epochs'].first()) == [3, 9, 27], "Epochs not grown at each rung"
+        assert search.n_epochs_ == 9 * 3 + 3 * 6 + 18, "Survivors restarted"
+        # Survivors are the best of the previous rung
+        first = search.results_[search.results_['Rung'] == 0]
+        best = first.sort_values('val_score', ascending=False)['Candidate'][:3]
+        assert set(best) == set(search.results_[search.results_['Rung'] == 1]['Candidate']), \
+            "Survivors are not the best candidates"
+        # The winner is trained as a single fit would be
+        single = clone(get_gd_regressor(epochs=27)).set_params(**search.best_params_).fit(X, y)
+        assert np.array_equal(single.coef_, search.best_estimator_.coef_), \
+            "Resumed training differs from a single fit"
+        assert search.best_estimator_.n_iter_ == 27, "Winner not trained to max_epochs"
+
+    def test_successive_halving_shared_data(self, get_gd_regressor, monkeypatch):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        calls = []
+        prepare = GDRegressor._prepare_train_val_data
+        def counted(self, *args, **kwargs):
+            calls.append(1)
+            return prepare(self, *args, **kwargs)
+        monkeypatch.setattr(GDRegressor, '_prepare_train_val_data', counted)
+        Hyperband(get_gd_regressor(epochs=27), grid, min_epochs=3, random_state=5).fit(X, y)
+        assert len(calls) == 1, "Data processed for each candidate"
+        # Candidates that split the data differently process their own
+        calls.clear()
+        search = SuccessiveHalving(get_gd_regressor(epochs=27), 
+                                   {'val_size': [0.2, 0.5], 'eta0': [0.01, 0.1]}).fit(X, y)
+        assert len(calls) == 5, "Data shared by candidates with another val_size"
+        n_train = int(200 * (1 - search.best_params_['val_size']))
+        assert search.best_estimator_.X_train_.shape[0] == n_train, \
+            "Candidate trained on data split for another"
+
+    def test_successive_halving_validation(self, get_gd_regressor):
+        X, y = make_regression(n_samples=50, n_features=2, random_state=5)
+        with pytest.raises(ValueError):
+            SuccessiveHalving(get_gd_regressor(epochs=27), {'epochs': [1, 2]}).fit(X, y)
+        with pytest.raises(ValueError):
+            SuccessiveHalving(get_gd_regressor(epochs=27).set_params(val_size=None), grid).fit(X, y)
+        with pytest.raises(TypeError):
+            SuccessiveHalving(get_gd_regressor(epochs=27), grid, factor=1.5).fit(X, y)
+
+    def test_hyperband(self, get_gd_regressor):
+        X, y = make_regression(n_samples=200, n_features=5, noise=10, random_state=5)
+        search = Hyperband(get_gd_regressor(epochs=27), grid, min_epochs=3, random_state=5).fit(X, y)
+        brackets = search.results_.groupby('Bracket')
+        assert list(brackets['Epochs'].min()) == [3, 9, 27], "Brackets incorrect"
+        assert list(brackets['Epochs'].max()) == [27, 27, 27], \
+            "Bracket winners not trained to max_epochs"
+        winners = search.results_[search.results_['Epochs'] == 27]
+        assert search.best_score_ == winners['val_score'].max(), \
+            "Best bracket winner not selected"
+        single = clone(get_gd_regressor(epochs=27)).set_params(**search.best_params_).fit(X, y)
+        assert np.array_equal(single.coef_, search.best_estimator_.coef_), \
+            "Resumed training differs from a single fit"
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : ML Studio                                                         #
+# Version : 0.1.14                                                            #
+# File    : test_model_validation.py                                          #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 11:52:17 am                      #
+# Last Modified : Sunday, October 18th 2026, 11:52:17 am                      #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests for leverage and influence diagnostics."""
+import numpy as np
+import pytest
+from pytest import mark
+
+from mlstudio.supervised.model.validation import Influence, leverage
+from mlstudio.supervised.model.validation import cooks_distance, dffits
+from mlstudio.supervised.model.validation import standardized_residuals
+# --------------------------------------------------------------------------  #
+def _data(n=200, p=5, seed=5):
+    rng = np.random.RandomState(seed)
+    X = np.column_stack([np.ones(n), rng.randn(n, p - 1)])
+    y = X.dot(rng.randn(p)) + rng.randn(n)
+    theta = np.linalg.lstsq(X, y, rcond=None)[0]
+    return X, y, X.dot(theta)
+
+def _hat_diagonal(X):
+    """Leverage computed from the explicit hat matrix."""
+    return np.diagonal(X.dot(np.linalg.pinv(X.T.dot(X))).dot(X.T))
+
+@mark.validation
+class InfluenceTests:
+
+    def test_leverage(self):
+        X, _, _ = _data()
+        assert np.allclose(leverage(X), _hat_diagonal(X)), "Leverage error"
+        assert np.isclose(leverage(X).sum(), X.shape[1]), "Leverage trace error"
+
+    def test_leverage_rank_deficient(self):
+        X, _, _ = _data()
+        X = np.column_stack([X, X[:, 1] + X[:, 2]])
+        influence = Influence(X)
+        assert influence.rank == X.shape[1] - 1, "Rank error"
+        assert np.allclose(influence.leverage, _hat_diagonal(X)), "Rank deficient leverage error"
+
+    def test_influence_measures(self):
+        X, y, y_pred = _data()
+        n, p = X.shape
+        h = _hat_diagonal(X)
+        e = y - y_pred
+        mse = e.dot(e) / (n - p)
+        r = e / np.sqrt(mse * (1 - h))
+        cooks = r**2 / p * h / (1 - h)
+        assert np.allclose(standardized_residuals(X, y, y_pred), r), "Standardized residuals error"
+        assert np.allclose(cooks_distance(X, y, y_pred), cooks), "Cook's distance error"
+        influence = Influence(X, y, y_pred)
+        t = influence.studentized_residuals
+        assert np.allclose(dffits(X, y, y_pred), t * np.sqrt(h / (1 - h))), "DFFITS error"
+        with pytest.raises(ValueError):
+            Influence(X).cooks_distance
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : MLStudio                                                          #
+# Version : 0.1.0                                                             #
+# File    : test_nested_cv.py                                                 #
+# Python  : 3.8.3                                                             #
+# --------------------------------------------------------------------------  #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/MLStudio                       #
+# --------------------------------------------------------------------------  #
+# Created       : Sunday, October 18th 2026, 8:40:12 pm                       #
+# Last Modified : Sunday, October 18th 2026, 8:40:12 pm                       #
+# Modified By   : John James (jjames@decisionscients.com)                     #
+# --------------------------------------------------------------------------  #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests nested cross-validation."""
+import os
+
+import numpy as np
+from pytest import mark
+from sklearn.datasets import make_regression
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import GridSearchCV, KFold
+
+from mlstudio.supervised.model.selection import NestedCV
+# --------------------------------------------------------------------------  #
+@mark.nested_cv
+class NestedCVTests:
+
+    def _nested_cv(self, **kwargs):
+        return NestedCV(Ridge(), {'alpha': [0.01, 1, 100, 1000]},
+                        outer_cv=KFold(n_splits=3, shuffle=True, random_state=5),
+                        inner_cv=KFold(n_splits=4, shuffle=True, random_state=5),
+                        **kwargs)
+
+    def test_nested_cv(self, tmp_path):
+        X, y = make_regression(n_samples=120, n_features=10, noise=50, random_state=5)
+        serial = self._nested_cv(n_jobs=1).fit(X, y)
+        parallel = self._nested_cv(n_jobs=2, temp_folder=str(tmp_path)).fit(X, y)
+        assert os.listdir(str(tmp_path)) == [], "Shared data not removed"
+        for key in ['test_score', 'train_score']:
+            assert np.allclose(serial.results_[key], parallel.results_[key]), \
+                "Parallel results differ"
+        assert serial.results_['best_params'] == parallel.results_['best_params']
+        # Each outer fold agrees with a grid search of its training set
+        outer = KFold(n_splits=3, shuffle=True, random_state=5)
+        for k, (train, test) in enumerate(outer.split(X, y)):
+            search = GridSearchCV(Ridge(), {'alpha': [0.01, 1, 100, 1000]},
+                                  cv=KFold(n_splits=4, shuffle=True, random_state=5))
+            search.fit(X[train], y[train])
+            assert serial.results_['best_params'][k] == search.best_params_, \
+                "Best parameters differ from those of a grid search"
+            assert np.isclose(serial.results_['test_score'][k], 
+                              search.score(X[test], y[test])), \
+                "Outer score differs from that of a grid search"
+        # The final model is selected by a search of all of the data
+        search = GridSearchCV(Ridge(), {'alpha': [0.01, 1, 100, 1000]},
+                              cv=KFold(n_splits=4, shuffle=True, random_state=5)).fit(X, y)
+        assert serial.best_params_ == search.best_params_, "Final parameters differ"
+        assert np.isclose(serial.best_score_, search.best_score_), "Final score differs"
+        assert np.allclose(serial.cv_results_['mean_test_score'], 
+                           search.cv_results_['mean_test_score']), "Search results differ"
+        assert np.allclose(serial.best_estimator_.coef_, search.best_estimator_.coef_), \
+            "Final model differs"
@@ -25,9 +25,11 @@ from pytest import mark
 import string
 
 from scipy import stats
+from scipy.sparse import csr_matrix
 
 from mlstudio.utils.data_analyzer import describe_categorical_array
 from mlstudio.utils.data_analyzer import describe_numeric_array
+from mlstudio.utils.data_analyzer import get_feature_info
 # --------------------------------------------------------------------------  #
 #                             TEST DESCRIBE                                   #
 # --------------------------------------------------------------------------  #
@@ -56,6 +58,20 @@ def test_describe_categorical_array():
     for c in columns:        
         assert d.get(c) is not None, "Describe categorical didn't return " + c
 
-
-
-
+# --------------------------------------------------------------------------  #
+#                             TEST FEATURE INFO                               #
+# --------------------------------------------------------------------------  #
+@mark.utils
+@mark.data_analysis
+@mark.feature_info
+def test_get_feature_info():
+    X = np.random.rand(100, 10)
+    d = get_feature_info(X)
+    assert d['size (Bytes)'] == X.nbytes, "Dense size error"
+    rows = np.arange(1000)
+    cols = np.random.randint(low=0, high=100000, size=1000)
+    X = csr_matrix((np.ones(1000), (rows, cols)), shape=(1000, 100000))
+    d = get_feature_info(X)
+    assert d['n_features'] == 100000, "Sparse n_features error"
+    assert d['size (Bytes)'] == X.data.nbytes + X.indices.nbytes + X.indptr.nbytes, \
+        "Sparse size error"
@@ -27,8 +27,9 @@ from scipy.sparse import csr_matrix
 from sklearn.datasets import make_classification
 
 from mlstudio.utils.data_manager import MinMaxScaler, DataSplitter, GradientScaler
-from mlstudio.utils.data_manager import DataShuffler
+from mlstudio.utils.data_manager import DataShuffler, BatchSampler, batch_iterator
 from mlstudio.utils.data_manager import AddBiasTerm, ZeroBiasTerm, unpack_parameters
+from mlstudio.utils.data_manager import linear_output, linear_gradient
 from mlstudio.utils.data_manager import LabelEncoder, OneHotLabelEncoder
 # --------------------------------------------------------------------------  #
 #                       TEST ADD BIAS TERM TRANSFORMER                        #
@@ -61,6 +62,32 @@ def test_add_bias_term_csr():
     X = xformer.inverse_transform(X)
     assert X.shape[1] == 5, "Bias term not removed."    
 
+@mark.utils
+@mark.data_manager
+@mark.add_bias_term
+def test_add_bias_term_dtype():
+    X = np.random.rand(5,5)
+    for data in [X, csr_matrix(X)]:
+        Xt = AddBiasTerm(dtype=np.float32).fit_transform(data)
+        assert Xt.dtype == np.float32, "Bias term dtype not applied"
+        Xt = AddBiasTerm().fit_transform(data.astype(np.float32))
+        assert Xt.dtype == np.float32, "Bias term did not retain dtype"
+
+@mark.utils
+@mark.data_manager
+@mark.add_bias_term
+def test_add_bias_term_implicit():
+    X = np.random.rand(20,5)
+    assert AddBiasTerm(implicit=True).fit_transform(X) is X, "Implicit bias copied X"
+    X_bias = AddBiasTerm().fit_transform(X)
+    for theta in [np.random.rand(6), np.random.rand(6, 3)]:
+        residual = np.random.rand(20, *theta.shape[1:])
+        for data in [X, csr_matrix(X)]:
+            assert np.allclose(linear_output(data, theta), X_bias.dot(theta)), \
+                "Implicit intercept output incorrect"
+            assert np.allclose(linear_gradient(data, theta, residual), 
+                               X_bias.T.dot(residual)), "Implicit intercept gradient incorrect"
+
 # --------------------------------------------------------------------------  #
 #                       TEST ZERO BIAS TERM TRANSFORMER                       #
 # --------------------------------------------------------------------------  #
@@ -204,6 +231,93 @@ def test_one_hot_label_encoder():
     
 
 
+# --------------------------------------------------------------------------  #
+#                           TEST DATA SHUFFLER                                #
+# --------------------------------------------------------------------------  #
+@mark.utils
+@mark.data_manager
+@mark.data_shuffler
+def test_data_shuffler():
+    X = np.arange(100).reshape(-1, 1) * np.ones((1, 4))
+    y = np.arange(100)
+    for data in [X, csr_matrix(X)]:
+        X_shuffled, y_shuffled = DataShuffler().fit_transform(data, y, random_state=5)
+        X_shuffled = X_shuffled.toarray() if hasattr(X_shuffled, 'toarray') else X_shuffled
+        assert not np.array_equal(y_shuffled, y), "Data not shuffled"
+        assert np.array_equal(X_shuffled[:, 0], y_shuffled), "X and y not aligned after shuffle"
+        X_again, _ = DataShuffler().fit_transform(data, y, random_state=5)
+        X_again = X_again.toarray() if hasattr(X_again, 'toarray') else X_again
+        assert np.array_equal(X_shuffled, X_again), "Shuffle not reproducible"
+
+@mark.utils
+@mark.data_manager
+@mark.data_shuffler
+def test_data_shuffler_in_place():
+    X = np.arange(100).reshape(-1, 1) * np.ones((1, 4))
+    y = np.arange(100)
+    X_copy, y_copy = DataShuffler().fit_transform(X, y, random_state=5)
+    X_in, y_in = X.copy(), y.copy()
+    X_out, y_out = DataShuffler(copy=False).fit_transform(X_in, y_in, random_state=5)
+    assert X_out is X_in and y_out is y_in, "In place shuffle returned new arrays"
+    assert np.array_equal(X_in[:, 0], y_in), "X and y not aligned after in place shuffle"
+    assert np.array_equal(X_in, X_copy), "In place and copying shuffles differ"
+    assert np.array_equal(y_in, y_copy), "In place and copying shuffles differ"
+    # Sparse matrices are shuffled into a copy
+    data = csr_matrix(X)
+    X_sparse, _ = DataShuffler(copy=False).fit_transform(data, y, random_state=5)
+    assert np.array_equal(data.toarray(), X), "Sparse input modified"
+    assert np.array_equal(X_sparse.toarray(), X_copy), "Sparse shuffle differs"
+
+# --------------------------------------------------------------------------  #
+#                           TEST BATCH SAMPLER                                #
+# --------------------------------------------------------------------------  #
+@mark.utils
+@mark.data_manager
+@mark.batch_sampler
+def test_batch_sampler():
+    X = np.arange(100).reshape(-1, 1) * np.ones((1, 3))
+    y = np.arange(100)
+    # Unshuffled batches are views in the original order
+    batches = list(batch_iterator(X, y, batch_size=32))
+    assert [len(b[1]) for b in batches] == [32, 32, 32, 4], "Batch sizes incorrect"
+    assert all(np.shares_memory(b[0], X) for b in batches), "Unshuffled batches copied X"
+    # Shuffled epochs cover every row once, differ, and are reproducible
+    sampler = BatchSampler(random_state=5)
+    epochs = [np.concatenate([yb for _, yb in sampler.batches(X, y, 32)]) for _ in range(2)]
+    assert all(np.array_equal(np.sort(e), y) for e in epochs), "Rows not covered once per epoch"
+    assert not np.array_equal(epochs[0], epochs[1]), "Epochs not reshuffled"
+    sampler.reset()
+    again = np.concatenate([yb for _, yb in sampler.batches(X, y, 32)])
+    assert np.array_equal(again, epochs[0]), "Shuffle not reproducible"
+    for Xb, yb in BatchSampler(random_state=5).batches(X, y, 32):
+        assert np.array_equal(Xb[:, 0], yb), "X and y not aligned"
+    # Buffered batches reuse one buffer and match unbuffered batches
+    buffered = BatchSampler(random_state=5, buffered=True)
+    ids = set()
+    for (Xb, yb), (Xu, yu) in zip(buffered.batches(X, y, 32), 
+                                  BatchSampler(random_state=5).batches(X, y, 32)):
+        assert np.array_equal(Xb, Xu) and np.array_equal(yb, yu), "Buffered batch error"
+        ids.add(Xb.__array_interface__['data'][0])
+    assert len(ids) == 1, "Buffer not reused"
+    # Drop last
+    sizes = [len(yb) for _, yb in BatchSampler(drop_last=True).batches(X, y, 32)]
+    assert sizes == [32, 32, 32], "Last batch not dropped"
+
+@mark.utils
+@mark.data_manager
+@mark.batch_sampler
+def test_batch_sampler_stratified():
+    y = np.array([0] * 80 + [1] * 20)
+    X = np.arange(100).reshape(-1, 1)
+    sampler = BatchSampler(stratify=True, random_state=5)
+    for _, yb in sampler.batches(X, y, 10):
+        assert np.sum(yb) == 2, "Batches not stratified"
+    y_one_hot = np.eye(2)[y]
+    for _, yb in sampler.batches(X, y_one_hot, 20):
+        assert np.sum(yb[:, 1]) == 4, "One-hot batches not stratified"
+    with pytest.raises(ValueError):
+        list(sampler.batches(X, None, 10))
+
 # --------------------------------------------------------------------------  #
 #                        TEST UNPACK PARAMETERS                               #
 # --------------------------------------------------------------------------  #  